@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from datetime import date, timedelta, datetime, timezone
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
 from app.schemas.admin_analytics import AdminRealtimeDashboardResponse, GameAnalyticsResponse, TenantOverviewResponse
 from app.services.admin_analytics_service import (
@@ -34,7 +34,7 @@ def admin_only(current_user):
     response_model=List[GameAnalyticsResponse]
 )
 def list_games_analytics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -47,7 +47,7 @@ def list_games_analytics(
 )
 def games_analytics_by_range(
     range: str = "7d",
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -79,7 +79,7 @@ def games_analytics_by_range(
 def games_analytics_custom_range(
     start_date: date,
     end_date: date,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -100,7 +100,7 @@ def games_analytics_custom_range(
 )
 def single_game_analytics(
     game_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -125,7 +125,7 @@ def single_game_analytics(
     response_model=TenantOverviewResponse
 )
 def get_tenant_overview(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -134,7 +134,7 @@ def get_tenant_overview(
 @router.get("/live-dashboard", response_model=AdminRealtimeDashboardResponse)
 def get_live_metrics(
     country_code: str = None,  
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -148,7 +148,7 @@ def get_live_metrics(
 
 @router.get("/operating-countries")
 def get_tenant_operating_countries(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_user)
 ):
     from app.models.tenant_country import TenantCountry
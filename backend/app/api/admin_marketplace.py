@@ -1,17 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.core.database import get_db
+from app.core.http_cache import cached_json_response
 from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.admin_marketplace import MarketplaceGameResponse, AddGameRequest, RequestAccessPayload
 from app.services.admin_marketplace_service import (
-    get_marketplace_catalog, 
     add_game_to_library,
     request_provider_access,
     get_tenant_requests
 )
+from app.services.game_catalog_service import get_marketplace_catalog_body
 
 router = APIRouter(
     prefix="/tenant/marketplace",
@@ -23,9 +24,13 @@ def tenant_admin_only(user: User):
         raise HTTPException(status_code=403, detail="Tenant Admin access required")
 
 @router.get("", response_model=List[MarketplaceGameResponse])
-def get_catalog(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_catalog(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     tenant_admin_only(current_user)
-    return get_marketplace_catalog(db, current_user.tenant_id)
+    # Loaded from the primary: a lagging replica read would be cached past the invalidation
+    return cached_json_response(
+        request,
+        get_marketplace_catalog_body(db, current_user.tenant_id)
+    )
 
 @router.post("/add")
 def add_game(
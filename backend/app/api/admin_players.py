@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.admin.player_summary import PlayerSummaryResponse
@@ -28,7 +28,7 @@ router = APIRouter(
 
 @router.get("", response_model=list[AdminPlayerListResponse])
 def list_all_players(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     admin_only(db, current_user)
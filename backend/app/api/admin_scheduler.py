@@ -1,6 +1,13 @@
+from datetime import datetime, timedelta, timezone
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
 from app.core.security import get_current_user
 from app.core.scheduler import get_scheduler
+from app.services.snapshot_job_service import get_snapshot_job_summary
 
 router = APIRouter(
     prefix="/admin/analytics/scheduler",
@@ -14,16 +21,28 @@ def admin_only(user):
 
 
 @router.get("/health")
-def scheduler_health(current_user=Depends(get_current_user)):
+def scheduler_health(
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
     admin_only(current_user)
 
     scheduler = get_scheduler()
 
+    #  Snapshot jobs in the catch-up window (own tenant for tenant admins)
+    since = datetime.now(timezone.utc).date() - timedelta(days=settings.SNAPSHOT_CATCHUP_DAYS)
+    snapshot_jobs = get_snapshot_job_summary(
+        db,
+        since=since,
+        tenant_id=current_user.tenant_id if current_user.role_id == 2 else None
+    )
+
     if not scheduler:
         return {
             "scheduler_running": False,
             "reason": "Scheduler not initialized",
-            "jobs": []
+            "jobs": [],
+            "snapshot_jobs": snapshot_jobs
         }
 
     return {
@@ -35,5 +54,6 @@ def scheduler_health(current_user=Depends(get_current_user)):
                 "next_run_time": job.next_run_time
             }
             for job in scheduler.get_jobs()
-        ]
+        ],
+        "snapshot_jobs": snapshot_jobs
     }
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import date 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
 from app.schemas.admin_timeseries import GameTimeSeriesResponse
 from app.services.admin_timeseries_service import (
@@ -35,7 +35,7 @@ def games_timeseries(
     range: int | None = Query(None, ge=1, le=365),
     start_date: date | None = None,
     end_date: date | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -74,7 +74,7 @@ def single_game_timeseries(
     range: int | None = Query(None, ge=1, le=365),
     start_date: date | None = None,
     end_date: date | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     admin_only(current_user)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
 from app.schemas.wallet import AdminWithdrawalActionRequest
 from app.services.admin_withdrawal_service import (
@@ -41,7 +41,7 @@ def process_withdrawal(
 @router.get("")
 def list_withdrawals(
     status: str = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_user)
 ):
     #  Role enforcement: role_id 2 = TENANT_ADMIN, 4 = SUPER_ADMIN
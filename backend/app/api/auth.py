@@ -27,20 +27,21 @@ def login(data: LoginRequest, db: Session = Depends(get_db)):
 @router.get("/lookup-tenants")
 def lookup_tenants_by_email(email: str, db: Session = Depends(get_db)):
     from app.models.user import User
-    from app.models.tenant import Tenant
+    from app.core.tenant_registry import find_tenant_by_id
 
     # Find all tenants where this email is registered
-    results = (
-        db.query(Tenant.tenant_name, Tenant.domain)
-        .join(User, User.tenant_id == Tenant.tenant_id)
+    tenant_ids = (
+        db.query(User.tenant_id)
         .filter(User.email == email)
         .all()
     )
 
-    if not results:
+    if not tenant_ids:
         return []
 
+    tenants = [find_tenant_by_id(db, r.tenant_id) for r in tenant_ids]
     return [
-        {"tenant_name": r.tenant_name, "domain": r.domain} 
-        for r in results
+        {"tenant_name": t.tenant_name, "domain": t.domain}
+        for t in tenants
+        if t is not None
     ]
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.database import get_async_db
+from app.core.security import get_current_user_async
 from app.models.user import User
-from app.services.coin_toss_service import play_coin_toss_round
-from app.schemas.coin_toss import CoinTossBetRequest
+from app.services.coin_toss_service import play_coin_toss_round, play_coin_toss_batch
+from app.schemas.coin_toss import (
+    CoinTossBetRequest,
+    CoinTossBatchRequest,
+    CoinTossBatchResponse
+)
 
 router = APIRouter(
     prefix="/games/coin-toss",
@@ -18,10 +22,10 @@ router = APIRouter(
     summary="Play Coin Toss",
     description="Places a HEAD / TAIL bet for an enabled tenant game"
 )
-def play_round(
+async def play_round(
     data: CoinTossBetRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     if not current_user.tenant_id:
         raise HTTPException(
@@ -29,11 +33,39 @@ def play_round(
             detail="Tenant not resolved for current user"
         )
 
-    return play_coin_toss_round(
-        db=db,
+    return await db.run_sync(
+        play_coin_toss_round,
         player_id=current_user.user_id,
         tenant_id=current_user.tenant_id,
         game_id=data.game_id,
         choice=data.choice,
         amount=data.bet_amount
     )
+
+
+@router.post(
+    "/play-batch",
+    response_model=CoinTossBatchResponse,
+    summary="Autoplay Coin Toss",
+    description="Plays up to N HEAD / TAIL rounds in one transaction, stopping early on a limit breach or insufficient balance"
+)
+async def play_batch(
+    data: CoinTossBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Tenant not resolved for current user"
+        )
+
+    return await db.run_sync(
+        play_coin_toss_batch,
+        player_id=current_user.user_id,
+        tenant_id=current_user.tenant_id,
+        game_id=data.game_id,
+        choice=data.choice,
+        amount=data.bet_amount,
+        rounds=data.rounds
+    )
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.database import get_async_db
+from app.core.security import get_current_user_async
 from app.models.user import User
 from app.services.game_session_service import (
     start_game_session,
@@ -23,10 +23,10 @@ router = APIRouter(
     summary="Start Game Session",
     description="Starts a game session only if the game is enabled for the tenant"
 )
-def start_session(
+async def start_session(
     game_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     if not current_user.tenant_id:
         raise HTTPException(
@@ -34,8 +34,8 @@ def start_session(
             detail="Tenant not resolved for current user"
         )
 
-    return start_game_session(
-        db=db,
+    return await db.run_sync(
+        start_game_session,
         player_id=current_user.user_id,
         tenant_id=current_user.tenant_id,
         game_id=game_id
@@ -48,13 +48,13 @@ def start_session(
     summary="End Game Session",
     description="Ends an active game session for the current player"
 )
-def end_session(
+async def end_session(
     session_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
-    return end_game_session(
-        db=db,
+    return await db.run_sync(
+        end_game_session,
         player_id=current_user.user_id,
         session_id=session_id
     )
@@ -1,12 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from decimal import Decimal
 
-from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.database import get_async_db
+from app.core.security import get_current_user_async
 from app.models.user import User
-from app.schemas.games.dice import DiceBetRequest, DiceBetResponse
-from app.services.games.dice_service import place_dice_bet
+from app.schemas.games.dice import (
+    DiceBetRequest,
+    DiceBetResponse,
+    DiceBatchBetRequest,
+    DiceBatchBetResponse
+)
+from app.services.games.dice_service import place_dice_bet, place_dice_bet_batch
 
 router = APIRouter(
     prefix="/games/dice",
@@ -20,10 +25,10 @@ router = APIRouter(
     summary="Place Dice Bet",
     description="Places an EVEN / ODD dice bet for an enabled tenant game"
 )
-def dice_bet(
+async def dice_bet(
     data: DiceBetRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     if not current_user.tenant_id:
         raise HTTPException(
@@ -31,11 +36,39 @@ def dice_bet(
             detail="Tenant not resolved for current user"
         )
 
-    return place_dice_bet(
-        db=db,
+    return await db.run_sync(
+        place_dice_bet,
         player_id=current_user.user_id,
         tenant_id=current_user.tenant_id,
         game_id=data.game_id,
         bet_choice=data.bet_choice,
         amount=Decimal(str(data.amount))
     )
+
+
+@router.post(
+    "/bet-batch",
+    response_model=DiceBatchBetResponse,
+    summary="Autoplay Dice Bets",
+    description="Places up to N EVEN / ODD dice bets in one transaction, stopping early on a limit breach or insufficient balance"
+)
+async def dice_bet_batch(
+    data: DiceBatchBetRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Tenant not resolved for current user"
+        )
+
+    return await db.run_sync(
+        place_dice_bet_batch,
+        player_id=current_user.user_id,
+        tenant_id=current_user.tenant_id,
+        game_id=data.game_id,
+        bet_choice=data.bet_choice,
+        amount=Decimal(str(data.amount)),
+        rounds=data.rounds
+    )
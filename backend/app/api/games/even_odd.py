@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.database import get_async_db
+from app.core.security import get_current_user_async
 from app.models.user import User
-from app.services.games.even_odd_service import play_even_odd_round
+from app.services.games.even_odd_service import play_even_odd_round, play_even_odd_batch
 from app.schemas.games.even_odd import (
     PlayRoundRequest,
-    PlayRoundResponse
+    PlayRoundResponse,
+    PlayBatchRequest,
+    PlayBatchResponse
 )
 
 router = APIRouter(
@@ -22,10 +24,10 @@ router = APIRouter(
     summary="Play Even–Odd Dice Game",
     description="Places a bet on EVEN or ODD for the selected game session"
 )
-def play_round(
+async def play_round(
     data: PlayRoundRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """
     Flow:
@@ -42,11 +44,39 @@ def play_round(
             detail="Tenant not resolved for current user"
         )
 
-    return play_even_odd_round(
-        db=db,
+    return await db.run_sync(
+        play_even_odd_round,
         player_id=current_user.user_id,
         tenant_id=current_user.tenant_id,
         game_id=data.game_id,
         bet_choice=data.bet_choice,
         amount=data.amount
     )
+
+
+@router.post(
+    "/play-batch",
+    response_model=PlayBatchResponse,
+    summary="Autoplay Even–Odd Dice Game",
+    description="Plays up to N EVEN / ODD rounds in one transaction, stopping early on a limit breach or insufficient balance"
+)
+async def play_batch(
+    data: PlayBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Tenant not resolved for current user"
+        )
+
+    return await db.run_sync(
+        play_even_odd_batch,
+        player_id=current_user.user_id,
+        tenant_id=current_user.tenant_id,
+        game_id=data.game_id,
+        bet_choice=data.bet_choice,
+        amount=data.amount,
+        rounds=data.rounds
+    )
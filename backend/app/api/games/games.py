@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.database import get_db
+from app.core.http_cache import cached_json_response
 from app.core.security import get_current_user
-from app.models.game import Game
-from app.models.game_category import GameCategory
-from app.models.tenant_game import TenantGame
 from app.schemas.games.game import GameListResponse
-from app.schemas.game_eligibility import GameEligibilityResponse
-from app.services.game_eligibility_service import check_game_eligibility
+from app.schemas.game_eligibility import GameEligibilityResponse, LobbyEligibilityItem
+from app.services.game_eligibility_service import (
+    check_game_eligibility,
+    check_lobby_eligibility
+)
+from app.services.game_catalog_service import get_lobby_catalog
 from app.models.user import User
 
 router = APIRouter(
@@ -20,42 +22,25 @@ router = APIRouter(
 #  LIST GAMES (TENANT ENABLED)
 @router.get("", response_model=list[GameListResponse])
 def list_games(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    rows = (
-        db.query(Game, GameCategory, TenantGame)
-        .join(TenantGame, TenantGame.game_id == Game.game_id)
-        .join(GameCategory, Game.category_id == GameCategory.category_id)
-        .filter(
-            TenantGame.tenant_id == current_user.tenant_id,
-            TenantGame.is_active.is_(True),
-            Game.is_active.is_(True)
-        )
-        .order_by(Game.created_at.desc())
-        .all()
-    )
+    catalog = get_lobby_catalog(db, current_user.tenant_id)
+    return cached_json_response(request, catalog.cached)
 
-    return [
-        {
-            "game_id": game.game_id,
-            "game_name": game.game_name,
-            "game_code": game.game_code,
-            "category": category.category_name if category else None,
-            "min_bet": float(
-                tenant_game.min_bet_override
-                if tenant_game.min_bet_override is not None
-                else game.min_bet
-            ),
-            "max_bet": float(
-                tenant_game.max_bet_override
-                if tenant_game.max_bet_override is not None
-                else game.max_bet
-            ),
-            "is_active": tenant_game.is_active
-        }
-        for game, category, tenant_game in rows
-    ]
+
+#  LOBBY ELIGIBILITY (ALL TENANT GAMES, ONE CALL)
+@router.get("/eligibility", response_model=list[LobbyEligibilityItem])
+def lobby_eligibility(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return check_lobby_eligibility(
+        db=db,
+        player_id=current_user.user_id,
+        tenant_id=current_user.tenant_id
+    )
 
 
 #  GAME ELIGIBILITY (TENANT SAFE)
@@ -80,41 +65,12 @@ def get_game_by_id(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    result = (
-        db.query(Game, GameCategory, TenantGame)
-        .join(TenantGame, TenantGame.game_id == Game.game_id)
-        .join(GameCategory, Game.category_id == GameCategory.category_id)
-        .filter(
-            TenantGame.tenant_id == current_user.tenant_id,
-            TenantGame.is_active.is_(True),
-            Game.is_active.is_(True),
-            Game.game_id == game_id
-        )
-        .first()
-    )
+    game = get_lobby_catalog(db, current_user.tenant_id).by_id.get(str(game_id))
 
-    if not result:
+    if not game:
         raise HTTPException(
             status_code=404,
             detail="Game not available for this tenant"
         )
 
-    game, category, tenant_game = result
-
-    return {
-        "game_id": game.game_id,
-        "game_name": game.game_name,
-        "game_code": game.game_code,
-        "category": category.category_name if category else None,
-        "min_bet": float(
-            tenant_game.min_bet_override
-            if tenant_game.min_bet_override is not None
-            else game.min_bet
-        ),
-        "max_bet": float(
-            tenant_game.max_bet_override
-            if tenant_game.max_bet_override is not None
-            else game.max_bet
-        ),
-        "is_active": tenant_game.is_active
-    }
+    return game
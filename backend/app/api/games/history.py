@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
+from app.core.pagination import NEXT_CURSOR_HEADER, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.services.games.history_service import (
     get_player_sessions,
     get_session_rounds,
@@ -22,19 +23,29 @@ router = APIRouter(
     response_model=list[GameSessionHistoryResponse]
 )
 def get_my_sessions(
-    db: Session = Depends(get_db),
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
-    return get_player_sessions(
+    page = get_player_sessions(
         db=db,
-        player_id=current_user.user_id
+        player_id=current_user.user_id,
+        cursor=cursor,
+        limit=limit
     )
 
+    if page["next_cursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+
+    return page["items"]
+
 
 @router.get("/sessions/{session_id}")
 def session_rounds(
     session_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_user)
 ):
     return get_session_rounds(db, session_id, current_user.user_id)
@@ -43,7 +54,7 @@ def session_rounds(
 @router.get("/sessions/{session_id}/bets")
 def session_bets(
     session_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_user)
 ):
     return get_session_bets(db, session_id, current_user.user_id)
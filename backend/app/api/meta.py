@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.core.database import get_db
+from app.core.security import get_current_user
+from app.core.reference_data import invalidate_reference_data, load_reference_data
 from app.schemas.meta import (
     CountryMeta,
     CurrencyMeta,
@@ -40,3 +42,25 @@ def meta_game_categories(db: Session = Depends(get_db)):
 @router.get("/roles", response_model=List[RoleMeta])
 def meta_roles(db: Session = Depends(get_db)):
     return get_roles(db)
+
+
+@router.post("/cache/refresh")
+def meta_cache_refresh(
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    # role_id 4 = SUPER_ADMIN
+    if current_user.role_id != 4:
+        raise HTTPException(status_code=403, detail="Super admin access required")
+
+    invalidate_reference_data()
+    data = load_reference_data(db)
+
+    return {
+        "transaction_types": len(data.transaction_types),
+        "wallet_types": len(data.wallet_types),
+        "roles": len(data.roles),
+        "currencies": len(data.currencies),
+        "countries": len(data.countries),
+        "game_categories": len(data.game_categories)
+    }
@@ -11,34 +11,14 @@ from app.models.tenant_country import TenantCountry
 from app.models.currency import Currency
 from app.schemas.bonus import BonusUsageResponse
 from typing import List
-from app.models.wallet import Wallet
 
 router = APIRouter(prefix="/bonuses", tags=["Player Bonuses"])
 
 @router.get("/my-progress", response_model=List[BonusUsageResponse])
 def my_bonuses(db: Session = Depends(get_db), user = Depends(get_current_user)):
-    
-    now = datetime.now(timezone.utc)
 
-    
-    expired_items = db.query(BonusUsage).filter(
-        BonusUsage.player_id == user.user_id,
-        BonusUsage.status == 'active',
-        BonusUsage.expired_at < now
-    ).all()
-
-    for item in expired_items:
-        item.status = 'expired'
-      
-        bonus_wallet = db.query(Wallet).filter(Wallet.wallet_id == item.wallet_id).first()
-        if bonus_wallet:
-            bonus_wallet.balance -= item.bonus_amount
-    
-    if expired_items:
-        db.commit()
-
-   
-    bonus_service.cleanup_expired_bonuses(db, user.user_id)
+    # Expire anything the scheduled sweep has not reached yet
+    bonus_service.expire_overdue_bonuses(db, user.user_id)
 
     #  FETCH DATA
     results = db.query(
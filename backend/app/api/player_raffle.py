@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
 from app.core.security import get_current_user
+from app.core.pagination import NEXT_CURSOR_HEADER, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.schemas.raffle_jackpot import JackpotResponse, JackpotJoinResponse
 from app.services.raffle_service import get_available_jackpots_for_player, join_jackpot_logic
 from app.models.wallet import Wallet
@@ -11,10 +12,17 @@ from app.models.wallet_type import WalletType
 router = APIRouter(prefix="/raffle", tags=["Player - Jackpot Raffle"])
 
 @router.get("/available", response_model=List[JackpotResponse])
-def list_available_jackpots(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+def list_available_jackpots(
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
     """
-    Fetches all jackpots (Active and Completed) matching the player's 
-    current CASH wallet currency.
+    Fetches jackpots matching the player's current CASH wallet currency:
+    every Active one first, then a page of Completed ones. Pass the
+    X-Next-Cursor header back as ?cursor= for more completed jackpots.
     """
     # 1. Find player's primary cash wallet to determine their currency
     wallet = db.query(Wallet).join(WalletType).filter(
@@ -27,13 +35,20 @@ def list_available_jackpots(db: Session = Depends(get_db), current_user = Depend
         return []
         
     # 2. Call the service which now returns both 'active' and 'completed' jackpots
-    return get_available_jackpots_for_player(
+    page = get_available_jackpots_for_player(
         db, 
         current_user.tenant_id, 
         current_user.user_id, 
-        wallet.currency_id
+        wallet.currency_id,
+        cursor=cursor,
+        limit=limit
     )
 
+    if page["next_cursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+
+    return page["items"]
+
 @router.post("/{jackpot_id}/join", response_model=JackpotJoinResponse)
 def player_join_jackpot(jackpot_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
     """
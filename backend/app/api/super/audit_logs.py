@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.super.super_audit_log import AuditLogResponse
@@ -26,7 +26,7 @@ def super_admin_only(user: User):
 def list_audit_logs(
     limit: int = Query(50, ge=1, le=200),
     tenant_id=None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     super_admin_only(current_user)
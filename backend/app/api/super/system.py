@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.core.database import get_pool_stats
+from app.core.password_hashing import hash_metrics
+from app.core.security import get_current_user
+from app.models.user import User
+
+router = APIRouter(
+    prefix="/super/system",
+    tags=["Super Admin - System"]
+)
+
+
+def super_admin_only(user: User):
+    if user.role_id != 4:
+        raise HTTPException(403, "Super admin access required")
+
+
+@router.get("/db-pool")
+def db_pool_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Connection pool and request session stats for this worker process.
+    """
+    super_admin_only(current_user)
+
+    return get_pool_stats()
+
+
+@router.get("/password-hashing")
+def password_hashing_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    bcrypt pool queue, rejection and timing stats for this worker process.
+    """
+    super_admin_only(current_user)
+
+    return hash_metrics.snapshot()
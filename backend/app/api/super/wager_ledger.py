@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from uuid import UUID
+from datetime import date, datetime, timezone
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.services.responsible_gaming_service import (
+    rebuild_wager_ledger,
+    check_wager_ledger
+)
+
+router = APIRouter(
+    prefix="/super/responsible-gaming/ledger",
+    tags=["Super Admin - Wager Ledger"]
+)
+
+
+def super_admin_only(user: User):
+    if user.role_id != 4:
+        raise HTTPException(403, "Super admin access required")
+
+
+@router.post("/rebuild")
+def rebuild_ledger(
+    since: date | None = None,
+    player_id: UUID | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Rebuilds player wager totals from the bets table.
+    Defaults to the current UTC month.
+    """
+    super_admin_only(current_user)
+
+    return rebuild_wager_ledger(
+        db,
+        since=since or datetime.now(timezone.utc).date(),
+        player_id=player_id
+    )
+
+
+@router.get("/check")
+def check_ledger(
+    since: date | None = None,
+    player_id: UUID | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Reports ledger rows that disagree with the bets table.
+    Defaults to the current UTC month.
+    """
+    super_admin_only(current_user)
+
+    return check_wager_ledger(
+        db,
+        since=since or datetime.now(timezone.utc).date(),
+        player_id=player_id
+    )
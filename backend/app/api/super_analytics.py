@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from datetime import date 
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
 from app.services.super_analytics_service import (
     get_platform_overview,
@@ -34,7 +34,7 @@ def platform_overview(
     range: int | None = Query(None, ge=1, le=365),
     start_date: date | None = None,
     end_date: date | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     """
@@ -53,7 +53,7 @@ def platform_overview(
 
 @router.get("/tenants", response_model=list[SuperTenantAnalyticsResponse])
 def tenants_analytics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     """
@@ -65,7 +65,7 @@ def tenants_analytics(
 
 @router.get("/games", response_model=list[SuperGameAnalyticsResponse])
 def games_analytics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     """
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from datetime import date 
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
 from app.schemas.super_timeseries import SuperTimeSeriesResponse
 from app.services.super_timeseries_service import get_platform_timeseries
@@ -28,7 +28,7 @@ def platform_timeseries(
     range: int = Query(None, ge=1, le=365),
     start_date: date | None = None,
     end_date: date | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     """
@@ -10,9 +10,8 @@ from app.services.tenant_service import (
     get_tenant_by_domain
 )
 
-from app.models.tenant import Tenant
-from app.models.tenant_country import TenantCountry
-from app.models.country import Country
+from app.core.reference_data import get_reference_data
+from app.core.tenant_registry import find_tenant_by_domain
 
 router = APIRouter(
     prefix="/tenants",
@@ -37,35 +36,18 @@ def get_tenant_domain(domain: str, db: Session = Depends(get_db)):
 # 4️ Get countries supported by tenant (IMPORTANT)
 @router.get("/by-domain/{domain}/countries")
 def get_tenant_countries(domain: str, db: Session = Depends(get_db)):
-    tenant = (
-        db.query(Tenant)
-        .filter(
-            Tenant.domain == domain,
-            Tenant.status == "active"
-        )
-        .first()
-    )
+    tenant = find_tenant_by_domain(db, domain)
 
-    if not tenant:
+    if not tenant or tenant.status != "active":
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    rows = (
-        db.query(
-            TenantCountry.country_code,
-            Country.country_name
-        )
-        .join(Country, Country.country_code == TenantCountry.country_code)
-        .filter(
-            TenantCountry.tenant_id == tenant.tenant_id,
-            TenantCountry.is_active.is_(True)
-        )
-        .all()
-    )
+    countries = get_reference_data(db).countries
 
     return [
         {
-            "country_code": r.country_code,
-            "country_name": r.country_name
+            "country_code": c.country_code,
+            "country_name": countries[c.country_code].country_name
         }
-        for r in rows
+        for c in tenant.countries.values()
+        if c.is_active and c.country_code in countries
     ]
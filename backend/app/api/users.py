@@ -2,7 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.security import get_current_user,verify_password, get_password_hash
+from app.core.security import (
+    get_current_user_record,
+    verify_password,
+    get_password_hash,
+    create_access_token,
+    invalidate_user_state
+)
 from app.models.user import User
 from app.models.player import Player
 from app.models.role import Role
@@ -20,7 +26,7 @@ router = APIRouter(
 @router.get("/me", response_model=MeResponse)
 def get_me(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_record)
 ):
     role = db.query(Role).filter(Role.role_id == current_user.role_id).first()
     tenant = db.query(Tenant).filter(Tenant.tenant_id == current_user.tenant_id).first()
@@ -100,7 +106,7 @@ def get_me(
 def update_me(
     data: UserUpdate, 
     db: Session = Depends(get_db), 
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user_record)
 ):
     if data.first_name is not None:
         current_user.first_name = data.first_name
@@ -113,9 +119,22 @@ def update_me(
 
 
 @router.patch("/me/password")
-def change_password(data: PasswordUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+def change_password(data: PasswordUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_user_record)):
     if not verify_password(data.current_password, current_user.password_hash):
         raise HTTPException(status_code=400, detail="Current password incorrect")
     current_user.password_hash = get_password_hash(data.new_password)
+
+    # Revoke tokens issued before the change and hand back a fresh one
+    current_user.token_version = current_user.token_version + 1
     db.commit()
-    return {"message": "Password updated successfully"}
\ No newline at end of file
+    invalidate_user_state(current_user.user_id)
+
+    return {
+        "message": "Password updated successfully",
+        "access_token": create_access_token({
+            "sub": str(current_user.user_id),
+            "tenant_id": str(current_user.tenant_id),
+            "role_id": current_user.role_id,
+            "ver": current_user.token_version
+        })
+    }
\ No newline at end of file
@@ -1,10 +1,12 @@
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db, get_async_db
 from app.models.wallet import Wallet
 from app.models.wallet_type import WalletType
-from app.core.security import get_current_user
+from app.core.security import get_current_user, get_current_user_async
+from app.core.pagination import NEXT_CURSOR_HEADER, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.models.user import User
 
 from app.schemas.wallet import DepositRequest, WithdrawRequest
@@ -40,25 +42,25 @@ def get_wallets(
     ]
 
 @router.post("/deposit")
-def deposit(
+async def deposit(
     data: DepositRequest,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
 ):
-    return deposit_to_wallet(
-        db=db,
+    return await db.run_sync(
+        deposit_to_wallet,
         player_id=current_user.user_id,
         amount=data.amount
     )
 
 @router.post("/withdraw", summary="Withdraw from wallet")
-def withdraw(
+async def withdraw(
     data: WithdrawRequest,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)
 ):
-    return withdraw_from_wallet(
-        db=db,
+    return await db.run_sync(
+        withdraw_from_wallet,
         player_id=current_user.user_id,
         tenant_id=current_user.tenant_id,
         amount=data.amount
@@ -66,21 +68,35 @@ def withdraw(
 
 @router.get("/transactions/me")
 def get_my_transactions(
+    response: Response,
     specific_date: date = None, 
     days: int = None, 
     txn_type: str = None,
+    start_date: date = None,
+    end_date: date = None,
+    cursor: str = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    # specific_date is a 'date' object (naive), which is correct for YYYY-MM-DD filtering
-    return get_player_transactions(
+    # Dates are UTC days; pass the X-Next-Cursor header back as ?cursor= for the next page
+    page = get_player_transactions(
         db, 
         player_id=current_user.user_id,
         specific_date=specific_date, 
         days=days, 
-        txn_type=txn_type
+        txn_type=txn_type,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        limit=limit
     )
 
+    if page["next_cursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+
+    return page["items"]
+
 @router.get("/withdrawals/me")
 def get_my_withdrawals(
     db: Session = Depends(get_db),
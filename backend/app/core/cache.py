@@ -0,0 +1,80 @@
+import time
+from threading import Lock
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with per-entry expiry.
+    Each worker process keeps its own copy, so the TTL bounds how stale an
+    entry can get on workers that did not see the invalidating write.
+    get_or_load() is single-flight: concurrent misses on the same key wait
+    for one loader instead of all running it.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = Lock()
+        self._loading = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self.invalidate(key)
+            return None
+
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._evict_expired()
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+        return value
+
+    def get_or_load(self, key, loader):
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, Lock())
+
+        with key_lock:
+            # Another caller may have loaded it while we waited
+            value = self.get(key)
+            if value is None:
+                try:
+                    value = self.set(key, loader())
+                finally:
+                    with self._lock:
+                        self._loading.pop(key, None)
+
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[key]
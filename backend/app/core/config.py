@@ -1,3 +1,6 @@
+import os
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -9,11 +12,84 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: int
     DB_NAME: str
+    DB_SSLMODE: str = "require"
+
+    # Connection pool (per worker process)
+    DB_POOL_SIZE: int = Field(5, ge=1)
+    DB_MAX_OVERFLOW: int = Field(10, ge=0)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(30, gt=0)
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Server-side statement_timeout for every connection, 0 disables it
+    DB_STATEMENT_TIMEOUT_MS: int = Field(0, ge=0)
+
+    # Optional read replica for analytics, history and listing endpoints.
+    # Reads fall back to the primary while the replica is unreachable or
+    # more than DB_READ_MAX_LAG_SECONDS behind.
+    DB_READ_HOST: str | None = None
+    DB_READ_PORT: int | None = None
+    DB_READ_MAX_LAG_SECONDS: float = Field(30, ge=0)
+    DB_READ_LAG_CHECK_SECONDS: float = Field(5, gt=0)
 
     CLOUDINARY_CLOUD_NAME: str
     CLOUDINARY_API_KEY: str
     CLOUDINARY_API_SECRET: str
 
+    # Analytics snapshot scheduler
+    SNAPSHOT_WORKERS: int = 4
+    SNAPSHOT_CATCHUP_DAYS: int = 7
+
+    # Hourly analytics rollup
+    HOURLY_ROLLUP_INTERVAL_MINUTES: int = 5
+    HOURLY_ROLLUP_RETENTION_DAYS: int = 35
+
+    # Bonus expiry sweep
+    BONUS_EXPIRY_INTERVAL_MINUTES: int = 5
+
+    # Automatic draws of due TIME_BASED / THRESHOLD jackpots
+    RAFFLE_AUTO_DRAW_INTERVAL_MINUTES: int = 1
+
+    # Monthly partitions of bets / game_rounds / wallet_transactions.
+    # Partitions older than PARTITION_ARCHIVE_AFTER_MONTHS are dumped to
+    # PARTITION_ARCHIVE_DIR as .csv.gz and dropped (0 keeps everything).
+    # The directory must be absolute so every worker archives to the same
+    # place whatever its working directory.
+    PARTITION_PREMAKE_MONTHS: int = Field(3, ge=1)
+    PARTITION_ARCHIVE_AFTER_MONTHS: int = Field(0, ge=0)
+    PARTITION_ARCHIVE_DIR: str = "/var/lib/casino/partition-archive"
+
+    # Password hashing (bcrypt on a process pool, per API process)
+    PASSWORD_BCRYPT_ROUNDS: int = Field(12, ge=4, le=31)
+    PASSWORD_HASH_WORKERS: int = Field(2, ge=1)
+    PASSWORD_HASH_MAX_PENDING: int = Field(16, ge=1)
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = Field(10, gt=0)
+
+    # Cached user status / token version behind the stateless JWT check
+    AUTH_STATUS_CACHE_TTL_SECONDS: int = Field(30, ge=1)
+
+    # In-process tenant registry (domain -> tenant, countries, currencies)
+    TENANT_REGISTRY_TTL_SECONDS: int = Field(60, ge=1)
+
+    # Game eligibility caches: per-player context and per-tenant
+    # country / currency matrix
+    ELIGIBILITY_PLAYER_TTL_SECONDS: int = Field(60, ge=1)
+    ELIGIBILITY_TENANT_TTL_SECONDS: int = Field(300, ge=1)
+
+    # Per-tenant lobby / marketplace catalog cache
+    GAME_CATALOG_TTL_SECONDS: int = Field(300, ge=1)
+
+    # Per-tenant, per-currency player jackpot listing cache
+    JACKPOT_LISTING_TTL_SECONDS: int = Field(60, ge=1)
+
+    # Admin live dashboard cache
+    DASHBOARD_CACHE_TTL_SECONDS: int = Field(10, ge=5, le=30)
+
+    @field_validator("PARTITION_ARCHIVE_DIR")
+    @classmethod
+    def archive_dir_must_be_absolute(cls, value: str):
+        if not os.path.isabs(value):
+            raise ValueError("PARTITION_ARCHIVE_DIR must be an absolute path")
+        return value
+
     class Config:
         env_file = ".env"
 
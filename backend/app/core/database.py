@@ -1,20 +1,68 @@
-from sqlalchemy import create_engine
+import time
+from threading import Lock
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 import urllib
 from app.core.config import settings
+from app.core.db_metrics import db_metrics
 
 
 password = urllib.parse.quote_plus(settings.DB_PASSWORD)
 
-SQLALCHEMY_DATABASE_URL = (
-    f"postgresql+psycopg2://{settings.DB_USER}:{password}@"
-    f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}?sslmode=require"
-)
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    #settings.DATABASE_URL,
-    pool_pre_ping=True
-)
+
+def database_url(host, port, driver="psycopg2"):
+    return (
+        f"postgresql+{driver}://{settings.DB_USER}:{password}@"
+        f"{host}:{port}/{settings.DB_NAME}"
+    )
+
+
+SQLALCHEMY_DATABASE_URL = database_url(settings.DB_HOST, settings.DB_PORT)
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waited for a connection.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            db_metrics.record_timeout()
+            raise
+
+        db_metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+def connect_args():
+    args = {"sslmode": settings.DB_SSLMODE}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    return args
+
+
+def build_engine(url):
+    return create_engine(
+        url,
+        #settings.DATABASE_URL,
+        poolclass=TimedQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        connect_args=connect_args()
+    )
+
+
+engine = build_engine(SQLALCHEMY_DATABASE_URL)
 
 SessionLocal = sessionmaker(
     bind=engine,
@@ -22,11 +70,198 @@ SessionLocal = sessionmaker(
     autocommit=False
 )
 
+# Read replica (optional)
+read_engine = None
+ReadSessionLocal = None
+
+if settings.DB_READ_HOST:
+    read_engine = build_engine(
+        database_url(settings.DB_READ_HOST, settings.DB_READ_PORT or settings.DB_PORT)
+    )
+    ReadSessionLocal = sessionmaker(
+        bind=read_engine,
+        autoflush=False,
+        autocommit=False
+    )
+
+# Async engine (asyncpg) for the bet hot path: game sessions, instant games,
+# deposits and withdrawals. Those routes run the regular sync services on it
+# through AsyncSession.run_sync, so a request waiting on the database does
+# not hold a threadpool worker. Everything else stays on the sync engine.
+async_engine = create_async_engine(
+    database_url(settings.DB_HOST, settings.DB_PORT, driver="asyncpg"),
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    connect_args={
+        "ssl": settings.DB_SSLMODE,
+        "server_settings": (
+            {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+            if settings.DB_STATEMENT_TIMEOUT_MS else {}
+        )
+    }
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    # Objects stay readable after a commit without an implicit (sync) refresh
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
+
+# A Session only checks out a connection when it runs its first statement,
+# so requests answered from an in-process cache never touch the pool.
+# These hooks measure how long each request actually held a connection.
+
+def _connection_acquired(session, transaction, connection):
+    session.info.setdefault("connected_at", time.perf_counter())
+
+
+def _connection_released(session, transaction):
+    if transaction.parent is not None or "connected_at" not in session.info:
+        return
+
+    held = time.perf_counter() - session.info.pop("connected_at")
+    session.info["held_seconds"] = session.info.get("held_seconds", 0) + held
+
+
+for factory in (SessionLocal, ReadSessionLocal):
+    if factory is not None:
+        event.listen(factory, "after_begin", _connection_acquired)
+        event.listen(factory, "after_transaction_end", _connection_released)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+        db_metrics.record_session(db.info.get("held_seconds"))
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+
+# Replica staleness guard
+#
+# Replay lag is sampled at most every DB_READ_LAG_CHECK_SECONDS; a replica
+# that has replayed everything it received counts as 0 lag even when the
+# primary has been idle for a while.
+
+REPLICA_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() "
+    "  OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+    "END"
+)
+
+_replica_state = {
+    "usable": False,
+    "lag_seconds": None,
+    "checked_at": 0.0,
+    "error": None
+}
+_replica_check_lock = Lock()
+
+
+def check_replica():
+    try:
+        with read_engine.connect() as conn:
+            lag = float(conn.execute(REPLICA_LAG_SQL).scalar() or 0)
+        usable = lag <= settings.DB_READ_MAX_LAG_SECONDS
+        error = None
+    except Exception as e:
+        lag = None
+        usable = False
+        error = str(e)
+
+    if usable != _replica_state["usable"]:
+        if usable:
+            print(f"[DB REPLICA] Serving reads from replica (lag {lag:.1f}s)")
+        else:
+            print(f"[DB REPLICA] Falling back to primary: {error or f'lag {lag:.1f}s'}")
+
+    _replica_state.update(
+        usable=usable,
+        lag_seconds=lag,
+        checked_at=time.monotonic(),
+        error=error
+    )
+
+
+def replica_usable():
+    if read_engine is None:
+        return False
+
+    due = time.monotonic() - _replica_state["checked_at"] >= settings.DB_READ_LAG_CHECK_SECONDS
+
+    # One thread samples the lag; the others use the last known state
+    if due and _replica_check_lock.acquire(blocking=False):
+        try:
+            check_replica()
+        finally:
+            _replica_check_lock.release()
+
+    return _replica_state["usable"]
+
+
+def get_read_db():
+    """
+    Session for read-only endpoints: the replica while it is reachable and
+    within DB_READ_MAX_LAG_SECONDS, the primary otherwise.
+    """
+    factory = ReadSessionLocal if replica_usable() else SessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+        db_metrics.record_session(db.info.get("held_seconds"))
+
+
+
+# Stats
+
+def pool_stats(pool):
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0)
+    }
+
+
+def get_pool_stats():
+    stats = {
+        **pool_stats(engine.pool),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout_seconds": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle_seconds": settings.DB_POOL_RECYCLE_SECONDS,
+        "statement_timeout_ms": settings.DB_STATEMENT_TIMEOUT_MS,
+        **db_metrics.snapshot(),
+        "async_pool": pool_stats(async_engine.pool)
+    }
+
+    if read_engine is None:
+        stats["replica"] = None
+    else:
+        stats["replica"] = {
+            **pool_stats(read_engine.pool),
+            "usable": _replica_state["usable"],
+            "lag_seconds": _replica_state["lag_seconds"],
+            "max_lag_seconds": settings.DB_READ_MAX_LAG_SECONDS,
+            "error": _replica_state["error"]
+        }
+
+    return stats
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from threading import Lock
+
+
+class DBMetrics:
+    """
+    Process-wide counters for connection pool checkouts and request sessions.
+    Wait time is how long a checkout blocked on the pool; hold time is how
+    long a request session kept its connection.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.started_at = datetime.now(timezone.utc)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.sessions = 0
+        self.sessions_with_connection = 0
+        self.hold_total_ms = 0.0
+        self.hold_max_ms = 0.0
+
+    def record_checkout(self, wait_seconds: float):
+        wait_ms = wait_seconds * 1000
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def record_timeout(self):
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_session(self, hold_seconds: float | None):
+        """
+        hold_seconds is None when the session never checked out a connection.
+        """
+        with self._lock:
+            self.sessions += 1
+            if hold_seconds is None:
+                return
+
+            hold_ms = hold_seconds * 1000
+            self.sessions_with_connection += 1
+            self.hold_total_ms += hold_ms
+            self.hold_max_ms = max(self.hold_max_ms, hold_ms)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "since": self.started_at,
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "sessions": self.sessions,
+                "sessions_with_connection": self.sessions_with_connection,
+                "sessions_without_connection": self.sessions - self.sessions_with_connection,
+                "hold_avg_ms": (
+                    round(self.hold_total_ms / self.sessions_with_connection, 3)
+                    if self.sessions_with_connection else 0
+                ),
+                "hold_max_ms": round(self.hold_max_ms, 3)
+            }
+
+
+db_metrics = DBMetrics()
@@ -0,0 +1,61 @@
+import hashlib
+import json
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+# Precomputed JSON bodies with strong ETags, for cached read endpoints.
+# The body and tag are built once when the cache entry is loaded; a
+# request whose If-None-Match carries the tag gets a 304 with no body.
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    body: bytes
+    etag: str
+
+
+def build_cached_body(payload) -> CachedBody:
+    body = json.dumps(
+        jsonable_encoder(payload),
+        separators=(",", ":"),
+        ensure_ascii=False
+    ).encode("utf-8")
+
+    return CachedBody(
+        body=body,
+        etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def cached_json_response(request: Request, cached: CachedBody) -> Response:
+    headers = {
+        "ETag": cached.etag,
+        # Per-user data: browsers may keep it but must revalidate each time
+        "Cache-Control": "private, no-cache"
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=headers
+    )
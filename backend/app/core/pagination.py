@@ -0,0 +1,62 @@
+import base64
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+
+# Keyset (cursor) pagination over (timestamp, id), newest first.
+#
+# The cursor is the position of the last row returned; the next page is
+# everything strictly before it. List endpoints keep returning a plain JSON
+# array and put the cursor for the following page in the X-Next-Cursor
+# response header (absent on the last page).
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(sort_value: datetime, row_id) -> str:
+    raw = f"{sort_value.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(query, sort_column, id_column, cursor: str | None, limit: int):
+    """
+    Applies the cursor, ordering and limit to `query`.
+    Returns (rows, next_cursor); rows must expose both columns by name.
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+        )
+
+    rows = (
+        query
+        .order_by(sort_column.desc(), id_column.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(
+        getattr(last, sort_column.key),
+        getattr(last, id_column.key)
+    )
@@ -0,0 +1,209 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from threading import BoundedSemaphore, Lock
+
+from fastapi import HTTPException
+from passlib.hash import bcrypt
+
+from app.core.config import settings
+
+
+# bcrypt runs on a dedicated process pool so a burst of logins or
+# registrations cannot eat the CPU the API workers need. At most
+# PASSWORD_HASH_MAX_PENDING hashes may be queued or running per API process;
+# beyond that requests are refused with 503 instead of piling up threads
+# that wait on the pool.
+#
+# python -m app.core.password_hashing prints the cost of each bcrypt
+# round setting on this machine.
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = Lock()
+_slots = BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+
+def _truncate(password: str) -> str:
+    # bcrypt only uses the first 72 bytes
+    if len(password.encode("utf-8")) > 72:
+        password = password.encode("utf-8")[:72].decode("utf-8", errors="ignore")
+    return password
+
+
+# Worker functions (run in the pool processes)
+
+def _hash_worker(password: str, rounds: int):
+    started = time.perf_counter()
+    hashed = bcrypt.using(rounds=rounds).hash(password)
+    return hashed, time.perf_counter() - started
+
+
+def _verify_worker(password: str, hashed: str):
+    started = time.perf_counter()
+    valid = bcrypt.verify(password, hashed)
+    return valid, time.perf_counter() - started
+
+
+
+# Metrics
+
+class HashMetrics:
+    def __init__(self):
+        self._lock = Lock()
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.run_total_ms = 0.0
+        self.run_max_ms = 0.0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, total_seconds: float, run_seconds: float | None):
+        with self._lock:
+            self.in_flight -= 1
+            if run_seconds is None:
+                self.failed += 1
+                return
+
+            run_ms = run_seconds * 1000
+            wait_ms = max(total_seconds - run_seconds, 0) * 1000
+            self.completed += 1
+            self.run_total_ms += run_ms
+            self.run_max_ms = max(self.run_max_ms, run_ms)
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "rounds": settings.PASSWORD_BCRYPT_ROUNDS,
+                "workers": settings.PASSWORD_HASH_WORKERS,
+                "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "failed": self.failed,
+                "run_avg_ms": round(self.run_total_ms / self.completed, 2) if self.completed else 0,
+                "run_max_ms": round(self.run_max_ms, 2),
+                "wait_avg_ms": round(self.wait_total_ms / self.completed, 2) if self.completed else 0,
+                "wait_max_ms": round(self.wait_max_ms, 2)
+            }
+
+
+hash_metrics = HashMetrics()
+
+
+
+# Pool
+
+def get_hash_pool():
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn: the API process already runs scheduler threads
+                _pool = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _pool
+
+
+def shutdown_hash_pool():
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def run_in_hash_pool(fn, *args):
+    """
+    Runs fn on the hash pool and waits for its result.
+    Raises 503 when the pending limit is reached or the pool is too slow.
+    A slot is held until the pool is done with the job, not just until the
+    caller stops waiting, so timed-out hashes still count against the limit.
+    """
+    if not _slots.acquire(blocking=False):
+        hash_metrics.reject()
+        raise HTTPException(
+            status_code=503,
+            detail="Too many sign-in requests, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+
+    try:
+        future = get_hash_pool().submit(fn, *args)
+    except Exception:
+        _slots.release()
+        raise
+
+    future.add_done_callback(lambda _: _slots.release())
+
+    started = time.perf_counter()
+    run_seconds = None
+    hash_metrics.started()
+    try:
+        result, run_seconds = future.result(
+            timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS
+        )
+        return result
+    except FutureTimeoutError:
+        # Frees the slot at once if the job has not reached a worker yet
+        future.cancel()
+        raise HTTPException(
+            status_code=503,
+            detail="Too many sign-in requests, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    finally:
+        hash_metrics.finished(time.perf_counter() - started, run_seconds)
+
+
+
+# API
+
+def hash_password(password: str) -> str:
+    return run_in_hash_pool(_hash_worker, _truncate(password), settings.PASSWORD_BCRYPT_ROUNDS)
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    return run_in_hash_pool(_verify_worker, password, hashed)
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """
+    True when the hash was made with a different cost than PASSWORD_BCRYPT_ROUNDS.
+    """
+    try:
+        return bcrypt.from_string(hashed).rounds != settings.PASSWORD_BCRYPT_ROUNDS
+    except ValueError:
+        return False
+
+
+def benchmark_rounds(rounds_options=range(10, 15), samples: int = 3):
+    """
+    Average milliseconds per bcrypt hash for each cost, measured inline.
+    """
+    results = {}
+    for rounds in rounds_options:
+        elapsed = [_hash_worker("benchmark-password", rounds)[1] for _ in range(samples)]
+        results[rounds] = round(sum(elapsed) / samples * 1000, 1)
+    return results
+
+
+if __name__ == "__main__":
+    for rounds, ms in benchmark_rounds().items():
+        marker = "  <- configured" if rounds == settings.PASSWORD_BCRYPT_ROUNDS else ""
+        print(f"rounds={rounds}: {ms} ms{marker}")
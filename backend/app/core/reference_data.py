@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from threading import Lock
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.database import SessionLocal
+from app.models.transaction_type import TransactionType
+from app.models.wallet_type import WalletType
+from app.models.role import Role
+from app.models.currency import Currency
+from app.models.country import Country
+from app.models.game_category import GameCategory
+
+
+# In-process cache for the lookup tables. These rows only change through
+# manual seeding, so they are loaded once at startup and served from memory.
+# Call invalidate_reference_data() after editing any of them.
+
+
+@dataclass(frozen=True)
+class TransactionTypeRef:
+    transaction_type_id: int
+    transaction_code: str
+    description: str | None
+
+
+@dataclass(frozen=True)
+class WalletTypeRef:
+    wallet_type_id: int
+    wallet_type_code: str
+    description: str | None
+
+
+@dataclass(frozen=True)
+class RoleRef:
+    role_id: int
+    role_name: str
+
+
+@dataclass(frozen=True)
+class CurrencyRef:
+    currency_id: int
+    currency_code: str
+    currency_name: str
+    symbol: str | None
+    decimal_places: int | None
+
+
+@dataclass(frozen=True)
+class CountryRef:
+    country_code: str
+    country_name: str
+    default_timezone: str
+    default_currency: str
+
+
+@dataclass(frozen=True)
+class GameCategoryRef:
+    category_id: int
+    category_name: str
+    description: str | None
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    transaction_types: dict[str, TransactionTypeRef]
+    wallet_types: dict[str, WalletTypeRef]
+    roles: dict[str, RoleRef]
+    currencies: dict[str, CurrencyRef]
+    countries: dict[str, CountryRef]
+    game_categories: dict[int, GameCategoryRef]
+
+
+_cache: ReferenceData | None = None
+_lock = Lock()
+
+
+def load_reference_data(db: Session) -> ReferenceData:
+    global _cache
+
+    data = ReferenceData(
+        transaction_types={
+            t.transaction_code: TransactionTypeRef(
+                t.transaction_type_id, t.transaction_code, t.description
+            )
+            for t in db.query(TransactionType).all()
+        },
+        wallet_types={
+            w.wallet_type_code: WalletTypeRef(
+                w.wallet_type_id, w.wallet_type_code, w.description
+            )
+            for w in db.query(WalletType).all()
+        },
+        roles={
+            r.role_name: RoleRef(r.role_id, r.role_name)
+            for r in db.query(Role).all()
+        },
+        currencies={
+            c.currency_code: CurrencyRef(
+                c.currency_id, c.currency_code, c.currency_name,
+                c.symbol, c.decimal_places
+            )
+            for c in db.query(Currency).all()
+        },
+        countries={
+            c.country_code: CountryRef(
+                c.country_code, c.country_name,
+                c.default_timezone, c.default_currency
+            )
+            for c in db.query(Country).all()
+        },
+        game_categories={
+            g.category_id: GameCategoryRef(
+                g.category_id, g.category_name, g.description
+            )
+            for g in db.query(GameCategory).all()
+        },
+    )
+
+    with _lock:
+        _cache = data
+
+    return data
+
+
+def get_reference_data(db: Session) -> ReferenceData:
+    data = _cache
+    if data is None:
+        data = load_reference_data(db)
+    return data
+
+
+def invalidate_reference_data():
+    global _cache
+
+    with _lock:
+        _cache = None
+
+
+def warm_reference_data():
+    db = SessionLocal()
+    try:
+        data = load_reference_data(db)
+        print(
+            f"[REFERENCE DATA] Loaded {len(data.transaction_types)} transaction types, "
+            f"{len(data.wallet_types)} wallet types, {len(data.currencies)} currencies"
+        )
+    except Exception as e:
+        print(f"[REFERENCE DATA ERROR] Warm-up failed, will load on first use: {e}")
+    finally:
+        db.close()
+
+
+# Lookups
+
+def get_transaction_type_id(db: Session, code: str) -> int:
+    txn = get_reference_data(db).transaction_types.get(code)
+    if not txn:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Transaction type '{code}' not configured"
+        )
+    return txn.transaction_type_id
+
+
+def get_wallet_type_id(db: Session, code: str) -> int:
+    wallet_type = get_reference_data(db).wallet_types.get(code)
+    if not wallet_type:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Wallet type '{code}' not configured"
+        )
+    return wallet_type.wallet_type_id
+
+
+def get_role_id(db: Session, role_name: str) -> int:
+    role = get_reference_data(db).roles.get(role_name)
+    if not role:
+        raise HTTPException(
+            status_code=500,
+            detail=f"{role_name} role not configured"
+        )
+    return role.role_id
+
+
+def get_currency(db: Session, currency_code: str) -> CurrencyRef | None:
+    return get_reference_data(db).currencies.get(currency_code)
@@ -1,45 +1,198 @@
 from apscheduler.schedulers.background import BackgroundScheduler
+from fastapi import HTTPException
 
-from datetime import date, timedelta, datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
-from app.core.database import SessionLocal
-from app.models.tenant import Tenant
-from app.services.analytics_snapshot_service import generate_daily_snapshot
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.services.analytics_rollup_service import (
+    refresh_hourly_rollup,
+    prune_hourly_rollup
+)
+from app.services.bonus_service import expire_overdue_bonuses
+from app.services.raffle_service import get_due_jackpots, perform_draw_logic
+from app.services.partition_service import (
+    ensure_future_partitions,
+    archive_cold_partitions,
+    get_partition_summary,
+    partition_maintenance_lock
+)
+from app.services.snapshot_job_service import (
+    pending_snapshot_jobs,
+    queue_snapshot_jobs,
+    run_snapshot_job
+)
 
 _scheduler: BackgroundScheduler | None = None
 
 
+def run_tenant_snapshot(tenant_id, snapshot_date):
+    """
+    Worker: one tenant/day on its own session.
+    """
+    db: Session = SessionLocal()
+    try:
+        result = run_snapshot_job(db, tenant_id, snapshot_date)
+    except Exception as e:
+        # Job row could not be written (e.g. database unavailable)
+        result = {"status": "failed", "error": str(e)}
+    finally:
+        db.close()
+
+    if result["status"] == "failed":
+        print(f"[SNAPSHOT ERROR] Tenant {tenant_id} {snapshot_date}: {result['error']}")
+
+    return result
+
+
 def run_daily_snapshots():
     """
-    Scheduled job to generate analytics for the PREVIOUS full day in UTC.
-    Runs at 00:05 UTC every day.
+    Scheduled job to generate analytics for every closed UTC day that has
+    not completed yet, up to SNAPSHOT_CATCHUP_DAYS back (normally just
+    yesterday). Runs at 00:05 UTC every day and once at startup.
     """
     db: Session = SessionLocal()
     try:
-        
         today_utc = datetime.now(timezone.utc).date()
-        yesterday = today_utc - timedelta(days=1)
+        jobs = pending_snapshot_jobs(db, today_utc, settings.SNAPSHOT_CATCHUP_DAYS)
+        queue_snapshot_jobs(db, jobs)
+    finally:
+        db.close()
+
+    if not jobs:
+        print("[SNAPSHOT] Nothing to do, all days up to date")
+        return
+
+    days = sorted({day for _, day in jobs})
+    print(f"[SNAPSHOT START] {len(jobs)} tenant jobs for {days[0]} .. {days[-1]}")
+
+    with ThreadPoolExecutor(
+        max_workers=settings.SNAPSHOT_WORKERS,
+        thread_name_prefix="snapshot"
+    ) as pool:
+        results = list(pool.map(lambda job: run_tenant_snapshot(*job), jobs))
 
-        tenants = (
-            db.query(Tenant)
-            .filter(Tenant.status == "active")
-            .all()
+    failed = sum(1 for r in results if r["status"] == "failed")
+    print(f"[SNAPSHOT DONE] {len(results) - failed} done, {failed} failed")
+
+
+def run_hourly_rollup():
+    """
+    Scheduled job folding bets placed since the last watermark into the
+    hourly rollup. Runs every HOURLY_ROLLUP_INTERVAL_MINUTES.
+    """
+    db: Session = SessionLocal()
+    try:
+        result = refresh_hourly_rollup(db)
+        print(
+            f"[ROLLUP] {result['buckets_written']} hourly buckets from "
+            f"{result['window_start']} in {result['elapsed_ms']} ms"
         )
+    except Exception as e:
+        db.rollback()
+        print(f"[ROLLUP ERROR] {e}")
+    finally:
+        db.close()
+
+
+def run_hourly_rollup_prune():
+    db: Session = SessionLocal()
+    try:
+        deleted = prune_hourly_rollup(db, settings.HOURLY_ROLLUP_RETENTION_DAYS)
+        print(f"[ROLLUP] Pruned {deleted} hourly buckets")
+    except Exception as e:
+        db.rollback()
+        print(f"[ROLLUP ERROR] Prune failed: {e}")
+    finally:
+        db.close()
 
-        print(f"[SNAPSHOT START] Generating analytics for date: {yesterday}")
 
-        for tenant in tenants:
+def run_bonus_expiry():
+    """
+    Scheduled job expiring every overdue active bonus in one pass.
+    Runs every BONUS_EXPIRY_INTERVAL_MINUTES.
+    """
+    db: Session = SessionLocal()
+    try:
+        expired = expire_overdue_bonuses(db)
+        if expired:
+            print(f"[BONUS EXPIRY] Expired {expired} bonuses")
+    except Exception as e:
+        db.rollback()
+        print(f"[BONUS EXPIRY ERROR] {e}")
+    finally:
+        db.close()
+
+
+def run_raffle_auto_draws():
+    """
+    Scheduled job drawing every active TIME_BASED jackpot past draw_at and
+    THRESHOLD jackpot at target_amount. Each draw commits on its own, so one
+    failing jackpot does not hold back the others.
+    Runs every RAFFLE_AUTO_DRAW_INTERVAL_MINUTES.
+    """
+    db: Session = SessionLocal()
+    try:
+        for tenant_id, jackpot_id in get_due_jackpots(db):
             try:
-                generate_daily_snapshot(
-                    db=db,
-                    tenant_id=tenant.tenant_id,
-                    snapshot_date=yesterday
+                result = perform_draw_logic(db, tenant_id, jackpot_id)
+                print(
+                    f"[RAFFLE DRAW] Jackpot {jackpot_id}: entry "
+                    f"{result['winning_entry_number']} won {result['amount_won']}"
                 )
+            except HTTPException as e:
+                # e.g. no entries (jackpot cancelled) or drawn concurrently
+                db.rollback()
+                print(f"[RAFFLE DRAW] Jackpot {jackpot_id}: {e.detail}")
             except Exception as e:
-                print(f"[SNAPSHOT ERROR] Tenant {tenant.tenant_id}: {e}")
+                db.rollback()
+                print(f"[RAFFLE DRAW ERROR] Jackpot {jackpot_id}: {e}")
+    except Exception as e:
+        db.rollback()
+        print(f"[RAFFLE DRAW ERROR] {e}")
+    finally:
+        db.close()
+
+
+def run_partition_maintenance():
+    """
+    Scheduled job to create the next PARTITION_PREMAKE_MONTHS monthly
+    partitions and archive the ones past PARTITION_ARCHIVE_AFTER_MONTHS.
+    Runs daily at 02:00 UTC and once at startup. Only one process runs it
+    at a time; the others skip while the advisory lock is held.
+    """
+    try:
+        with partition_maintenance_lock(engine) as acquired:
+            if not acquired:
+                print("[PARTITION] Maintenance already running elsewhere, skipping")
+                return
+            maintain_partitions()
+    except Exception as e:
+        print(f"[PARTITION ERROR] {e}")
 
-        print(f"[SNAPSHOT DONE] Completed for date: {yesterday}")
+
+def maintain_partitions():
+    db: Session = SessionLocal()
+    try:
+        created = ensure_future_partitions(db, settings.PARTITION_PREMAKE_MONTHS)
+        if created:
+            print(f"[PARTITION] Created {', '.join(created)}")
+
+        for archived in archive_cold_partitions(
+            db,
+            settings.PARTITION_ARCHIVE_AFTER_MONTHS,
+            settings.PARTITION_ARCHIVE_DIR
+        ):
+            print(f"[PARTITION] Archived {archived['partition']} to {archived['file']}")
+
+        for table, info in get_partition_summary(db).items():
+            if info["default_rows"]:
+                print(f"[PARTITION WARNING] {table}_default holds {info['default_rows']} rows")
+    except Exception as e:
+        db.rollback()
+        print(f"[PARTITION ERROR] {e}")
     finally:
         db.close()
 
@@ -59,6 +212,71 @@ def start_scheduler():
         hour=0,
         minute=5,  # Runs at 00:05 UTC
         id="daily_snapshot",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1
+    )
+
+    _scheduler.add_job(
+        run_hourly_rollup,
+        trigger="interval",
+        minutes=settings.HOURLY_ROLLUP_INTERVAL_MINUTES,
+        next_run_time=datetime.now(timezone.utc),
+        id="hourly_rollup",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1
+    )
+
+    _scheduler.add_job(
+        run_hourly_rollup_prune,
+        trigger="cron",
+        hour=1,
+        minute=0,
+        id="hourly_rollup_prune",
+        replace_existing=True
+    )
+
+    _scheduler.add_job(
+        run_bonus_expiry,
+        trigger="interval",
+        minutes=settings.BONUS_EXPIRY_INTERVAL_MINUTES,
+        next_run_time=datetime.now(timezone.utc),
+        id="bonus_expiry",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1
+    )
+
+    _scheduler.add_job(
+        run_raffle_auto_draws,
+        trigger="interval",
+        minutes=settings.RAFFLE_AUTO_DRAW_INTERVAL_MINUTES,
+        next_run_time=datetime.now(timezone.utc),
+        id="raffle_auto_draw",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1
+    )
+
+    _scheduler.add_job(
+        run_partition_maintenance,
+        trigger="cron",
+        hour=2,
+        minute=0,
+        next_run_time=datetime.now(timezone.utc),
+        id="partition_maintenance",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1
+    )
+
+    # Catch up on days missed while the service was down
+    _scheduler.add_job(
+        run_daily_snapshots,
+        trigger="date",
+        run_date=datetime.now(timezone.utc),
+        id="snapshot_catchup",
         replace_existing=True
     )
 
@@ -69,4 +287,4 @@ def start_scheduler():
 
 
 def get_scheduler():
-    return _scheduler
\ No newline at end of file
+    return _scheduler
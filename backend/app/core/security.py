@@ -1,27 +1,62 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta,timezone
+from uuid import UUID
 from jose import jwt, JWTError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_db, get_async_db
+from app.core.password_hashing import hash_password, verify_password, password_needs_rehash
 from app.models.user import User
-from passlib.context import CryptContext
 
 
 SECRET_KEY = "super-secret-key"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    token = credentials.credentials
+# Authentication
+#
+# Access tokens carry the user's id, tenant, role and token version, so a
+# request is authenticated from the token alone. The only per-user state
+# checked is (status, token_version), kept in a short TTL cache: blocking a
+# user or bumping their token_version (password change) takes effect on this
+# worker immediately and on the others within AUTH_STATUS_CACHE_TTL_SECONDS.
+# Routes that need the full User row use get_current_user_record.
+
+@dataclass(frozen=True)
+class Principal:
+    user_id: UUID
+    tenant_id: UUID | None
+    role_id: int
+    token_version: int
+
+
+_user_states = TTLCache(ttl_seconds=settings.AUTH_STATUS_CACHE_TTL_SECONDS)
+
+
+def user_state_query(user_id):
+    return select(User.status, User.token_version).where(User.user_id == user_id)
+
+
+def invalidate_user_state(user_id=None):
+    """
+    Call after a user's status or token_version changes.
+    Without a user_id every cached state is dropped (bulk status updates).
+    """
+    if user_id is None:
+        _user_states.clear()
+    else:
+        _user_states.invalidate(str(user_id))
+
 
+def decode_principal(token: str) -> Principal:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
@@ -29,27 +64,85 @@ def get_current_user(
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
 
-    except JWTError:
+        return Principal(
+            user_id=UUID(user_id),
+            tenant_id=UUID(payload["tenant_id"]) if payload.get("tenant_id") else None,
+            role_id=int(payload["role_id"]),
+            token_version=int(payload.get("ver", 0))
+        )
+
+    except (JWTError, KeyError, TypeError, ValueError):
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(User).filter(User.user_id == user_id).first()
 
-    if not user:
+def check_user_state(principal: Principal, state):
+    if state is None:
         raise HTTPException(status_code=401, detail="User not found")
 
-    return user
+    if state["token_version"] != principal.token_version:
+        raise HTTPException(status_code=401, detail="Token revoked")
+
+    if state["status"] == "blocked":
+        raise HTTPException(status_code=403, detail="Account is blocked")
+
+    return principal
+
+
+def load_user_state(db: Session, user_id):
+    row = db.execute(user_state_query(user_id)).first()
+    if not row:
+        return None
+    return {"status": row.status, "token_version": row.token_version}
 
 
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> Principal:
+    principal = decode_principal(credentials.credentials)
+
+    # The session only checks out a connection on a cache miss
+    state = _user_states.get_or_load(
+        str(principal.user_id),
+        lambda: load_user_state(db, principal.user_id)
+    )
+
+    return check_user_state(principal, state)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """
+    get_current_user for the async routes; shares the request's AsyncSession.
+    """
+    principal = decode_principal(credentials.credentials)
+    key = str(principal.user_id)
 
-def hash_password(password: str) -> str:
-    
-    if len(password.encode("utf-8")) > 72:
-        password = password.encode("utf-8")[:72].decode("utf-8", errors="ignore")
-    return pwd_context.hash(password)
+    state = _user_states.get(key)
+    if state is None:
+        row = (await db.execute(user_state_query(principal.user_id))).first()
+        if row:
+            state = _user_states.set(key, {"status": row.status, "token_version": row.token_version})
 
+    return check_user_state(principal, state)
+
+
+def get_current_user_record(
+    principal: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    The authenticated user's full row, for routes that read or update it.
+    """
+    user = db.query(User).filter(User.user_id == principal.user_id).first()
+
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+
+    return user
 
-def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
 
 
 """ def verify_password(plain: str, stored: str) -> bool:
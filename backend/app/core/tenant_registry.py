@@ -0,0 +1,163 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.tenant import Tenant
+from app.models.tenant_country import TenantCountry
+from app.models.tenant_country_currency import TenantCountryCurrency
+
+
+# In-process registry of tenants with their countries and currencies, so
+# login, registration and domain lookups resolve tenant config without a
+# query. Loaded at startup; the super-admin tenant, country and currency
+# services call invalidate_tenant_registry() after writing, and other worker
+# processes pick changes up within TENANT_REGISTRY_TTL_SECONDS.
+#
+# Reloads are single-flight (TTLCache.get_or_load), so an expiry under load
+# runs one set of queries per process. A lookup that misses checks the
+# tenant table for that one tenant and only reloads when it exists, so a
+# tenant created on another worker resolves at once and unknown domains
+# never trigger a reload.
+
+
+@dataclass(frozen=True)
+class TenantCurrencyRef:
+    currency_id: int
+    is_default: bool
+    is_active: bool
+
+
+@dataclass(frozen=True)
+class TenantCountryRef:
+    country_code: str
+    currency_code: str
+    is_active: bool
+    currencies: tuple[TenantCurrencyRef, ...]
+
+
+@dataclass(frozen=True)
+class TenantRef:
+    tenant_id: UUID
+    tenant_name: str
+    domain: str | None
+    status: str
+    created_at: datetime
+    countries: dict[str, TenantCountryRef]
+
+    def active_country(self, country_code: str) -> TenantCountryRef | None:
+        country = self.countries.get(country_code)
+        return country if country and country.is_active else None
+
+
+@dataclass(frozen=True)
+class TenantRegistry:
+    by_id: dict[UUID, TenantRef]
+    by_domain: dict[str, TenantRef]
+    loaded_at: float
+
+
+REGISTRY_KEY = "tenants"
+
+_registry = TTLCache(ttl_seconds=settings.TENANT_REGISTRY_TTL_SECONDS, max_entries=1)
+_refresh_lock = Lock()
+
+
+def load_tenant_registry(db: Session) -> TenantRegistry:
+    currencies = {}
+    for c in db.query(TenantCountryCurrency).all():
+        currencies.setdefault((c.tenant_id, c.country_code), []).append(
+            TenantCurrencyRef(c.currency_id, bool(c.is_default), bool(c.is_active))
+        )
+
+    countries = {}
+    for c in db.query(TenantCountry).all():
+        countries.setdefault(c.tenant_id, {})[c.country_code] = TenantCountryRef(
+            c.country_code,
+            c.currency_code,
+            bool(c.is_active),
+            tuple(currencies.get((c.tenant_id, c.country_code), ()))
+        )
+
+    tenants = [
+        TenantRef(
+            t.tenant_id, t.tenant_name, t.domain, t.status, t.created_at,
+            countries.get(t.tenant_id, {})
+        )
+        for t in db.query(Tenant).all()
+    ]
+
+    return TenantRegistry(
+        by_id={t.tenant_id: t for t in tenants},
+        by_domain={t.domain: t for t in tenants if t.domain},
+        loaded_at=time.monotonic()
+    )
+
+
+def get_tenant_registry(db: Session) -> TenantRegistry:
+    return _registry.get_or_load(REGISTRY_KEY, lambda: load_tenant_registry(db))
+
+
+def refresh_tenant_registry(db: Session, stale: TenantRegistry) -> TenantRegistry:
+    """
+    Reloads the registry unless another caller already replaced `stale`,
+    so concurrent misses on the same new tenant cause a single reload.
+    """
+    with _refresh_lock:
+        if _registry.get(REGISTRY_KEY) is stale:
+            _registry.invalidate(REGISTRY_KEY)
+    return get_tenant_registry(db)
+
+
+def invalidate_tenant_registry():
+    _registry.invalidate(REGISTRY_KEY)
+
+
+def warm_tenant_registry():
+    db = SessionLocal()
+    try:
+        registry = _registry.set(REGISTRY_KEY, load_tenant_registry(db))
+        print(f"[TENANT REGISTRY] Loaded {len(registry.by_id)} tenants")
+    except Exception as e:
+        print(f"[TENANT REGISTRY ERROR] Warm-up failed, will load on first use: {e}")
+    finally:
+        db.close()
+
+
+# Lookups
+
+def tenant_exists(db: Session, condition) -> bool:
+    return db.query(Tenant.tenant_id).filter(condition).first() is not None
+
+
+def find_tenant_by_domain(db: Session, domain: str) -> TenantRef | None:
+    registry = get_tenant_registry(db)
+    tenant = registry.by_domain.get(domain)
+
+    # Created (or re-domained) on another worker since the last load
+    if tenant is None and tenant_exists(db, Tenant.domain == domain):
+        tenant = refresh_tenant_registry(db, registry).by_domain.get(domain)
+
+    return tenant
+
+
+def find_tenant_by_id(db: Session, tenant_id) -> TenantRef | None:
+    if not isinstance(tenant_id, UUID):
+        try:
+            tenant_id = UUID(str(tenant_id))
+        except ValueError:
+            return None
+
+    registry = get_tenant_registry(db)
+    tenant = registry.by_id.get(tenant_id)
+
+    if tenant is None and tenant_exists(db, Tenant.tenant_id == tenant_id):
+        tenant = refresh_tenant_registry(db, registry).by_id.get(tenant_id)
+
+    return tenant
@@ -7,6 +7,9 @@ from app.core.database import get_db
 from sqlalchemy import text
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.scheduler import start_scheduler
+from app.core.password_hashing import shutdown_hash_pool
+from app.core.reference_data import warm_reference_data
+from app.core.tenant_registry import warm_tenant_registry
 from app.api import wallets
 from app.api import auth
 from app.api import admin_withdrawals
@@ -45,6 +48,8 @@ from app.api.super import provider_games
 from app.api.super import audit_logs
 from app.api.admin_marketplace import router as admin_marketplace
 from app.api.super.requests import router as super_requests_router 
+from app.api.super.wager_ledger import router as super_wager_ledger_router
+from app.api.super.system import router as super_system_router
 from app.api.admin import games as admin_games_router
 from app.api import inquiries
 
@@ -72,6 +77,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 app.include_router(wallets.router)
 app.include_router(auth.router)
@@ -124,11 +130,19 @@ app.include_router(meta_router)
 app.include_router(provider_games.router)
 app.include_router(audit_logs.router)
 app.include_router(super_requests_router)
+app.include_router(super_wager_ledger_router)
+app.include_router(super_system_router)
 
 @app.on_event("startup")
 def start_background_jobs():
+    warm_reference_data()
+    warm_tenant_registry()
     start_scheduler()
 
+@app.on_event("shutdown")
+def stop_background_workers():
+    shutdown_hash_pool()
+
 @app.get("/test/wallets")
 def test_wallets(db: Session = Depends(get_db)):
     wallets = db.query(Wallet).all()
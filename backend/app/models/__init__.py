@@ -25,9 +25,14 @@ from .game_round import GameRound
 from .bet import Bet
 from .notification import Notification
 from .responsible_limit import ResponsibleLimit
+from .player_wager_total import PlayerWagerTotal
 
 from .bonus import Bonus
 from .bonus_usage import BonusUsage
 
 from .raffle_entry import RaffleEntry
-from .raffle_jackpot import RaffleJackpot
\ No newline at end of file
+from .raffle_jackpot import RaffleJackpot
+
+from .analytics_snapshot_job import AnalyticsSnapshotJob
+from .analytics_hourly import AnalyticsHourly
+from .analytics_watermark import AnalyticsWatermark
\ No newline at end of file
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, Numeric, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class AnalyticsHourly(Base):
+    """
+    Bets rolled up per tenant, game and UTC hour. Kept current by the
+    incremental rollup job; closed days are served from analytics_snapshots.
+    """
+    __tablename__ = "analytics_hourly"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.tenant_id"), primary_key=True)
+    game_id = Column(UUID(as_uuid=True), ForeignKey("games.game_id"), primary_key=True)
+
+    # Start of the UTC hour
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+
+    bet_count = Column(Integer, nullable=False, default=0)
+    total_bets = Column(Numeric(18, 2), nullable=False, default=0)
+    total_wins = Column(Numeric(18, 2), nullable=False, default=0)
+
+    # Distinct players who bet during the hour
+    active_players = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
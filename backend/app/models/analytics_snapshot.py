@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Numeric, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, Numeric, Date, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -52,4 +52,5 @@ class AnalyticsSnapshot(Base):
             "game_id",
             name="uq_snapshot_date_tenant_country_game"
         ),
+        Index("ix_analytics_snapshots_tenant_date", "tenant_id", "snapshot_date"),
     )
\ No newline at end of file
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, Integer, Numeric, Date, DateTime, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class AnalyticsSnapshotJob(Base):
+    """
+    One row per tenant and snapshot day, written by the snapshot scheduler
+    so partial runs are visible and missed days can be caught up.
+    """
+    __tablename__ = "analytics_snapshot_jobs"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.tenant_id"), primary_key=True)
+
+    snapshot_date = Column(Date, primary_key=True)
+
+    # 'pending', 'running', 'done' or 'failed'
+    status = Column(String(10), nullable=False, default="pending")
+
+    attempts = Column(Integer, nullable=False, default=0)
+
+    games_processed = Column(Integer)
+    bets_processed = Column(Integer)
+    duration_ms = Column(Numeric(12, 2))
+
+    error = Column(Text)
+
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class AnalyticsWatermark(Base):
+    """
+    High-water mark of an incremental analytics job: everything before
+    `watermark` has been processed.
+    """
+    __tablename__ = "analytics_watermarks"
+
+    job_name = Column(String(50), primary_key=True)
+
+    watermark = Column(DateTime(timezone=True), nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 
@@ -22,4 +22,8 @@ class AuditLog(Base):
     user_agent = Column(String)
 
    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_audit_logs_tenant_created_at", "tenant_id", "created_at"),
+    )
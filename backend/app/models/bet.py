@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Numeric, String, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, Numeric, String, DateTime, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func 
 from datetime import datetime, timezone 
@@ -15,11 +15,9 @@ class Bet(Base):
         default=uuid.uuid4
     )
 
-    round_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("game_rounds.round_id"),
-        nullable=False
-    )
+    # game_rounds is partitioned on started_at, so round_id alone cannot
+    # carry a foreign key (see migrations/006_partition_time_series.sql)
+    round_id = Column(UUID(as_uuid=True), nullable=False)
 
     wallet_id = Column(
         UUID(as_uuid=True),
@@ -27,6 +25,13 @@ class Bet(Base):
         nullable=False
     )
 
+    # Copied from the round's session at settlement so per-tenant, per-player
+    # and per-game aggregates read bets alone
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.tenant_id"), nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.player_id"), nullable=False)
+    game_id = Column(UUID(as_uuid=True), ForeignKey("games.game_id"), nullable=False)
+    session_id = Column(UUID(as_uuid=True), ForeignKey("game_sessions.session_id"), nullable=False)
+
     bet_currency_id = Column(
         Integer,
         ForeignKey("currencies.currency_id"),
@@ -38,12 +43,23 @@ class Bet(Base):
 
     bet_status = Column(String(20), default="placed")
 
-   
+    # Monthly partition key, part of the primary key
     placed_at = Column(
-        DateTime(timezone=True), 
-        server_default=func.now(), 
-        default=lambda: datetime.now(timezone.utc) 
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc)
     )
     
     
-    settled_at = Column(DateTime(timezone=True))
\ No newline at end of file
+    settled_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_bets_round_id", "round_id"),
+        Index("ix_bets_wallet_id_placed_at", "wallet_id", "placed_at"),
+        Index("ix_bets_placed_at", "placed_at"),
+        Index("ix_bets_tenant_game_placed_at", "tenant_id", "game_id", "placed_at"),
+        Index("ix_bets_player_placed_at", "player_id", "placed_at"),
+        Index("ix_bets_session_id", "session_id"),
+    )
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey
+from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
@@ -28,4 +28,8 @@ class BonusUsage(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
    
-    expired_at = Column(DateTime(timezone=True), nullable=True)
\ No newline at end of file
+    expired_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_bonus_usage_player_status", "player_id", "status"),
+    )
@@ -19,6 +19,10 @@ class GameRound(Base):
     round_number = Column(Integer, nullable=False)
     outcome = Column(String(50))
 
-    
-    started_at = Column(DateTime(timezone=True), server_default=func.now())
-    ended_at = Column(DateTime(timezone=True))
\ No newline at end of file
+    # Monthly partition key, part of the primary key
+    started_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+    ended_at = Column(DateTime(timezone=True))
+
+    # Each monthly partition has a UNIQUE (session_id, round_number) index
+    # (Postgres cannot enforce it on the parent without the partition key);
+    # see migrations/008_game_session_round_counter.sql
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -20,8 +20,18 @@ class GameSession(Base):
 
     status = Column(String(20), default="active")
 
+    # Last round number handed out; settlement claims the next numbers by
+    # incrementing it in the same statement that writes the rounds
+    rounds_played = Column(Integer, nullable=False, default=0, server_default="0")
+
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     ended_at = Column(DateTime(timezone=True))
 
     ip_address = Column(String(45))
-    device_info = Column(String)
\ No newline at end of file
+    device_info = Column(String)
+
+    __table_args__ = (
+        Index("ix_game_sessions_player_game_status", "player_id", "game_id", "status"),
+        Index("ix_game_sessions_player_started_at", "player_id", "started_at", "session_id"),
+        Index("ix_game_sessions_tenant_started_at", "tenant_id", "started_at"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Date, Text
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Date, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
@@ -29,4 +29,8 @@ class KYCDocument(Base):
     expiry_date = Column(Date)
 
     
-    uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_kyc_documents_user_status", "user_id", "verification_status"),
+    )
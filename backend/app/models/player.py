@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, String, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -10,6 +10,10 @@ class Player(Base):
 
     status = Column(String(20), default="active")
     kyc_status = Column(String(20), default="not_submitted")
+
+    # True while the player has a bonus_usage row in status 'active', so
+    # bets can skip bonus wagering entirely for everyone else
+    has_active_bonus = Column(Boolean, nullable=False, default=False, server_default="false")
     
     # MODIFIED: Added timezone=True
     kyc_verified_at = Column(DateTime(timezone=True))
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Numeric, Date, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class PlayerWagerTotal(Base):
+    """
+    Running wager totals per player and UTC period, maintained by the game
+    settlement path so responsible gaming checks are a keyed read.
+    """
+    __tablename__ = "player_wager_totals"
+
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.player_id"), primary_key=True)
+
+    # 'DAY' or 'MONTH'
+    period_type = Column(String(5), primary_key=True)
+
+    # First UTC day of the period
+    period_start = Column(Date, primary_key=True)
+
+    total_wagered = Column(Numeric(18, 2), nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
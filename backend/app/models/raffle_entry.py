@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Numeric, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, Numeric, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -12,10 +12,16 @@ class RaffleEntry(Base):
     player_id = Column(UUID(as_uuid=True), ForeignKey("players.player_id"), nullable=False)
     wallet_id = Column(UUID(as_uuid=True), ForeignKey("wallets.wallet_id"), nullable=False)
     amount_paid = Column(Numeric(18, 2), nullable=False)
+
+    # 1..participants_count within the jackpot, assigned on join; the draw
+    # picks the winner by this number
+    entry_number = Column(Integer, nullable=False)
     
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint('jackpot_id', 'player_id', name='uq_jackpot_player_entry'),
+        UniqueConstraint('jackpot_id', 'entry_number', name='uq_jackpot_entry_number'),
+        Index('ix_raffle_entries_player_created_at', 'player_id', 'created_at'),
     )
\ No newline at end of file
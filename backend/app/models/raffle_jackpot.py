@@ -29,12 +29,20 @@ class RaffleJackpot(Base):
     
     # active, completed, cancelled
     status = Column(String(20), default="active")
+
+    # Maintained by join_jackpot_logic under the jackpot row lock
+    participants_count = Column(Integer, nullable=False, default=0, server_default="0")
     
     winner_id = Column(UUID(as_uuid=True), ForeignKey("players.player_id"))
     won_amount = Column(Numeric(18, 2))
     
     # MODIFIED: Added timezone=True
     drawn_at = Column(DateTime(timezone=True))
+
+    # Draw audit: the winner is entry number
+    # sha256(f"{draw_seed}:{jackpot_id}") % participants_count + 1
+    draw_seed = Column(String(64))
+    winning_entry_number = Column(Integer)
     
     # MODIFIED: Added timezone=True
     created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -8,6 +8,8 @@ class User(Base):
     __tablename__ = "users"
     __table_args__ = (
         UniqueConstraint("tenant_id", "email", name="uq_tenant_email"),
+        Index("ix_users_tenant_role", "tenant_id", "role_id"),
+        Index("ix_users_tenant_created_at", "tenant_id", "created_at"),
     )
 
     user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -23,6 +25,9 @@ class User(Base):
 
     status = Column(String(20), default="active")
 
+    # Copied into access tokens as "ver"; bumping it revokes issued tokens
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
\ No newline at end of file
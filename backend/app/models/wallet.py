@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Integer, Boolean, Numeric, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Boolean, Numeric, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -25,4 +25,8 @@ class Wallet(Base):
     
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    wallet_type = relationship(WalletType)
\ No newline at end of file
+    wallet_type = relationship(WalletType)
+
+    __table_args__ = (
+        Index("ix_wallets_player_tenant_type", "player_id", "tenant_id", "wallet_type_id"),
+    )
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Numeric, ForeignKey, DateTime, String
+from sqlalchemy import Column, Numeric, ForeignKey, DateTime, String, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -27,5 +27,9 @@ class WalletTransaction(Base):
     reference_type = Column(String(30))
     reference_id = Column(UUID(as_uuid=True))
 
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    # Monthly partition key, part of the primary key
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_wallet_transactions_wallet_created_at", "wallet_id", "created_at", "transaction_id"),
+    )
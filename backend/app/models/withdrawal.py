@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Numeric, String, ForeignKey, DateTime, Integer
+from sqlalchemy import Column, Numeric, String, ForeignKey, DateTime, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -26,4 +26,9 @@ class Withdrawal(Base):
 
     gateway_id = Column(Integer, ForeignKey("payment_gateways.gateway_id"))
     gateway_reference = Column(String(255))
-    rejection_reason = Column(String)
\ No newline at end of file
+    rejection_reason = Column(String)
+
+    __table_args__ = (
+        Index("ix_withdrawals_tenant_status_requested_at", "tenant_id", "status", "requested_at"),
+        Index("ix_withdrawals_player_requested_at", "player_id", "requested_at"),
+    )
@@ -73,6 +73,9 @@ class AdminRealtimeDashboardResponse(BaseModel):
     top_games: List[LiveGamePerformance]
     currency_symbol: str = "₹"
     updated_at: datetime
+    # When the numbers were calculated; may lag updated_at by up to the cache TTL
+    computed_at: datetime
+    cache_ttl_seconds: int
 
     class Config:
         from_attributes = True
\ No newline at end of file
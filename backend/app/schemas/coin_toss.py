@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Optional
 from decimal import Decimal
 
 class StartCoinTossSessionResponse(BaseModel):
@@ -22,4 +22,30 @@ class CoinTossBetResponse(BaseModel):
     win: bool               
     bet_amount: float
     win_amount: float
-    balance_after: float    
\ No newline at end of file
+    balance_after: float
+
+
+class CoinTossBatchRequest(BaseModel):
+    game_id: UUID
+    choice: Literal["HEAD", "TAIL"]
+    bet_amount: Decimal
+    rounds: int = Field(..., ge=1, le=100)
+
+class CoinTossRoundResult(BaseModel):
+    round_id: UUID
+    player_choice: str
+    outcome: str
+    win: bool
+    bet_amount: float
+    win_amount: float
+    balance_after: float
+
+class CoinTossBatchResponse(BaseModel):
+    session_id: UUID
+    rounds: list[CoinTossRoundResult]
+    rounds_requested: int
+    rounds_played: int
+    stop_reason: Optional[str]
+    total_bet: float
+    total_win: float
+    balance_after: float
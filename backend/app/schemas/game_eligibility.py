@@ -1,6 +1,10 @@
 from pydantic import BaseModel
 from typing import Optional
+from uuid import UUID
 
 class GameEligibilityResponse(BaseModel):
     eligible: bool
-    reason: Optional[str] = None
\ No newline at end of file
+    reason: Optional[str] = None
+
+class LobbyEligibilityItem(GameEligibilityResponse):
+    game_id: UUID
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import Literal, Optional
 from uuid import UUID
 from decimal import Decimal
 
@@ -24,3 +24,38 @@ class DiceBetResponse(BaseModel):
 
     balance_before: Decimal
     balance_after: Decimal
+
+
+class DiceBatchBetRequest(BaseModel):
+    game_id: UUID
+    bet_choice: Literal["EVEN", "ODD"]
+    amount: Decimal = Field(..., gt=0, example="100.00")
+    rounds: int = Field(..., ge=1, le=100)
+
+
+class DiceRoundResult(BaseModel):
+    round_id: UUID
+
+    dice_roll: int
+    bet_choice: Literal["EVEN", "ODD"]
+    outcome: Literal["EVEN", "ODD"]
+
+    win: bool
+    win_amount: Decimal
+
+    balance_before: Decimal
+    balance_after: Decimal
+
+
+class DiceBatchBetResponse(BaseModel):
+    game: Literal["DICE"]
+    session_id: UUID
+    rounds: list[DiceRoundResult]
+
+    rounds_requested: int
+    rounds_played: int
+    stop_reason: Optional[str]
+
+    total_bet: Decimal
+    total_win: Decimal
+    balance_after: Decimal
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import Literal, Optional
 from uuid import UUID
 
 
@@ -24,3 +24,32 @@ class PlayRoundResponse(BaseModel):
     win_amount: float
     bet_amount: float 
     balance_after: float
+
+
+class PlayBatchRequest(BaseModel):
+    game_id: UUID
+    bet_choice: Literal["EVEN", "ODD"]
+    amount: float = Field(..., gt=0)
+    rounds: int = Field(..., ge=1, le=100)
+
+
+class RoundResult(BaseModel):
+    round_id: UUID
+    dice_roll: int
+    bet_choice: str
+    outcome: str
+    win: bool
+    win_amount: float
+    bet_amount: float
+    balance_after: float
+
+
+class PlayBatchResponse(BaseModel):
+    session_id: UUID
+    rounds: list[RoundResult]
+    rounds_requested: int
+    rounds_played: int
+    stop_reason: Optional[str]
+    total_bet: float
+    total_win: float
+    balance_after: float
@@ -34,6 +34,8 @@ class JackpotResponse(BaseModel):
 
     won_amount: Optional[float]
     drawn_at: Optional[datetime]
+    draw_seed: Optional[str] = None
+    winning_entry_number: Optional[int] = None
     created_at: datetime
     is_joined: bool = False 
     class Config:
@@ -51,6 +53,8 @@ class JackpotDrawResponse(BaseModel):
     winner_email: str 
     amount_won: float
     currency_symbol: str
+    draw_seed: str
+    winning_entry_number: int
 
 class TenantCurrencyResponse(BaseModel):
     currency_id: int
@@ -1,8 +1,10 @@
 from pydantic import BaseModel
-from datetime import date
+from datetime import date, datetime
 
 class SuperTimeSeriesResponse(BaseModel):
     date: date
+    # Set on hourly points (ranges of 48 hours or less)
+    hour: datetime | None = None
     total_bets: float
     total_wins: float
     ggr: float
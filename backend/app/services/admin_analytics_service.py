@@ -192,170 +192,231 @@ def get_tenant_dashboard_overview(db: Session, tenant_id):
 
 #live analytics
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc, select
+from sqlalchemy import func, select, exists, null, true
 from datetime import datetime, timezone, timedelta, date
 from app.models.bet import Bet
 from app.models.game import Game
 from app.models.game_session import GameSession
-from app.models.game_round import GameRound
 from app.models.wallet import Wallet 
 from app.models.user import User
 from app.models.raffle_entry import RaffleEntry
 from app.models.bonus_usage import BonusUsage
 from app.models.tenant_country import TenantCountry
-from app.models.country import Country
 from app.models.currency import Currency
 from app.models.withdrawal import Withdrawal
 from app.models.wallet_transaction import WalletTransaction
-from app.models.transaction_type import TransactionType
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.reference_data import get_transaction_type_id
+
+# Per-(tenant, country) dashboard cache; admins polling the same view share
+# one computation per TTL window.
+_realtime_dashboards = TTLCache(
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+    max_entries=1000
+)
+
 
 def get_tenant_realtime_dashboard(db: Session, tenant_id: str, country_code: str = None):
     """
-    Corrected Simultaneous Real-Time Analytics Engine.
-    Fixes DuplicateAlias error and Subquery coercion warnings.
+    Live dashboard served from a short-TTL cache.
+    computed_at reports when the numbers were last calculated.
+    """
+    country_code = country_code.strip() if country_code and country_code.strip() else None
+
+    dashboard = _realtime_dashboards.get_or_load(
+        (str(tenant_id), country_code),
+        lambda: compute_tenant_realtime_dashboard(db, tenant_id, country_code)
+    )
+
+    return {
+        **dashboard,
+        "cache_ttl_seconds": _realtime_dashboards.ttl_seconds,
+        "updated_at": datetime.now(timezone.utc)
+    }
+
+
+def compute_tenant_realtime_dashboard(db: Session, tenant_id, country_code: str = None):
+    """
+    Two statements: one for the KPIs (scalar subqueries over a shared
+    tenant/country user scope) and one for today's top games.
     """
-    today = datetime.now(timezone.utc).date()
     now = datetime.now(timezone.utc)
+    today_start = datetime.combine(now.date(), datetime.min.time(), tzinfo=timezone.utc)
     thirty_days_ago = now - timedelta(days=30)
 
+    # Users of the tenant (and country) every KPI is scoped to
+    scope = select(User.user_id, User.role_id, User.created_at).where(User.tenant_id == tenant_id)
+    if country_code:
+        scope = scope.where(User.country_code == country_code)
+    scope = scope.cte("scope")
+
+    scope_wallets = (
+        select(Wallet.wallet_id)
+        .where(Wallet.player_id.in_(select(scope.c.user_id)))
+        .cte("scope_wallets")
+    )
+
     # 1. Resolve Currency Symbol
-    current_symbol = "₹" 
+    symbol = null()
     if country_code:
-        curr_row = db.query(Currency.symbol).join(TenantCountry, TenantCountry.currency_code == Currency.currency_code)\
-            .filter(TenantCountry.tenant_id == tenant_id, TenantCountry.country_code == country_code).first()
-        if curr_row:
-            current_symbol = curr_row[0]
-
-    # --- 2. FINANCIAL KPIs (Today) ---
-    # We join Wallet and User here to cover both tenant_id and country_code in one join
-    financials_query = db.query(
-        func.coalesce(func.sum(Bet.bet_amount), 0).label("total_bets"),
-        func.coalesce(func.sum(Bet.win_amount), 0).label("total_wins")
-    ).join(Wallet, Bet.wallet_id == Wallet.wallet_id)\
-     .join(User, Wallet.player_id == User.user_id)\
-     .filter(User.tenant_id == tenant_id)\
-     .filter(Bet.placed_at >= today)
-
-    if country_code and country_code.strip():
-        financials_query = financials_query.filter(User.country_code == country_code)
-
-    financials = financials_query.first()
-    t_bets = float(financials.total_bets)
-    t_wins = float(financials.total_wins)
-    ggr = t_bets - t_wins
-    actual_rtp = round((t_wins / t_bets * 100), 2) if t_bets > 0 else 0.0
+        symbol = (
+            select(Currency.symbol)
+            .join(TenantCountry, TenantCountry.currency_code == Currency.currency_code)
+            .where(
+                TenantCountry.tenant_id == tenant_id,
+                TenantCountry.country_code == country_code
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
 
-    # --- 3. STRATEGIC AUDIT ---
-    
-    # LTV: Deposits - Completed Withdrawals
-    deposits_query = db.query(func.coalesce(func.sum(WalletTransaction.amount), 0))\
-        .join(Wallet, WalletTransaction.wallet_id == Wallet.wallet_id)\
-        .join(User, Wallet.player_id == User.user_id)\
-        .join(TransactionType, WalletTransaction.transaction_type_id == TransactionType.transaction_type_id)\
-        .filter(User.tenant_id == tenant_id, TransactionType.transaction_code == 'DEPOSIT')
-    
-    if country_code and country_code.strip():
-        deposits_query = deposits_query.filter(User.country_code == country_code)
-    deposits_total = float(deposits_query.scalar() or 0)
+    # 2. Financial KPIs (Today)
+    bets_today = (
+        select(
+            func.coalesce(func.sum(Bet.bet_amount), 0).label("total_bets"),
+            func.coalesce(func.sum(Bet.win_amount), 0).label("total_wins")
+        )
+        .where(
+            Bet.tenant_id == tenant_id,
+            Bet.placed_at >= today_start
+        )
+    )
+    if country_code:
+        bets_today = bets_today.where(Bet.player_id.in_(select(scope.c.user_id)))
+    bets_today = bets_today.cte("bets_today")
+
+    # 3. Strategic audit: LTV = deposits - completed withdrawals
+    deposits_total = (
+        select(func.coalesce(func.sum(WalletTransaction.amount), 0))
+        .where(
+            WalletTransaction.wallet_id.in_(select(scope_wallets.c.wallet_id)),
+            WalletTransaction.transaction_type_id == get_transaction_type_id(db, "DEPOSIT")
+        )
+        .scalar_subquery()
+    )
 
-    payouts_query = db.query(func.coalesce(func.sum(Withdrawal.amount), 0))\
-        .join(User, Withdrawal.player_id == User.user_id)\
-        .filter(User.tenant_id == tenant_id, Withdrawal.status == 'completed')
-    
-    if country_code and country_code.strip():
-        payouts_query = payouts_query.filter(User.country_code == country_code)
-    payouts_total = float(payouts_query.scalar() or 0)
-    
-    ltv_total = deposits_total - payouts_total
+    payouts_total = (
+        select(func.coalesce(func.sum(Withdrawal.amount), 0))
+        .where(
+            Withdrawal.player_id.in_(select(scope.c.user_id)),
+            Withdrawal.status == "completed"
+        )
+        .scalar_subquery()
+    )
 
-    # Inactive Players (Task 3e)
-    
-    active_player_ids = select(GameSession.player_id).filter(GameSession.started_at >= thirty_days_ago)
-    inactive_query = db.query(func.count(User.user_id)).filter(
-        User.tenant_id == tenant_id,
-        User.role_id == 1,
-        ~User.user_id.in_(active_player_ids)
+    # Inactive players: no session in the last 30 days
+    inactive_count = (
+        select(func.count())
+        .select_from(scope)
+        .where(
+            scope.c.role_id == 1,
+            ~exists().where(
+                GameSession.player_id == scope.c.user_id,
+                GameSession.started_at >= thirty_days_ago
+            )
+        )
+        .scalar_subquery()
     )
-    if country_code and country_code.strip():
-        inactive_query = inactive_query.filter(User.country_code == country_code)
-    inactive_count = inactive_query.scalar()
-
-    # Stale Withdrawals
-    stale_count = db.query(func.count(Withdrawal.withdrawal_id)).filter(
-        Withdrawal.tenant_id == tenant_id, 
-        Withdrawal.status == 'requested',
-        Withdrawal.requested_at <= (now - timedelta(days=3))
-    ).scalar()
 
-    # 4. LIVE ENGAGEMENT 
-    sessions_query = db.query(func.count(GameSession.session_id))\
-        .join(User, GameSession.player_id == User.user_id)\
-        .filter(User.tenant_id == tenant_id, GameSession.status == 'active')
-    if country_code and country_code.strip():
-        sessions_query = sessions_query.filter(User.country_code == country_code)
-    active_sessions = sessions_query.scalar()
-
-    new_regs_query = db.query(func.count(User.user_id)).filter(
-        User.tenant_id == tenant_id, 
-        func.date(User.created_at) == today
+    stale_count = (
+        select(func.count(Withdrawal.withdrawal_id))
+        .where(
+            Withdrawal.tenant_id == tenant_id,
+            Withdrawal.status == "requested",
+            Withdrawal.requested_at <= now - timedelta(days=3)
+        )
+        .scalar_subquery()
     )
-    if country_code and country_code.strip():
-        new_regs_query = new_regs_query.filter(User.country_code == country_code)
-    new_regs = new_regs_query.scalar()
-
-  
-    raffle_query = db.query(func.coalesce(func.sum(RaffleEntry.amount_paid), 0))\
-        .join(User, RaffleEntry.player_id == User.user_id)\
-        .filter(User.tenant_id == tenant_id, func.date(RaffleEntry.created_at) == today)
-    if country_code and country_code.strip():
-        raffle_query = raffle_query.filter(User.country_code == country_code)
-    raffle_sales = float(raffle_query.scalar() or 0)
-
-    # --- 5. TOP GAMES ---
-    game_stats_query = db.query(
-        Game.game_id, Game.game_name,
-        func.coalesce(func.sum(Bet.bet_amount), 0).label("gbets"),
-        func.coalesce(func.sum(Bet.win_amount), 0).label("gwins"),
-        func.count(func.distinct(GameSession.player_id)).label("players")
-    ).join(GameSession, Game.game_id == GameSession.game_id)\
-     .join(User, GameSession.player_id == User.user_id)\
-     .join(GameRound, GameSession.session_id == GameRound.session_id)\
-     .join(Bet, GameRound.round_id == Bet.round_id)\
-     .filter(User.tenant_id == tenant_id, Bet.placed_at >= today)
-
-    if country_code and country_code.strip():
-        game_stats_query = game_stats_query.filter(User.country_code == country_code)
-
-    game_rows = game_stats_query.group_by(Game.game_id, Game.game_name).all()
-
-
-    # --- Task 3f: Bonus Utilization (Calculation) ---
-    
-    # 1. Count Total Bonuses ever started (all statuses)
-    total_granted_query = db.query(func.count(BonusUsage.bonus_usage_id))\
-        .join(User, BonusUsage.player_id == User.user_id)\
-        .filter(User.tenant_id == tenant_id)
-    
-    if country_code and country_code.strip():
-        total_granted_query = total_granted_query.filter(User.country_code == country_code)
-    
-    total_granted = total_granted_query.scalar() or 0
 
-    # 2. Count only 'completed' bonuses
-    total_completed_query = db.query(func.count(BonusUsage.bonus_usage_id))\
-        .join(User, BonusUsage.player_id == User.user_id)\
-        .filter(User.tenant_id == tenant_id, BonusUsage.status == 'completed')
+    # 4. Live engagement
+    active_sessions = (
+        select(func.count(GameSession.session_id))
+        .where(
+            GameSession.player_id.in_(select(scope.c.user_id)),
+            GameSession.status == "active"
+        )
+        .scalar_subquery()
+    )
 
-    if country_code and country_code.strip():
-        total_completed_query = total_completed_query.filter(User.country_code == country_code)
-    
-    total_completed = total_completed_query.scalar() or 0
+    new_regs = (
+        select(func.count())
+        .select_from(scope)
+        .where(scope.c.created_at >= today_start)
+        .scalar_subquery()
+    )
 
-    # 3. Calculate Percentage
-    bonus_rate = round((total_completed / total_granted * 100), 2) if total_granted > 0 else 0.0
+    raffle_sales = (
+        select(func.coalesce(func.sum(RaffleEntry.amount_paid), 0))
+        .where(
+            RaffleEntry.player_id.in_(select(scope.c.user_id)),
+            RaffleEntry.created_at >= today_start
+        )
+        .scalar_subquery()
+    )
 
-    
-       
+    # 5. Bonus utilization: completed / all granted
+    bonuses = (
+        select(
+            func.count(BonusUsage.bonus_usage_id).label("granted"),
+            func.count(BonusUsage.bonus_usage_id)
+            .filter(BonusUsage.status == "completed")
+            .label("completed")
+        )
+        .where(BonusUsage.player_id.in_(select(scope.c.user_id)))
+        .cte("bonuses")
+    )
+
+    kpis = db.execute(
+        select(
+            symbol.label("currency_symbol"),
+            bets_today.c.total_bets,
+            bets_today.c.total_wins,
+            deposits_total.label("deposits_total"),
+            payouts_total.label("payouts_total"),
+            inactive_count.label("inactive_count"),
+            stale_count.label("stale_count"),
+            active_sessions.label("active_sessions"),
+            new_regs.label("new_regs"),
+            raffle_sales.label("raffle_sales"),
+            bonuses.c.granted,
+            bonuses.c.completed
+        )
+        .select_from(bets_today)
+        .join(bonuses, true())
+    ).one()
+
+    # 6. Top games (today)
+    top_games = (
+        select(
+            Game.game_id,
+            Game.game_name,
+            func.coalesce(func.sum(Bet.bet_amount), 0).label("gbets"),
+            func.coalesce(func.sum(Bet.win_amount), 0).label("gwins"),
+            func.count(func.distinct(Bet.player_id)).label("players")
+        )
+        .select_from(Bet)
+        .join(Game, Game.game_id == Bet.game_id)
+        .where(
+            Bet.tenant_id == tenant_id,
+            Bet.placed_at >= today_start
+        )
+        .group_by(Game.game_id, Game.game_name)
+    )
+    if country_code:
+        top_games = top_games.where(Bet.player_id.in_(select(scope.c.user_id)))
+
+    game_rows = db.execute(top_games).all()
+
+    t_bets = float(kpis.total_bets)
+    t_wins = float(kpis.total_wins)
+    ggr = t_bets - t_wins
+    actual_rtp = round((t_wins / t_bets * 100), 2) if t_bets > 0 else 0.0
+
+    bonus_rate = (
+        round((kpis.completed / kpis.granted * 100), 2)
+        if kpis.granted > 0 else 0.0
+    )
 
     return {
         "kpis": {
@@ -363,12 +424,12 @@ def get_tenant_realtime_dashboard(db: Session, tenant_id: str, country_code: str
             "total_wins": t_wins,
             "ggr": ggr,
             "actual_rtp": actual_rtp,
-            "active_sessions": active_sessions,
-            "new_registrations_today": new_regs,
-            "total_raffle_sales_today": raffle_sales,
-            "stale_withdrawals_count": stale_count,
-            "player_ltv_total": ltv_total,
-            "inactive_players_30d": inactive_count or 0,
+            "active_sessions": kpis.active_sessions,
+            "new_registrations_today": kpis.new_regs,
+            "total_raffle_sales_today": float(kpis.raffle_sales),
+            "stale_withdrawals_count": kpis.stale_count,
+            "player_ltv_total": float(kpis.deposits_total) - float(kpis.payouts_total),
+            "inactive_players_30d": kpis.inactive_count or 0,
             "bonus_utilization_rate": bonus_rate,
             "active_bonuses_value": 0.0
         },
@@ -381,6 +442,6 @@ def get_tenant_realtime_dashboard(db: Session, tenant_id: str, country_code: str
                 "unique_players": g.players
             } for g in game_rows
         ],
-        "currency_symbol": current_symbol,
-        "updated_at": datetime.now(timezone.utc)
-    }
\ No newline at end of file
+        "currency_symbol": kpis.currency_symbol or "₹",
+        "computed_at": now
+    }
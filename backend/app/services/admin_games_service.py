@@ -4,6 +4,8 @@ from app.models.game import Game
 from app.models.tenant_game import TenantGame
 from app.models.game_provider import GameProvider
 from app.core.audit import log_audit
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
+from app.services.game_catalog_service import invalidate_game_catalog
 
 from datetime import datetime, timezone 
 
@@ -70,6 +72,8 @@ def update_tenant_game_config(db: Session, tenant_id, game_id, payload, actor_us
 
     
     db.commit()
+    invalidate_tenant_eligibility(tenant_id)
+    invalidate_game_catalog(tenant_id)
     
     
     log_audit(
@@ -6,6 +6,7 @@ from app.models.kyc_document import KYCDocument
 from app.models.player import Player
 from app.models.user import User
 from app.services.notification_service import send_notification
+from app.services.game_eligibility_service import invalidate_player_eligibility
 
 def admin_process_kyc(
     db: Session,
@@ -99,6 +100,7 @@ def admin_process_kyc(
         raise HTTPException(status_code=400, detail="Invalid action")
 
     db.commit()
+    invalidate_player_eligibility(player.player_id)
 
     return {
         "document_id": kyc.document_id,
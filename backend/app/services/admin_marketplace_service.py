@@ -1,5 +1,4 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import exists, and_
 from fastapi import HTTPException
 from app.models.game import Game
 from app.models.game_provider import GameProvider
@@ -7,52 +6,8 @@ from app.models.tenant_game import TenantGame
 from app.models.tenant_provider import TenantProvider
 from app.models.provider_access_request import ProviderAccessRequest
 from app.core.audit import log_audit
-
-def get_marketplace_catalog(db: Session, tenant_id):
-    results = db.query(
-        Game,
-        GameProvider.provider_name,
-        GameProvider.provider_id,
-        # Check if game is already enabled for tenant
-        exists().where(
-            and_(
-                TenantGame.game_id == Game.game_id, 
-                TenantGame.tenant_id == tenant_id,
-                TenantGame.is_active == True
-            )
-        ).label("is_enabled"),
-        # Check if tenant has contract with provider
-        exists().where(
-            and_(
-                TenantProvider.provider_id == Game.provider_id,
-                TenantProvider.tenant_id == tenant_id,
-                TenantProvider.is_active == True
-            )
-        ).label("has_contract")
-    ).join(GameProvider, Game.provider_id == GameProvider.provider_id)\
-     .filter(Game.is_active == True)\
-     .all()
-
-    response = []
-    for game, provider_name, provider_id, is_enabled, has_contract in results:
-        status = "LOCKED"
-        if is_enabled:
-            status = "ENABLED"
-        elif has_contract:
-            status = "AVAILABLE"
-        
-        response.append({
-            "game_id": game.game_id,
-            "game_name": game.game_name,
-            "game_code": game.game_code,
-            "provider_name": provider_name,
-            "provider_id": provider_id, 
-            "rtp": float(game.rtp_percentage) if game.rtp_percentage else None,
-            "status": status
-        })
-    
-    return response
-
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
+from app.services.game_catalog_service import invalidate_game_catalog
 
 def add_game_to_library(db: Session, tenant_id, data, actor_user):
     game = db.query(Game).filter(Game.game_id == data.game_id).first()
@@ -103,6 +58,8 @@ def add_game_to_library(db: Session, tenant_id, data, actor_user):
         db.add(new_tg)
 
     db.commit()
+    invalidate_tenant_eligibility(tenant_id)
+    invalidate_game_catalog(tenant_id)
     
     log_audit(
         db=db,
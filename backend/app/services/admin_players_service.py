@@ -12,6 +12,7 @@ from app.models.bet import Bet
 from app.models.responsible_limit import ResponsibleLimit
 from app.models.wallet_type import WalletType
 from app.models.currency import Currency
+from app.services.game_eligibility_service import invalidate_player_eligibility
 
 
 ALLOWED_STATUSES = {"active", "suspended", "self_excluded", "closed"}
@@ -68,6 +69,7 @@ def update_player_status(db: Session, tenant_id, player_id, status: str):
 
     player.status = status
     db.commit()
+    invalidate_player_eligibility(player.player_id)
     db.refresh(player)
 
     return player
@@ -142,9 +144,7 @@ def get_player_summary(db: Session, tenant_id, player_id):
             func.coalesce(func.sum(Bet.bet_amount), 0),
             func.coalesce(func.sum(Bet.win_amount), 0)
         )
-        .join(GameRound)
-        .join(GameSession)
-        .filter(GameSession.player_id == player_id)
+        .filter(Bet.player_id == player_id)
         .first()
     )
 
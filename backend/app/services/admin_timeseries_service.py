@@ -1,9 +1,8 @@
 
 from datetime import date, timedelta, datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from app.models.analytics_snapshot import AnalyticsSnapshot
+from app.services.analytics_rollup_service import get_combined_timeseries
 
 
 def resolve_date_range(range_days, start_date, end_date):
@@ -22,25 +21,7 @@ def resolve_date_range(range_days, start_date, end_date):
 def get_games_timeseries(db: Session, tenant_id, range_days=None, start_date=None, end_date=None):
     start, end = resolve_date_range(range_days, start_date, end_date)
 
-    rows = (
-        db.query(
-            AnalyticsSnapshot.snapshot_date.label("date"),
-            func.sum(AnalyticsSnapshot.total_bets).label("total_bets"),
-            func.sum(AnalyticsSnapshot.total_wins).label("total_wins"),
-            func.sum(AnalyticsSnapshot.ggr).label("ggr"),
-            func.sum(AnalyticsSnapshot.total_players).label("total_players"),
-            func.sum(AnalyticsSnapshot.active_players).label("active_players"),
-        )
-        .filter(
-            AnalyticsSnapshot.tenant_id == tenant_id,
-            AnalyticsSnapshot.snapshot_date.between(start, end)
-        )
-        .group_by(AnalyticsSnapshot.snapshot_date)
-        .order_by(AnalyticsSnapshot.snapshot_date)
-        .all()
-    )
-
-    return rows
+    return get_combined_timeseries(db, start, end, tenant_id=tenant_id)
 
 
 def get_single_game_timeseries(
@@ -53,22 +34,4 @@ def get_single_game_timeseries(
 ):
     start, end = resolve_date_range(range_days, start_date, end_date)
 
-    rows = (
-        db.query(
-            AnalyticsSnapshot.snapshot_date.label("date"),
-            AnalyticsSnapshot.total_bets,
-            AnalyticsSnapshot.total_wins,
-            AnalyticsSnapshot.ggr,
-            AnalyticsSnapshot.total_players,
-            AnalyticsSnapshot.active_players,
-        )
-        .filter(
-            AnalyticsSnapshot.tenant_id == tenant_id,
-            AnalyticsSnapshot.game_id == game_id,
-            AnalyticsSnapshot.snapshot_date.between(start, end)
-        )
-        .order_by(AnalyticsSnapshot.snapshot_date)
-        .all()
-    )
-
-    return rows
\ No newline at end of file
+    return get_combined_timeseries(db, start, end, tenant_id=tenant_id, game_id=game_id)
@@ -5,9 +5,8 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from sqlalchemy import desc 
 from app.models.withdrawal import Withdrawal
-from app.models.wallet import Wallet
-from app.models.wallet_transaction import WalletTransaction
-from app.models.transaction_type import TransactionType
+from app.core.reference_data import get_transaction_type_id
+from app.services.wallet_ledger_service import LedgerEntry, credit_wallet
 from app.models.user import User 
 from app.models.currency import Currency
 from app.services.notification_service import send_notification
@@ -102,48 +101,24 @@ def admin_process_withdrawal(
                 detail="Rejection reason required"
             )
 
-        # Lock wallet
-        wallet = (
-            db.query(Wallet)
-            .filter(Wallet.wallet_id == withdrawal.wallet_id)
-            .with_for_update()
-            .first()
-        )
-
-        if not wallet:
-            raise HTTPException(
-                status_code=500,
-                detail="Wallet not found for withdrawal"
+        # Refund the wallet and write the ledger row in one statement
+        refund = credit_wallet(
+            db,
+            withdrawal.wallet_id,
+            Decimal(withdrawal.amount),
+            LedgerEntry(
+                transaction_type_id=get_transaction_type_id(db, "WITHDRAWAL_REFUND"),
+                reference_type="WITHDRAWAL_REFUND",
+                reference_id=withdrawal.withdrawal_id
             )
-
-        refund_txn_type = (
-            db.query(TransactionType)
-            .filter(TransactionType.transaction_code == "WITHDRAWAL_REFUND")
-            .first()
         )
 
-        if not refund_txn_type:
+        if not refund:
             raise HTTPException(
                 status_code=500,
-                detail="WITHDRAWAL_REFUND transaction type missing"
+                detail="Wallet not found for withdrawal"
             )
 
-        refund_amount = Decimal(withdrawal.amount)
-        balance_before = wallet.balance
-        balance_after = balance_before + refund_amount
-
-        refund_txn = WalletTransaction(
-            wallet_id=wallet.wallet_id,
-            transaction_type_id=refund_txn_type.transaction_type_id,
-            amount=refund_amount,
-            balance_before=balance_before,
-            balance_after=balance_after,
-            reference_type="WITHDRAWAL_REFUND",
-            reference_id=withdrawal.withdrawal_id
-            # created_at handled by DB server_default=func.now()
-        )
-
-        wallet.balance = balance_after
         withdrawal.status = "rejected"
         withdrawal.rejection_reason = rejection_reason
         
@@ -156,8 +131,6 @@ def admin_process_withdrawal(
         
         withdrawal.processed_at = now
 
-        db.add(refund_txn)
-
     else:
         raise HTTPException(status_code=400, detail="Invalid action")
 
@@ -0,0 +1,285 @@
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, distinct, cast, Date
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.models.analytics_hourly import AnalyticsHourly
+from app.models.analytics_snapshot import AnalyticsSnapshot
+from app.models.analytics_watermark import AnalyticsWatermark
+from app.models.bet import Bet
+
+
+# Hourly rollup tier.
+#
+# refresh_hourly_rollup() re-aggregates only the hours touched since the last
+# watermark (the current hour plus a small grace for late commits) and upserts
+# them, so each run reads minutes of bets rather than the whole day.
+#
+# get_combined_timeseries() serves charts from closed daily snapshots plus
+# hourly buckets for every tenant/day that has no snapshot yet (normally just
+# today), and returns hourly points for ranges of 48 hours or less that fall
+# inside the hourly retention window.
+
+HOURLY_ROLLUP_JOB = "hourly_rollup"
+
+# First run backfills this far so 48h hourly views work immediately
+HOURLY_BACKFILL = timedelta(days=2)
+
+# Bets are stamped before their transaction commits
+LATE_ARRIVAL_GRACE = timedelta(minutes=2)
+
+HOURLY_MAX_DAYS = 2
+
+
+def floor_hour(at: datetime):
+    return at.replace(minute=0, second=0, microsecond=0)
+
+
+def utc_hour(column):
+    # date_trunc on a timestamptz follows the session time zone; pin it to UTC
+    return func.timezone("UTC", func.date_trunc("hour", func.timezone("UTC", column)))
+
+
+def utc_day(column):
+    return cast(func.timezone("UTC", column), Date)
+
+
+# Watermarks
+
+def get_watermark(db: Session, job_name: str):
+    return (
+        db.query(AnalyticsWatermark.watermark)
+        .filter(AnalyticsWatermark.job_name == job_name)
+        .scalar()
+    )
+
+
+def set_watermark(db: Session, job_name: str, watermark: datetime):
+    db.execute(
+        pg_insert(AnalyticsWatermark)
+        .values(job_name=job_name, watermark=watermark)
+        .on_conflict_do_update(
+            index_elements=[AnalyticsWatermark.job_name],
+            set_={"watermark": watermark, "updated_at": func.now()}
+        )
+    )
+
+
+# Incremental rollup
+
+def refresh_hourly_rollup(db: Session):
+    """
+    Recomputes every hourly bucket from the watermark's hour up to now
+    and advances the watermark. Safe to rerun.
+    """
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc)
+
+    watermark = get_watermark(db, HOURLY_ROLLUP_JOB) or (now - HOURLY_BACKFILL)
+    window_start = floor_hour(watermark - LATE_ARRIVAL_GRACE)
+
+    bucket = utc_hour(Bet.placed_at).label("bucket_start")
+
+    hourly = (
+        select(
+            Bet.tenant_id,
+            Bet.game_id,
+            bucket,
+            func.count(Bet.bet_id),
+            func.coalesce(func.sum(Bet.bet_amount), 0),
+            func.coalesce(func.sum(Bet.win_amount), 0),
+            func.count(distinct(Bet.player_id))
+        )
+        .where(
+            Bet.placed_at >= window_start,
+            Bet.placed_at < now
+        )
+        .group_by(Bet.tenant_id, Bet.game_id, bucket)
+    )
+
+    upsert = pg_insert(AnalyticsHourly).from_select(
+        [
+            "tenant_id", "game_id", "bucket_start", "bet_count",
+            "total_bets", "total_wins", "active_players"
+        ],
+        hourly
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[
+            AnalyticsHourly.tenant_id,
+            AnalyticsHourly.game_id,
+            AnalyticsHourly.bucket_start
+        ],
+        set_={
+            "bet_count": upsert.excluded.bet_count,
+            "total_bets": upsert.excluded.total_bets,
+            "total_wins": upsert.excluded.total_wins,
+            "active_players": upsert.excluded.active_players,
+            "updated_at": func.now()
+        }
+    )
+
+    buckets = db.execute(upsert).rowcount
+    set_watermark(db, HOURLY_ROLLUP_JOB, now)
+    db.commit()
+
+    return {
+        "window_start": window_start,
+        "watermark": now,
+        "buckets_written": buckets,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+    }
+
+
+def prune_hourly_rollup(db: Session, retention_days: int):
+    cutoff = floor_hour(datetime.now(timezone.utc)) - timedelta(days=retention_days)
+
+    deleted = (
+        db.query(AnalyticsHourly)
+        .filter(AnalyticsHourly.bucket_start < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+# Timeseries
+
+def timeseries_point(day: date, hour, bets, wins, players):
+    bets = bets or Decimal("0")
+    wins = wins or Decimal("0")
+    return {
+        "date": day,
+        "hour": hour,
+        "total_bets": bets,
+        "total_wins": wins,
+        "ggr": bets - wins,
+        "total_players": players or 0,
+        "active_players": players or 0
+    }
+
+
+def hourly_filters(query, start: date, end: date, tenant_id=None, game_id=None):
+    query = query.filter(
+        AnalyticsHourly.bucket_start >= datetime.combine(start, datetime.min.time(), tzinfo=timezone.utc),
+        AnalyticsHourly.bucket_start < datetime.combine(end + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+    )
+    if tenant_id is not None:
+        query = query.filter(AnalyticsHourly.tenant_id == tenant_id)
+    if game_id is not None:
+        query = query.filter(AnalyticsHourly.game_id == game_id)
+    return query
+
+
+def get_hourly_timeseries(db: Session, start: date, end: date, tenant_id=None, game_id=None):
+    rows = (
+        hourly_filters(
+            db.query(
+                AnalyticsHourly.bucket_start,
+                func.sum(AnalyticsHourly.total_bets).label("total_bets"),
+                func.sum(AnalyticsHourly.total_wins).label("total_wins"),
+                func.sum(AnalyticsHourly.active_players).label("active_players")
+            ),
+            start, end, tenant_id, game_id
+        )
+        .group_by(AnalyticsHourly.bucket_start)
+        .order_by(AnalyticsHourly.bucket_start)
+        .all()
+    )
+
+    return [
+        timeseries_point(
+            r.bucket_start.astimezone(timezone.utc).date(), r.bucket_start,
+            r.total_bets, r.total_wins, r.active_players
+        )
+        for r in rows
+    ]
+
+
+def get_daily_timeseries(db: Session, start: date, end: date, tenant_id=None, game_id=None):
+    query = db.query(
+        AnalyticsSnapshot.snapshot_date,
+        func.sum(AnalyticsSnapshot.total_bets).label("total_bets"),
+        func.sum(AnalyticsSnapshot.total_wins).label("total_wins"),
+        func.sum(AnalyticsSnapshot.active_players).label("active_players")
+    ).filter(AnalyticsSnapshot.snapshot_date.between(start, end))
+
+    if tenant_id is not None:
+        query = query.filter(AnalyticsSnapshot.tenant_id == tenant_id)
+    if game_id is not None:
+        query = query.filter(AnalyticsSnapshot.game_id == game_id)
+
+    # Snapshot jobs run per tenant/day, so a day can be closed for some
+    # tenants and still open for others (or missing in between).
+    totals = defaultdict(lambda: [Decimal("0"), Decimal("0"), 0])
+    snapshotted = set()
+    for r in query.group_by(AnalyticsSnapshot.snapshot_date, AnalyticsSnapshot.tenant_id).all():
+        snapshotted.add((r.snapshot_date, r.tenant_id))
+        totals[r.snapshot_date][0] += r.total_bets or 0
+        totals[r.snapshot_date][1] += r.total_wins or 0
+        totals[r.snapshot_date][2] += r.active_players or 0
+
+    # Every tenant/day without a snapshot comes from the hourly buckets.
+    # Distinct players cannot be added across hours; the busiest hour
+    # per game is used until the day's snapshot closes it.
+    per_game = (
+        hourly_filters(
+            db.query(
+                utc_day(AnalyticsHourly.bucket_start).label("day"),
+                AnalyticsHourly.tenant_id,
+                AnalyticsHourly.game_id,
+                func.sum(AnalyticsHourly.total_bets).label("total_bets"),
+                func.sum(AnalyticsHourly.total_wins).label("total_wins"),
+                func.max(AnalyticsHourly.active_players).label("active_players")
+            ),
+            start, end, tenant_id, game_id
+        )
+        .group_by("day", AnalyticsHourly.tenant_id, AnalyticsHourly.game_id)
+        .all()
+    )
+
+    for r in per_game:
+        if (r.day, r.tenant_id) in snapshotted:
+            continue
+        totals[r.day][0] += r.total_bets
+        totals[r.day][1] += r.total_wins
+        totals[r.day][2] += r.active_players
+
+    return [
+        timeseries_point(day, None, bets, wins, players)
+        for day, (bets, wins, players) in sorted(totals.items())
+    ]
+
+
+def hourly_window_start(db: Session) -> date:
+    """
+    First UTC day fully covered by analytics_hourly: the retention cutoff,
+    or the earliest bucket while the table is still filling up.
+    """
+    today = datetime.now(timezone.utc).date()
+    retained_from = today - timedelta(days=settings.HOURLY_ROLLUP_RETENTION_DAYS - 1)
+
+    earliest = db.query(func.min(AnalyticsHourly.bucket_start)).scalar()
+    if earliest is None:
+        return today + timedelta(days=1)
+
+    # A partially covered first day does not count
+    first_full_day = (earliest.astimezone(timezone.utc) - timedelta(microseconds=1)).date() + timedelta(days=1)
+
+    return max(retained_from, first_full_day)
+
+
+def get_combined_timeseries(db: Session, start: date, end: date, tenant_id=None, game_id=None):
+    """
+    Hourly points when the range covers 48 hours or less and is still held
+    in analytics_hourly, daily otherwise.
+    """
+    if (end - start).days + 1 <= HOURLY_MAX_DAYS and start >= hourly_window_start(db):
+        return get_hourly_timeseries(db, start, end, tenant_id, game_id)
+
+    return get_daily_timeseries(db, start, end, tenant_id, game_id)
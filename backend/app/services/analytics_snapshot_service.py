@@ -1,121 +1,177 @@
-from datetime import date, datetime, timezone
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct
+from sqlalchemy import func, distinct, select, insert, delete, case
 
 from app.models.analytics_snapshot import AnalyticsSnapshot
 from app.models.game_session import GameSession
-from app.models.game_round import GameRound
 from app.models.bet import Bet
+from app.models.tenant import Tenant
 from app.models.tenant_game import TenantGame
 from app.models.game import Game
 
 
-def generate_daily_snapshot(
-    db: Session,
-    tenant_id,
-    snapshot_date: date | None = None
-):
-    
-    if snapshot_date is None:
-        snapshot_date = datetime.now(timezone.utc).date()
+# Daily snapshot engine.
+#
+# One grouped aggregate computes every (tenant, game) row for the day, for a
+# single tenant or for all active tenants at once, and the rows are replaced
+# in bulk. Day bounds are a half-open UTC range [day, day + 1) so the
+# started_at / placed_at indexes can be used.
+#
+# Game-level rows have country_code NULL, which the unique constraint treats
+# as distinct, so ON CONFLICT cannot target them; the day's rows are deleted
+# and re-inserted in the same transaction instead, which keeps reruns idempotent.
 
-    #  Only games ENABLED for tenant
-    tenant_games = (
-        db.query(TenantGame)
-        .filter(
-            TenantGame.tenant_id == tenant_id,
-            TenantGame.is_active.is_(True)
-        )
-        .all()
-    )
 
-    results = []
+def day_bounds(snapshot_date: date):
+    start = datetime.combine(snapshot_date, dt_time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
 
-    for tg in tenant_games:
-        game_id = tg.game_id
 
-        game = db.query(Game).filter(Game.game_id == game_id).first()
-        if not game:
-            continue
+def snapshot_rows_query(snapshot_date: date, tenant_id=None):
+    start, end = day_bounds(snapshot_date)
 
-        # Sessions (func.date handles TIMESTAMPTZ correctly based on UTC session)
-        total_sessions = (
-            db.query(func.count(GameSession.session_id))
-            .filter(
-                GameSession.game_id == game_id,
-                GameSession.tenant_id == tenant_id,
-                func.date(GameSession.started_at) == snapshot_date
-            )
-            .scalar()
+    # Sessions and players, keyed by session start
+    session_stats = (
+        select(
+            GameSession.tenant_id,
+            GameSession.game_id,
+            func.count(GameSession.session_id).label("total_sessions"),
+            func.count(distinct(GameSession.player_id)).label("total_players")
         )
-
-        # Rounds
-        total_rounds = (
-            db.query(func.count(GameRound.round_id))
-            .join(GameSession)
-            .filter(
-                GameSession.game_id == game_id,
-                GameSession.tenant_id == tenant_id,
-                func.date(GameSession.started_at) == snapshot_date
-            )
-            .scalar()
+        .where(
+            GameSession.started_at >= start,
+            GameSession.started_at < end
         )
+        .group_by(GameSession.tenant_id, GameSession.game_id)
+    )
 
-        # Bets & Wins
-        total_bets = (
-            db.query(func.coalesce(func.sum(Bet.bet_amount), 0))
-            .join(GameRound)
-            .join(GameSession)
-            .filter(
-                GameSession.game_id == game_id,
-                GameSession.tenant_id == tenant_id,
-                func.date(Bet.placed_at) == snapshot_date
-            )
-            .scalar()
+    # Bets & wins, keyed by bet placement
+    bet_stats = (
+        select(
+            Bet.tenant_id,
+            Bet.game_id,
+            func.count(Bet.bet_id).label("bet_count"),
+            func.sum(Bet.bet_amount).label("total_bets"),
+            func.sum(Bet.win_amount).label("total_wins")
+        )
+        .where(
+            Bet.placed_at >= start,
+            Bet.placed_at < end
         )
+        .group_by(Bet.tenant_id, Bet.game_id)
+    )
 
-        total_wins = (
-            db.query(func.coalesce(func.sum(Bet.win_amount), 0))
-            .join(GameRound)
-            .join(GameSession)
-            .filter(
-                GameSession.game_id == game_id,
-                GameSession.tenant_id == tenant_id,
-                func.date(Bet.placed_at) == snapshot_date
-            )
-            .scalar()
+    if tenant_id is not None:
+        session_stats = session_stats.where(GameSession.tenant_id == tenant_id)
+        bet_stats = bet_stats.where(Bet.tenant_id == tenant_id)
+
+    session_stats = session_stats.subquery("session_stats")
+    bet_stats = bet_stats.subquery("bet_stats")
+
+    total_bets = func.coalesce(bet_stats.c.total_bets, 0)
+    total_wins = func.coalesce(bet_stats.c.total_wins, 0)
+
+    query = (
+        select(
+            TenantGame.tenant_id,
+            TenantGame.game_id,
+            total_bets.label("total_bets"),
+            total_wins.label("total_wins"),
+            (total_bets - total_wins).label("ggr"),
+            case(
+                (total_bets > 0, func.round(total_wins / total_bets * 100, 2)),
+                else_=None
+            ).label("rtp_percentage"),
+            func.coalesce(session_stats.c.total_players, 0).label("total_players"),
+            func.coalesce(bet_stats.c.bet_count, 0).label("bet_count")
+        )
+        #  Only games ENABLED for tenant
+        .join(Game, Game.game_id == TenantGame.game_id)
+        .outerjoin(
+            session_stats,
+            (session_stats.c.tenant_id == TenantGame.tenant_id) &
+            (session_stats.c.game_id == TenantGame.game_id)
         )
+        .outerjoin(
+            bet_stats,
+            (bet_stats.c.tenant_id == TenantGame.tenant_id) &
+            (bet_stats.c.game_id == TenantGame.game_id)
+        )
+        .where(TenantGame.is_active.is_(True))
+    )
 
-        total_players = (
-            db.query(func.count(distinct(GameSession.player_id)))
-            .filter(
-                GameSession.game_id == game_id,
-                GameSession.tenant_id == tenant_id,
-                func.date(GameSession.started_at) == snapshot_date
-            )
-            .scalar()
+    if tenant_id is not None:
+        query = query.where(TenantGame.tenant_id == tenant_id)
+    else:
+        query = (
+            query
+            .join(Tenant, Tenant.tenant_id == TenantGame.tenant_id)
+            .where(Tenant.status == "active")
         )
 
-        ggr = total_bets - total_wins
-        rtp = (total_wins / total_bets * 100) if total_bets > 0 else None
-
-        snapshot = AnalyticsSnapshot(
-            snapshot_date=snapshot_date,
-            tenant_id=tenant_id,
-            game_id=game_id,
-            total_bets=total_bets,
-            total_wins=total_wins,
-            ggr=ggr,
-            rtp_percentage=round(rtp, 2) if rtp else None,
-            total_players=total_players,
-            active_players=total_players
+    return query
+
+
+def generate_daily_snapshot(
+    db: Session,
+    tenant_id=None,
+    snapshot_date: date | None = None
+):
+    """
+    Builds the game-level snapshot rows for one day.
+    With tenant_id=None every active tenant is processed in the same pass.
+    """
+    started = time.perf_counter()
+
+    if snapshot_date is None:
+        snapshot_date = datetime.now(timezone.utc).date()
+
+    rows = db.execute(snapshot_rows_query(snapshot_date, tenant_id)).all()
+
+    #  Replace the day's game-level rows in bulk
+    stale = (
+        delete(AnalyticsSnapshot)
+        .where(
+            AnalyticsSnapshot.snapshot_date == snapshot_date,
+            AnalyticsSnapshot.country_code.is_(None),
+            AnalyticsSnapshot.game_id.is_not(None)
+        )
+    )
+    if tenant_id is not None:
+        stale = stale.where(AnalyticsSnapshot.tenant_id == tenant_id)
+    else:
+        stale = stale.where(
+            AnalyticsSnapshot.tenant_id.in_({row.tenant_id for row in rows})
         )
 
-        db.merge(snapshot)
-        results.append(snapshot)
+    db.execute(stale.execution_options(synchronize_session=False))
+
+    if rows:
+        db.execute(
+            insert(AnalyticsSnapshot).values([
+                {
+                    "snapshot_date": snapshot_date,
+                    "tenant_id": row.tenant_id,
+                    "game_id": row.game_id,
+                    "total_bets": row.total_bets,
+                    "total_wins": row.total_wins,
+                    "ggr": row.ggr,
+                    "rtp_percentage": row.rtp_percentage,
+                    "total_players": row.total_players,
+                    "active_players": row.total_players
+                }
+                for row in rows
+            ])
+        )
 
     db.commit()
+
     return {
         "snapshot_date": snapshot_date,
-        "games_processed": len(results)
-    }
\ No newline at end of file
+        "tenants_processed": len({row.tenant_id for row in rows}),
+        "games_processed": len(rows),
+        "bets_processed": sum(row.bet_count for row in rows),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+    }
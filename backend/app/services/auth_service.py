@@ -1,13 +1,16 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.models.user import User
-from app.models.tenant import Tenant
-from app.core.security import verify_password, create_access_token
+from app.core.tenant_registry import find_tenant_by_domain
+from app.core.security import (
+    verify_password,
+    hash_password,
+    password_needs_rehash,
+    create_access_token
+)
 
 def login_user(db: Session, tenant_domain: str, email: str, password: str):
-    tenant = db.execute(
-        select(Tenant).where(Tenant.domain == tenant_domain)
-    ).scalar_one_or_none()
+    tenant = find_tenant_by_domain(db, tenant_domain)
 
     if not tenant:
         raise ValueError("Invalid tenant")
@@ -22,10 +25,16 @@ def login_user(db: Session, tenant_domain: str, email: str, password: str):
     if not user or not verify_password(password, user.password_hash):
         raise ValueError("Invalid credentials")
 
+    # Upgrade hashes made with an older bcrypt cost while we have the password
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        db.commit()
+
     token = create_access_token({
         "sub": str(user.user_id),
         "tenant_id": str(user.tenant_id),
-        "role_id": user.role_id
+        "role_id": user.role_id,
+        "ver": user.token_version
     })
 
     return token
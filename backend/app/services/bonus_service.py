@@ -1,15 +1,21 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc
+from sqlalchemy import func, and_, case, desc, select, update
 from fastapi import HTTPException
 
 from datetime import datetime, timezone, date
 from decimal import Decimal
 from app.models.bonus import Bonus
 from app.models.bonus_usage import BonusUsage
+from app.models.player import Player
 from app.models.wallet import Wallet
 from app.models.wallet_type import WalletType
-from app.models.wallet_transaction import WalletTransaction
-from app.models.transaction_type import TransactionType
+from app.core.reference_data import get_transaction_type_id, get_wallet_type_id
+from app.services.wallet_ledger_service import (
+    LedgerEntry,
+    credit_wallet,
+    debit_wallet,
+    wallet_lookup
+)
 
 def create_bonus_campaign(db: Session, tenant_id, data):
     new_bonus = Bonus(
@@ -71,11 +77,11 @@ def activate_bonus(db: Session, player_id: str, bonus_id: str):
     if now > bonus.valid_to:
         raise HTTPException(status_code=400, detail="This promotion has already expired")
 
-    # 3. Find and lock the player's BONUS wallet
-    bonus_wallet = db.query(Wallet).join(WalletType).filter(
+    # 3. Find the player's BONUS wallet
+    bonus_wallet = db.query(Wallet.wallet_id).join(WalletType).filter(
         Wallet.player_id == player_id,
         WalletType.wallet_type_code =="BONUS"
-    ).with_for_update().first()
+    ).first()
 
     if not bonus_wallet:
         raise HTTPException(status_code=400, detail="Bonus Wallet not initialized for this player")
@@ -95,63 +101,120 @@ def activate_bonus(db: Session, player_id: str, bonus_id: str):
     )
     
     # 5. Add the amount to the BONUS wallet balance
-    bonus_wallet.balance += Decimal(str(bonus.bonus_amount))
+    credit_wallet(db, bonus_wallet.wallet_id, Decimal(str(bonus.bonus_amount)))
+
+    # 6. Bets now go through wagering progress for this player
+    set_active_bonus_marker(db, player_id, True)
 
     db.add(new_usage)
     db.commit()
     db.refresh(new_usage)
     return new_usage
 
+def set_active_bonus_marker(db: Session, player_id, active: bool):
+    """
+    players.has_active_bonus is true while the player has an 'active' bonus;
+    settlement only calls update_wagering_progress() for those players.
+    """
+    db.execute(
+        update(Player)
+        .where(Player.player_id == player_id)
+        .values(has_active_bonus=active)
+    )
+
 def update_wagering_progress(db: Session, player_id: str, bet_amount: Decimal):
     """
-    Called by Game Services. Updates progress and handles hard expiry.
+    Called by Game Services. Adds the bet to the active bonus in one guarded
+    UPDATE and clears the player's marker once the bonus becomes claimable.
+    Overdue bonuses are left to expire_overdue_bonuses().
     """
-    
-    now = datetime.now(timezone.utc)
-    
-    usage = db.query(BonusUsage).filter(
-        BonusUsage.player_id == player_id,
-        BonusUsage.status == 'active'
-    ).with_for_update().first()
+    completed = func.coalesce(BonusUsage.wagering_completed, 0) + bet_amount
+
+    progressed = (
+        update(BonusUsage)
+        .where(
+            BonusUsage.player_id == player_id,
+            BonusUsage.status == 'active',
+            BonusUsage.expired_at > func.now()
+        )
+        .values(
+            wagering_completed=completed,
+            status=case(
+                (completed >= BonusUsage.wagering_required, 'claimable'),
+                else_='active'
+            )
+        )
+        .returning(BonusUsage.player_id, BonusUsage.status)
+        .cte("progressed")
+    )
+
+    db.execute(
+        update(Player)
+        .where(
+            Player.player_id.in_(
+                select(progressed.c.player_id).where(progressed.c.status == 'claimable')
+            )
+        )
+        .values(has_active_bonus=False)
+    )
 
-    if usage:
-        # Check if the deadline has passed
-        # Now both 'now' and 'usage.expired_at' are offset-aware
-        if now > usage.expired_at:
-            usage.status = 'expired'
-            bw = db.query(Wallet).filter(Wallet.wallet_id == usage.wallet_id).with_for_update().first()
-            if bw:
-                bw.balance -= usage.bonus_amount
-            db.flush()
-            return
-
-        # Update progress
-        usage.wagering_completed += bet_amount
-        if usage.wagering_completed >= usage.wagering_required:
-            usage.status = 'claimable'
-        db.flush()
-
-def cleanup_expired_bonuses(db: Session, player_id: str):
+def expire_overdue_bonuses(db: Session, player_id=None) -> int:
     """
-    Auto-expire bonuses that passed their deadline.
+    Expires every active bonus past its deadline (or only the given player's)
+    in one statement: marks the usages expired, removes the bonus amounts
+    from the BONUS wallets and clears the players' markers.
+    Returns the number of bonuses expired.
     """
-    now = datetime.now(timezone.utc)
-    
-    expired_items = db.query(BonusUsage).filter(
-        BonusUsage.player_id == player_id,
+    criteria = [
         BonusUsage.status == 'active',
-        BonusUsage.expired_at < now
-    ).all()
+        BonusUsage.expired_at < func.now()
+    ]
+    if player_id is not None:
+        criteria.append(BonusUsage.player_id == player_id)
 
-    for item in expired_items:
-        item.status = 'expired'
-        bw = db.query(Wallet).filter(Wallet.wallet_id == item.wallet_id).first()
-        if bw:
-            bw.balance -= item.bonus_amount
-    
-    if expired_items:
+    expired = (
+        update(BonusUsage)
+        .where(*criteria)
+        .values(status='expired')
+        .returning(BonusUsage.player_id, BonusUsage.wallet_id, BonusUsage.bonus_amount)
+        .cte("expired")
+    )
+
+    removed = (
+        select(expired.c.wallet_id, func.sum(expired.c.bonus_amount).label("amount"))
+        .group_by(expired.c.wallet_id)
+        .subquery("removed")
+    )
+
+    # Bonus funds may already have been wagered away, so no balance guard
+    debited = (
+        update(Wallet)
+        .where(Wallet.wallet_id == removed.c.wallet_id)
+        .values(balance=Wallet.balance - removed.c.amount, updated_at=func.now())
+        .returning(Wallet.wallet_id)
+        .cte("debited")
+    )
+
+    cleared = (
+        update(Player)
+        .where(Player.player_id.in_(select(expired.c.player_id)))
+        .values(has_active_bonus=False)
+        .returning(Player.player_id)
+        .cte("cleared")
+    )
+
+    count = db.execute(
+        select(func.count())
+        .select_from(expired)
+        .add_cte(debited)
+        .add_cte(cleared)
+    ).scalar_one()
+
+    if count:
         db.commit()
 
+    return count
+
 def claim_bonus_to_cash(db: Session, player_id: str, usage_id: str):
     usage = db.query(BonusUsage).filter(
         BonusUsage.bonus_usage_id == usage_id,
@@ -162,43 +225,38 @@ def claim_bonus_to_cash(db: Session, player_id: str, usage_id: str):
     if not usage:
         raise HTTPException(status_code=400, detail="Bonus not found or not ready to claim")
 
-    bonus_wallet = db.query(Wallet).filter(Wallet.wallet_id == usage.wallet_id).with_for_update().first()
-    cash_wallet = db.query(Wallet).join(WalletType).filter(
-        Wallet.player_id == player_id,
-        WalletType.wallet_type_code == "CASH"
-    ).with_for_update().first()
-
-    if not bonus_wallet or not cash_wallet:
-        raise HTTPException(status_code=500, detail="Wallet configuration error")
-
-    txn_type = db.query(TransactionType).filter_by(transaction_code="BONUS_CONVERSION").first()
     reward = Decimal(str(usage.bonus_amount))
-    
-    bonus_wallet.balance -= reward
-    cash_balance_before = cash_wallet.balance
-    cash_wallet.balance += reward
-    
-    transaction = WalletTransaction(
-        wallet_id=cash_wallet.wallet_id,
-        transaction_type_id=txn_type.transaction_type_id,
-        amount=reward,
-        balance_before=cash_balance_before,
-        balance_after=cash_wallet.balance,
-        reference_type="BONUS_CLAIM",
-        reference_id=usage.bonus_usage_id
+
+    # Move the reward from the BONUS wallet to CASH, one statement each
+    bonus_move = debit_wallet(db, usage.wallet_id, reward, allow_overdraft=True)
+    cash_move = credit_wallet(
+        db,
+        wallet_lookup(
+            Wallet.player_id == player_id,
+            Wallet.wallet_type_id == get_wallet_type_id(db, "CASH")
+        ),
+        reward,
+        LedgerEntry(
+            transaction_type_id=get_transaction_type_id(db, "BONUS_CONVERSION"),
+            reference_type="BONUS_CLAIM",
+            reference_id=usage.bonus_usage_id
+        )
     )
 
+    if not bonus_move or not cash_move:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Wallet configuration error")
+
     usage.status = 'completed'
     
     usage.completed_at = datetime.now(timezone.utc)
     
-    db.add(transaction)
     db.commit()
     
     return {
         "status": "success", 
         "claimed_amount": float(reward),
-        "new_cash_balance": float(cash_wallet.balance)
+        "new_cash_balance": float(cash_move.balance_after)
     }
 
 def cancel_bonus(db: Session, player_id: str, usage_id: str):
@@ -211,12 +269,8 @@ def cancel_bonus(db: Session, player_id: str, usage_id: str):
     if not usage:
         raise HTTPException(status_code=404, detail="Active challenge not found")
 
-    bonus_wallet = db.query(Wallet).filter(
-        Wallet.wallet_id == usage.wallet_id
-    ).with_for_update().first()
-    
-    if bonus_wallet:
-        bonus_wallet.balance -= usage.bonus_amount
+    debit_wallet(db, usage.wallet_id, usage.bonus_amount, allow_overdraft=True)
+    set_active_bonus_marker(db, player_id, False)
 
     usage.status = 'cancelled'
     db.commit()
@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.http_cache import CachedBody, build_cached_body
+from app.models.game import Game
+from app.models.game_category import GameCategory
+from app.models.game_provider import GameProvider
+from app.models.tenant_game import TenantGame
+from app.models.tenant_provider import TenantProvider
+
+
+# Per-tenant game catalogs: the player lobby (games enabled for the tenant,
+# with min/max bet overrides resolved) and the tenant admin marketplace.
+# Each entry keeps the serialized body and its ETag, so repeat visits are
+# answered with a 304 without touching the database. Tenant game,
+# marketplace, tenant provider and super game services call
+# invalidate_game_catalog() after they commit, so catalogs must be loaded
+# through the primary session (get_db), never a read replica.
+
+_lobby_catalogs = TTLCache(ttl_seconds=settings.GAME_CATALOG_TTL_SECONDS, max_entries=1000)
+_marketplace_catalogs = TTLCache(ttl_seconds=settings.GAME_CATALOG_TTL_SECONDS, max_entries=1000)
+
+
+@dataclass(frozen=True)
+class LobbyCatalog:
+    games: list[dict]
+    by_id: dict[str, dict]
+    cached: CachedBody
+
+
+
+# Cache loading
+
+def resolve_bet_limit(override, default):
+    return float(override if override is not None else default)
+
+
+def load_lobby_catalog(db: Session, tenant_id) -> LobbyCatalog:
+    rows = (
+        db.query(Game, GameCategory, TenantGame)
+        .join(TenantGame, TenantGame.game_id == Game.game_id)
+        .join(GameCategory, Game.category_id == GameCategory.category_id)
+        .filter(
+            TenantGame.tenant_id == tenant_id,
+            TenantGame.is_active.is_(True),
+            Game.is_active.is_(True)
+        )
+        .order_by(Game.created_at.desc())
+        .all()
+    )
+
+    games = [
+        {
+            "game_id": game.game_id,
+            "game_name": game.game_name,
+            "game_code": game.game_code,
+            "category": category.category_name if category else None,
+            "min_bet": resolve_bet_limit(tenant_game.min_bet_override, game.min_bet),
+            "max_bet": resolve_bet_limit(tenant_game.max_bet_override, game.max_bet),
+            "is_active": tenant_game.is_active
+        }
+        for game, category, tenant_game in rows
+    ]
+
+    return LobbyCatalog(
+        games=games,
+        by_id={str(g["game_id"]): g for g in games},
+        cached=build_cached_body(games)
+    )
+
+
+def load_marketplace_catalog(db: Session, tenant_id) -> CachedBody:
+    rows = (
+        db.query(Game, GameProvider.provider_name, GameProvider.provider_id)
+        .join(GameProvider, Game.provider_id == GameProvider.provider_id)
+        .filter(Game.is_active.is_(True))
+        .order_by(Game.created_at.desc())
+        .all()
+    )
+
+    enabled_game_ids = {
+        game_id
+        for (game_id,) in db.query(TenantGame.game_id).filter(
+            TenantGame.tenant_id == tenant_id,
+            TenantGame.is_active.is_(True)
+        )
+    }
+
+    contracted_provider_ids = {
+        provider_id
+        for (provider_id,) in db.query(TenantProvider.provider_id).filter(
+            TenantProvider.tenant_id == tenant_id,
+            TenantProvider.is_active.is_(True)
+        )
+    }
+
+    catalog = []
+    for game, provider_name, provider_id in rows:
+        status = "LOCKED"
+        if game.game_id in enabled_game_ids:
+            status = "ENABLED"
+        elif provider_id in contracted_provider_ids:
+            status = "AVAILABLE"
+
+        catalog.append({
+            "game_id": game.game_id,
+            "game_name": game.game_name,
+            "game_code": game.game_code,
+            "provider_name": provider_name,
+            "provider_id": provider_id,
+            "rtp": float(game.rtp_percentage) if game.rtp_percentage else None,
+            "status": status
+        })
+
+    return build_cached_body(catalog)
+
+
+def get_lobby_catalog(db: Session, tenant_id) -> LobbyCatalog:
+    return _lobby_catalogs.get_or_load(
+        str(tenant_id),
+        lambda: load_lobby_catalog(db, tenant_id)
+    )
+
+
+def get_marketplace_catalog_body(db: Session, tenant_id) -> CachedBody:
+    return _marketplace_catalogs.get_or_load(
+        str(tenant_id),
+        lambda: load_marketplace_catalog(db, tenant_id)
+    )
+
+
+
+# Invalidation hooks
+
+def invalidate_game_catalog(tenant_id=None):
+    """
+    Call after tenant games, tenant providers or global game/provider data change.
+    Without a tenant_id every tenant's catalogs are dropped.
+    """
+    if tenant_id is None:
+        _lobby_catalogs.clear()
+        _marketplace_catalogs.clear()
+    else:
+        _lobby_catalogs.invalidate(str(tenant_id))
+        _marketplace_catalogs.invalidate(str(tenant_id))
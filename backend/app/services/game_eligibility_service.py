@@ -1,5 +1,4 @@
-
-from datetime import date, datetime, timezone 
+from datetime import date, datetime, timezone
 
 from sqlalchemy.orm import Session
 from app.models.game import Game
@@ -10,132 +9,192 @@ from app.models.responsible_limit import ResponsibleLimit
 from app.models.game_country import GameCountry
 from app.models.game_currency import GameCurrency
 from app.models.wallet import Wallet
-from app.models.wallet_type import WalletType
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.reference_data import get_wallet_type_id
 
 
-def check_game_eligibility(
-    db: Session,
-    player_id,
-    tenant_id,
-    game_id
-):
-    # 1️Tenant-game validation (CRITICAL)
-    tenant_game = (
-        db.query(TenantGame)
+# Player context: status, KYC, exclusion, country, cash currency (per player)
+_player_contexts = TTLCache(ttl_seconds=settings.ELIGIBILITY_PLAYER_TTL_SECONDS)
+
+# Tenant matrix: game_id -> allowed countries / currencies (per tenant)
+_tenant_matrices = TTLCache(ttl_seconds=settings.ELIGIBILITY_TENANT_TTL_SECONDS, max_entries=1000)
+
+
+
+# Cache loading
+
+def load_player_context(db: Session, player_id, tenant_id):
+    row = (
+        db.query(
+            Player.status,
+            Player.kyc_status,
+            User.country_code,
+            ResponsibleLimit.self_exclusion_until,
+            Wallet.currency_id
+        )
+        .outerjoin(
+            User,
+            (User.user_id == Player.player_id) &
+            (User.tenant_id == tenant_id)
+        )
+        .outerjoin(ResponsibleLimit, ResponsibleLimit.player_id == Player.player_id)
+        .outerjoin(
+            Wallet,
+            (Wallet.player_id == Player.player_id) &
+            (Wallet.tenant_id == tenant_id) &
+            (Wallet.wallet_type_id == get_wallet_type_id(db, "CASH")) &
+            Wallet.is_active.is_(True)
+        )
+        .filter(Player.player_id == player_id)
+        .first()
+    )
+
+    if not row:
+        return {"exists": False}
+
+    return {
+        "exists": True,
+        "status": row.status,
+        "kyc_status": row.kyc_status,
+        "country_code": row.country_code,
+        "self_exclusion_until": row.self_exclusion_until,
+        "currency_id": row.currency_id
+    }
+
+
+def load_tenant_matrix(db: Session, tenant_id):
+    game_ids = [
+        game_id
+        for (game_id,) in db.query(TenantGame.game_id)
         .join(Game, Game.game_id == TenantGame.game_id)
         .filter(
             TenantGame.tenant_id == tenant_id,
-            TenantGame.game_id == game_id,
             TenantGame.is_active.is_(True),
             Game.is_active.is_(True)
         )
-        .first()
+        .all()
+    ]
+
+    matrix = {
+        game_id: {"countries": set(), "currencies": set()}
+        for game_id in game_ids
+    }
+
+    if not game_ids:
+        return matrix
+
+    for game_id, country_code in (
+        db.query(GameCountry.game_id, GameCountry.country_code)
+        .filter(
+            GameCountry.game_id.in_(game_ids),
+            GameCountry.is_allowed.is_(True)
+        )
+        .all()
+    ):
+        matrix[game_id]["countries"].add(country_code)
+
+    for game_id, currency_id in (
+        db.query(GameCurrency.game_id, GameCurrency.currency_id)
+        .filter(
+            GameCurrency.game_id.in_(game_ids),
+            GameCurrency.is_allowed.is_(True)
+        )
+        .all()
+    ):
+        matrix[game_id]["currencies"].add(currency_id)
+
+    return matrix
+
+
+def get_player_context(db: Session, player_id, tenant_id):
+    return _player_contexts.get_or_load(
+        (str(player_id), str(tenant_id)),
+        lambda: load_player_context(db, player_id, tenant_id)
     )
 
-    if not tenant_game:
+
+def get_tenant_matrix(db: Session, tenant_id):
+    return _tenant_matrices.get_or_load(
+        str(tenant_id),
+        lambda: load_tenant_matrix(db, tenant_id)
+    )
+
+
+
+# Invalidation hooks
+
+def invalidate_player_eligibility(player_id):
+    """
+    Call after a player's status, KYC, RG limits, country or wallet changes.
+    """
+    player_key = str(player_id)
+    _player_contexts.invalidate_where(lambda key: key[0] == player_key)
+
+
+def invalidate_tenant_eligibility(tenant_id=None):
+    """
+    Call after tenant game or game country/currency rules change.
+    Without a tenant_id every tenant matrix is dropped (global game rules).
+    """
+    if tenant_id is None:
+        _tenant_matrices.clear()
+    else:
+        _tenant_matrices.invalidate(str(tenant_id))
+
+
+
+# Evaluation
+
+def evaluate_eligibility(player, game_rules):
+    # 1️ Tenant-game validation (CRITICAL)
+    if game_rules is None:
         return {
             "eligible": False,
             "reason": "Game not enabled for this tenant"
         }
-    
-    # 2️ Player check
-    player = (
-        db.query(Player)
-        .filter(Player.player_id == player_id)
-        .first()
-    )
 
-    if not player:
+    # 2️ Player check
+    if not player["exists"]:
         return {"eligible": False, "reason": "Player not found"}
 
-    if player.status != "active":
+    if player["status"] != "active":
         return {
             "eligible": False,
             "reason": "Player account is not active"
         }
 
     # 3️ KYC check
-    if player.kyc_status != "verified":
+    if player["kyc_status"] != "verified":
         return {
             "eligible": False,
             "reason": "KYC verification required"
         }
 
     # 4️ Self-exclusion
-    limits = (
-        db.query(ResponsibleLimit)
-        .filter(ResponsibleLimit.player_id == player_id)
-        .first()
-    )
-
-    if limits and limits.self_exclusion_until:
-        
+    if player["self_exclusion_until"]:
         today = datetime.now(timezone.utc).date()
-        if limits.self_exclusion_until >= today:
+        if player["self_exclusion_until"] >= today:
             return {
                 "eligible": False,
                 "reason": "Player is self-excluded"
             }
 
-    # 5️ Player country (EXPLICIT USER QUERY)
-    user = (
-        db.query(User)
-        .filter(
-            User.user_id == player_id,
-            User.tenant_id == tenant_id
-        )
-        .first()
-    )
-
-    user_country = user.country_code if user else None
-
-    if user_country:
-        country_allowed = (
-            db.query(GameCountry)
-            .filter(
-                GameCountry.game_id == game_id,
-                GameCountry.country_code == user_country,
-                GameCountry.is_allowed.is_(True)
-            )
-            .first()
-        )
-
-        if not country_allowed:
-            return {
-                "eligible": False,
-                "reason": "Game not allowed in your country"
-            }
+    # 5️ Player country
+    if player["country_code"] and player["country_code"] not in game_rules["countries"]:
+        return {
+            "eligible": False,
+            "reason": "Game not allowed in your country"
+        }
 
     # 6️ Currency restriction (CASH wallet)
-    wallet = (
-        db.query(Wallet)
-        .join(WalletType)
-        .filter(
-            Wallet.player_id == player_id,
-            Wallet.tenant_id == tenant_id,
-            WalletType.wallet_type_code == "CASH",
-            Wallet.is_active.is_(True)
-        )
-        .first()
-    )
-
-    if not wallet:
+    if player["currency_id"] is None:
         return {
             "eligible": False,
             "reason": "Wallet not configured"
         }
 
-    currency_allowed = (
-        db.query(GameCurrency)
-        .filter(
-            GameCurrency.game_id == game_id,
-            GameCurrency.currency_id == wallet.currency_id,
-            GameCurrency.is_allowed.is_(True)
-        )
-        .first()
-    )
-
-    if not currency_allowed:
+    if player["currency_id"] not in game_rules["currencies"]:
         return {
             "eligible": False,
             "reason": "Game not available for your currency"
@@ -144,4 +203,33 @@ def check_game_eligibility(
     return {
         "eligible": True,
         "reason": None
-    }
\ No newline at end of file
+    }
+
+
+def check_game_eligibility(
+    db: Session,
+    player_id,
+    tenant_id,
+    game_id
+):
+    matrix = get_tenant_matrix(db, tenant_id)
+    player = get_player_context(db, player_id, tenant_id)
+
+    return evaluate_eligibility(player, matrix.get(game_id))
+
+
+def check_lobby_eligibility(
+    db: Session,
+    player_id,
+    tenant_id
+):
+    """
+    Eligibility for every game enabled for the tenant, in one call.
+    """
+    matrix = get_tenant_matrix(db, tenant_id)
+    player = get_player_context(db, player_id, tenant_id)
+
+    return [
+        {"game_id": game_id, **evaluate_eligibility(player, rules)}
+        for game_id, rules in matrix.items()
+    ]
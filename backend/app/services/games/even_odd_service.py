@@ -1,111 +1,58 @@
 import random
 from decimal import Decimal, ROUND_DOWN
 
-from datetime import datetime, date, timezone 
-
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from fastapi import HTTPException
 
-from app.models.wallet import Wallet
-from app.models.wallet_type import WalletType
-from app.models.wallet_transaction import WalletTransaction
-from app.models.transaction_type import TransactionType
-from app.models.game_session import GameSession
-from app.models.game_round import GameRound
-from app.models.bet import Bet
-from app.models.responsible_limit import ResponsibleLimit
-from app.models.game import Game
-from app.models.tenant_game import TenantGame
-from app.services.bonus_service import update_wagering_progress 
+from app.services.games.settlement_service import settle_round, settle_rounds
 
 
 # Utilities
 
-def get_txn_type(db: Session, code: str) -> TransactionType:
-    txn = (
-        db.query(TransactionType)
-        .filter(TransactionType.transaction_code == code)
-        .first()
-    )
-    if not txn:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Transaction type '{code}' not configured"
-        )
-    return txn
-
-
-def get_active_session(db: Session, player_id, game_id):
-    return (
-        db.query(GameSession)
-        .filter(
-            GameSession.player_id == player_id,
-            GameSession.game_id == game_id,
-            GameSession.status == "active"
-        )
-        .first()
-    )
-
-
-
-# Responsible Gaming
-
-def enforce_responsible_gaming(db: Session, player_id, bet_amount: Decimal):
-    limits = (
-        db.query(ResponsibleLimit)
-        .filter(ResponsibleLimit.player_id == player_id)
-        .first()
+def validate_even_odd_bet(bet_choice, amount):
+    bet_choice = bet_choice.upper()
+    amount = Decimal(str(amount)).quantize(
+        Decimal("0.01"), rounding=ROUND_DOWN
     )
 
-    if not limits:
-        return
+    if bet_choice not in ("EVEN", "ODD"):
+        raise HTTPException(400, "Invalid bet choice")
 
- 
-    now_utc = datetime.now(timezone.utc)
-    today = now_utc.date()
+    return bet_choice, amount
 
-    if limits.self_exclusion_until and limits.self_exclusion_until >= today:
-        raise HTTPException(
-            status_code=403,
-            detail="Player is self-excluded from betting"
-        )
 
-    daily_total = (
-        db.query(func.coalesce(func.sum(Bet.bet_amount), 0))
-        .join(GameRound)
-        .join(GameSession)
-        .filter(
-            GameSession.player_id == player_id,
-            func.date(Bet.placed_at) == today
-        )
-        .scalar()
-    )
+def even_odd_resolver(bet_choice):
+    def resolve_outcome(bet_amount: Decimal):
+        #  Roll
+        dice_roll = random.randint(1, 6)
+        outcome = "EVEN" if dice_roll % 2 == 0 else "ODD"
+        win = bet_choice == outcome
 
-    if limits.daily_bet_limit and daily_total + bet_amount > limits.daily_bet_limit:
-        raise HTTPException(
-            status_code=403,
-            detail="Daily betting limit exceeded"
-        )
+        return {
+            "outcome": f"{dice_roll} ({outcome})",
+            "dice_roll": dice_roll,
+            "parity": outcome,
+            "win": win,
+            "win_amount": (
+                bet_amount * Decimal("2.00")
+                if win else Decimal("0.00")
+            )
+        }
 
-    monthly_total = (
-        db.query(func.coalesce(func.sum(Bet.bet_amount), 0))
-        .join(GameRound)
-        .join(GameSession)
-        .filter(
-            GameSession.player_id == player_id,
-            func.date_part("month", Bet.placed_at) == now_utc.month,
-            func.date_part("year", Bet.placed_at) == now_utc.year
-        )
-        .scalar()
-    )
+    return resolve_outcome
 
-    if limits.monthly_bet_limit and monthly_total + bet_amount > limits.monthly_bet_limit:
-        raise HTTPException(
-            status_code=403,
-            detail="Monthly betting limit exceeded"
-        )
 
+def even_odd_round_result(bet_choice, result):
+    return {
+        "round_id": result["round_id"],
+        "dice_roll": result["dice_roll"],
+        "bet_choice": bet_choice,
+        "outcome": result["parity"],
+        "win": result["win"],
+        "win_amount": float(result["win_amount"]),
+        "bet_amount": float(result["bet_amount"]),
+        "balance_after": float(result["balance_after"])
+    }
 
 
 # EVEN–ODD GAME
@@ -118,181 +65,53 @@ def play_even_odd_round(
     bet_choice,
     amount
 ):
-    bet_choice = bet_choice.upper()
-    amount = Decimal(str(amount)).quantize(
-        Decimal("0.01"), rounding=ROUND_DOWN
-    )
-
-    if bet_choice not in ("EVEN", "ODD"):
-        raise HTTPException(400, "Invalid bet choice")
-
-    if amount <= 0:
-        raise HTTPException(400, "Bet amount must be > 0")
-
-    #  Active session required
-    session = get_active_session(db, player_id, game_id)
-    if not session:
-        raise HTTPException(
-            status_code=400,
-            detail="No active game session. Start session first."
-        )
-
-    #  Tenant-game validation
-    tenant_game = (
-        db.query(TenantGame)
-        .join(Game, Game.game_id == TenantGame.game_id)
-        .filter(
-            TenantGame.tenant_id == tenant_id,
-            TenantGame.game_id == game_id,
-            TenantGame.is_active.is_(True),
-            Game.is_active.is_(True)
-        )
-        .first()
-    )
-
-    if not tenant_game:
-        raise HTTPException(
-            status_code=403,
-            detail="Game not enabled for this tenant"
-        )
-
-    game = (
-        db.query(Game)
-        .filter(Game.game_id == game_id)
-        .first()
-    )
-
-    # Apply tenant overrides
-    min_bet = (
-        tenant_game.min_bet_override
-        if tenant_game.min_bet_override is not None
-        else game.min_bet
-    )
-
-    max_bet = (
-        tenant_game.max_bet_override
-        if tenant_game.max_bet_override is not None
-        else game.max_bet
-    )
-
-    if min_bet is not None and amount < min_bet:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Minimum bet is {min_bet}"
-        )
-
-    if max_bet is not None and amount > max_bet:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Maximum bet is {max_bet}"
-        )
-
-    #  Responsible Gaming
-    enforce_responsible_gaming(db, player_id, amount)
-
-    #  Lock CASH wallet
-    wallet = (
-        db.query(Wallet)
-        .join(WalletType)
-        .filter(
-            Wallet.player_id == player_id,
-            Wallet.tenant_id == tenant_id,
-            WalletType.wallet_type_code == "CASH",
-            Wallet.is_active.is_(True)
-        )
-        .with_for_update()
-        .first()
-    )
-
-    if not wallet:
-        raise HTTPException(404, "Cash wallet not found")
-
-    if wallet.balance < amount:
-        raise HTTPException(400, "Insufficient balance")
-
-    
-    now_aware = datetime.now(timezone.utc)
-
-    #  Create round
-    round_number = (
-        db.query(func.count(GameRound.round_id))
-        .filter(GameRound.session_id == session.session_id)
-        .scalar()
-    ) + 1
-
-    game_round = GameRound(
-        session_id=session.session_id,
-        round_number=round_number,
-        started_at=now_aware
+    bet_choice, amount = validate_even_odd_bet(bet_choice, amount)
+
+    result = settle_round(
+        db,
+        player_id=player_id,
+        tenant_id=tenant_id,
+        game_id=game_id,
+        amount=amount,
+        resolve_outcome=even_odd_resolver(bet_choice),
+        reference_prefix="EVEN_ODD"
     )
-    db.add(game_round)
-    db.flush()
 
-    #  Roll
-    dice_roll = random.randint(1, 6)
-    outcome = "EVEN" if dice_roll % 2 == 0 else "ODD"
-    win = bet_choice == outcome
-    win_amount = (
-        amount * Decimal("2.00")
-        if win else Decimal("0.00")
-    )
+    return {
+        "session_id": result["session_id"],
+        **even_odd_round_result(bet_choice, result)
+    }
 
-    balance_before = wallet.balance
-    balance_after = balance_before - amount + win_amount
-    wallet.balance = balance_after
 
-    #  Bet record
-    bet = Bet(
-        round_id=game_round.round_id,
-        wallet_id=wallet.wallet_id,
-        bet_currency_id=wallet.currency_id,
-        bet_amount=amount,
-        win_amount=win_amount,
-        bet_status="settled",
-        settled_at=now_aware
+def play_even_odd_batch(
+    db: Session,
+    player_id,
+    tenant_id,
+    game_id,
+    bet_choice,
+    amount,
+    rounds: int
+):
+    bet_choice, amount = validate_even_odd_bet(bet_choice, amount)
+
+    batch = settle_rounds(
+        db,
+        player_id=player_id,
+        tenant_id=tenant_id,
+        game_id=game_id,
+        amount=amount,
+        rounds=rounds,
+        resolve_outcome=even_odd_resolver(bet_choice),
+        reference_prefix="EVEN_ODD"
     )
-    db.add(bet)
-    db.flush()
-
-    # bonus wagering progress
-    update_wagering_progress(db, player_id, amount)
-
-    #  Transactions
-    db.add(WalletTransaction(
-        wallet_id=wallet.wallet_id,
-        transaction_type_id=get_txn_type(db, "BET").transaction_type_id,
-        amount=-amount,
-        balance_before=balance_before,
-        balance_after=balance_before - amount,
-        reference_type="EVEN_ODD_BET",
-        reference_id=bet.bet_id
-    ))
-
-    if win:
-        db.add(WalletTransaction(
-            wallet_id=wallet.wallet_id,
-            transaction_type_id=get_txn_type(db, "WIN").transaction_type_id,
-            amount=win_amount,
-            balance_before=balance_before - amount,
-            balance_after=balance_after,
-            reference_type="EVEN_ODD_WIN",
-            reference_id=bet.bet_id
-        ))
-
-    #  Finalize
-    game_round.outcome = f"{dice_roll} ({outcome})"
-    game_round.ended_at = datetime.now(timezone.utc)
-
-    db.commit()
 
     return {
-        "session_id": session.session_id,
-        "round_id": game_round.round_id,
-        "dice_roll": dice_roll,
-        "bet_choice": bet_choice,
-        "outcome": outcome,
-        "win": win,
-        "win_amount": float(win_amount),
-        "bet_amount": float(amount),
-        "balance_after": float(balance_after)
-    }
\ No newline at end of file
+        "session_id": batch["session_id"],
+        "rounds": [even_odd_round_result(bet_choice, r) for r in batch["rounds"]],
+        "rounds_requested": batch["rounds_requested"],
+        "rounds_played": batch["rounds_played"],
+        "stop_reason": batch["stop_reason"],
+        "total_bet": float(batch["total_bet"]),
+        "total_win": float(batch["total_win"]),
+        "balance_after": float(batch["balance_after"])
+    }
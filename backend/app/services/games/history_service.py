@@ -2,20 +2,31 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from sqlalchemy import desc
 
-from datetime import datetime, timezone 
+from datetime import datetime, timedelta, timezone 
 
 from app.models.game_session import GameSession
 from app.models.game_round import GameRound
 from app.models.bet import Bet
 from app.models.game import Game
+from app.core.pagination import keyset_page, DEFAULT_PAGE_SIZE
 
 
-def get_player_sessions(db: Session, player_id):
+# Rounds and bets are partitioned by month; bounding them by the session's
+# start lets Postgres skip the older partitions. The grace covers clock
+# skew between the app (session start) and the database (round start).
+SESSION_CLOCK_GRACE = timedelta(minutes=5)
+
+
+def session_window_start(session: GameSession):
+    return session.started_at - SESSION_CLOCK_GRACE
+
+
+def get_player_sessions(db: Session, player_id, cursor: str = None, limit: int = DEFAULT_PAGE_SIZE):
     """
-    Fetches all game sessions for a player.
+    Fetches one page of a player's game sessions, newest first.
     Started_at is now a timezone-aware datetime.
     """
-    rows = (
+    query = (
         db.query(
             GameSession.session_id,
             GameSession.game_id,
@@ -26,11 +37,17 @@ def get_player_sessions(db: Session, player_id):
         )
         .join(Game, Game.game_id == GameSession.game_id)
         .filter(GameSession.player_id == player_id)
-        .order_by(desc(GameSession.started_at)) 
-        .all()
     )
 
-    return [
+    rows, next_cursor = keyset_page(
+        query,
+        GameSession.started_at,
+        GameSession.session_id,
+        cursor,
+        limit
+    )
+
+    items = [
         {
             "session_id": r.session_id,
             "game_id": r.game_id,
@@ -42,6 +59,8 @@ def get_player_sessions(db: Session, player_id):
         for r in rows
     ]
 
+    return {"items": items, "next_cursor": next_cursor}
+
 
 def get_session_rounds(db: Session, session_id, player_id):
     """
@@ -59,7 +78,11 @@ def get_session_rounds(db: Session, session_id, player_id):
     rows = (
         db.query(GameRound, Bet)
         .join(Bet, Bet.round_id == GameRound.round_id)
-        .filter(GameRound.session_id == session_id)
+        .filter(
+            GameRound.session_id == session_id,
+            GameRound.started_at >= session_window_start(session),
+            Bet.placed_at >= session_window_start(session)
+        )
         .order_by(desc(GameRound.round_number))
         .all()
     )
@@ -120,8 +143,10 @@ def get_session_bets(db: Session, session_id, player_id):
 
     return (
         db.query(Bet)
-        .join(GameRound, GameRound.round_id == Bet.round_id)
-        .filter(GameRound.session_id == session_id)
+        .filter(
+            Bet.session_id == session_id,
+            Bet.placed_at >= session_window_start(session)
+        )
         .order_by(desc(Bet.placed_at))
         .all()
     )
\ No newline at end of file
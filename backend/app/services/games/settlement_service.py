@@ -0,0 +1,522 @@
+import uuid
+from decimal import Decimal
+
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+from sqlalchemy import Integer, column, insert, select, true, update, values
+from fastapi import HTTPException
+
+from app.models.wallet import Wallet
+from app.models.wallet_transaction import WalletTransaction
+from app.models.game_session import GameSession
+from app.models.game_round import GameRound
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.tenant_game import TenantGame
+from app.models.player import Player
+from app.services.bonus_service import update_wagering_progress
+from app.services.responsible_gaming_service import (
+    load_limits_with_usage,
+    wager_limit_breach,
+    build_wager_upsert
+)
+from app.core.reference_data import get_transaction_type_id, get_wallet_type_id
+from app.services.wallet_ledger_service import build_balance_update
+
+
+# Shared settlement engine for the instant games.
+#
+# A round (or a batch of autoplay rounds) is settled with a fixed number of
+# statements regardless of game or batch size:
+#   1. one SELECT loading session, tenant game, bet limits and the CASH wallet
+#   2. one keyed read of the responsible gaming limits and usage
+#   3. one WITH (claim round numbers, guarded wallet UPDATE, INSERT rounds,
+#      INSERT bets, INSERT txns, UPSERT wager ledger) statement
+#   4. the bonus wagering update (only for players flagged has_active_bonus)
+#      and the COMMIT
+#
+# The wallet is not locked up front. The UPDATE in step 3 only applies while
+# the balance still covers the batch (see wallet_ledger_service); when a
+# concurrent debit got there first the transaction is rolled back and the
+# batch is settled again from a fresh read, with the outcomes already drawn
+# for the request (a retry never re-rolls them).
+#
+# Games only supply an outcome function:
+#   resolve_outcome(amount: Decimal) -> {
+#       "outcome": str,          # stored on game_rounds.outcome
+#       "win": bool,
+#       "win_amount": Decimal,
+#       ...                      # any extra keys are passed back to the caller
+#   }
+
+
+# Error texts the games returned before they shared this engine. Clients
+# match on them, so a game keeps its own wording where it differed.
+NO_SESSION_DETAIL = {
+    "COIN_TOSS": "No active game session"
+}
+DEFAULT_NO_SESSION_DETAIL = "No active game session. Start session first."
+
+LIMIT_BREACH_DETAIL = {
+    ("EVEN_ODD", "Player is self-excluded"): "Player is self-excluded from betting"
+}
+
+
+# Utilities
+
+def get_active_session(db: Session, player_id, game_id):
+    return (
+        db.query(GameSession)
+        .filter(
+            GameSession.player_id == player_id,
+            GameSession.game_id == game_id,
+            GameSession.status == "active"
+        )
+        .first()
+    )
+
+
+# Settlement context
+
+def load_settlement_context(db: Session, player_id, tenant_id, game_id):
+    """
+    Loads everything a round needs in one statement (the CASH wallet is read, not locked).
+    Returns None when any piece is missing; callers then use
+    raise_settlement_context_error() to report which one.
+    """
+    return db.execute(
+        select(
+            GameSession.session_id,
+            TenantGame.min_bet_override,
+            TenantGame.max_bet_override,
+            Game.min_bet,
+            Game.max_bet,
+            Wallet.wallet_id,
+            Wallet.currency_id,
+            Wallet.balance,
+            Player.has_active_bonus,
+        )
+        .select_from(GameSession)
+        .join(Player, Player.player_id == GameSession.player_id)
+        .join(
+            TenantGame,
+            (TenantGame.game_id == GameSession.game_id) &
+            (TenantGame.tenant_id == tenant_id) &
+            TenantGame.is_active.is_(True)
+        )
+        .join(
+            Game,
+            (Game.game_id == TenantGame.game_id) &
+            Game.is_active.is_(True)
+        )
+        .join(
+            Wallet,
+            (Wallet.player_id == GameSession.player_id) &
+            (Wallet.tenant_id == tenant_id) &
+            (Wallet.wallet_type_id == get_wallet_type_id(db, "CASH")) &
+            Wallet.is_active.is_(True)
+        )
+        .where(
+            GameSession.player_id == player_id,
+            GameSession.game_id == game_id,
+            GameSession.status == "active"
+        )
+        .limit(1)
+    ).first()
+
+
+def raise_settlement_context_error(db: Session, player_id, tenant_id, game_id, reference_prefix: str):
+    """
+    Slow path, only reached when the context query found nothing.
+    Re-runs the individual checks to raise the matching error.
+    """
+    if not get_active_session(db, player_id, game_id):
+        raise HTTPException(
+            status_code=400,
+            detail=NO_SESSION_DETAIL.get(reference_prefix, DEFAULT_NO_SESSION_DETAIL)
+        )
+
+    tenant_game = (
+        db.query(TenantGame)
+        .join(Game, Game.game_id == TenantGame.game_id)
+        .filter(
+            TenantGame.tenant_id == tenant_id,
+            TenantGame.game_id == game_id,
+            TenantGame.is_active.is_(True),
+            Game.is_active.is_(True)
+        )
+        .first()
+    )
+
+    if not tenant_game:
+        raise HTTPException(
+            status_code=403,
+            detail="Game not enabled for this tenant"
+        )
+
+    raise HTTPException(status_code=404, detail="Cash wallet not found")
+
+
+def resolve_bet_limits(ctx):
+    min_bet = (
+        ctx.min_bet_override
+        if ctx.min_bet_override is not None
+        else ctx.min_bet
+    )
+
+    max_bet = (
+        ctx.max_bet_override
+        if ctx.max_bet_override is not None
+        else ctx.max_bet
+    )
+
+    return min_bet, max_bet
+
+
+# Settlement
+
+# Attempts before giving up on a wallet whose balance keeps changing under the batch
+SETTLEMENT_ATTEMPTS = 3
+
+
+def settle_rounds(
+    db: Session,
+    player_id,
+    tenant_id,
+    game_id,
+    amount: Decimal,
+    rounds: int,
+    resolve_outcome,
+    reference_prefix: str
+):
+    """
+    Validates, settles and commits up to `rounds` rounds of an instant game
+    in one transaction. Stops early on a limit breach or insufficient balance;
+    if not even the first round can be played the matching error is raised.
+    reference_prefix names the wallet transactions, e.g. "DICE" -> DICE_BET / DICE_WIN.
+    """
+    if amount <= 0:
+        raise HTTPException(400, "Bet amount must be > 0")
+
+    # Drawn once per request; every attempt settles these same outcomes
+    outcomes = [resolve_outcome(amount) for _ in range(rounds)]
+
+    for _ in range(SETTLEMENT_ATTEMPTS):
+        batch = try_settle_rounds(
+            db,
+            player_id=player_id,
+            tenant_id=tenant_id,
+            game_id=game_id,
+            amount=amount,
+            outcomes=outcomes,
+            reference_prefix=reference_prefix
+        )
+        if batch:
+            return batch
+
+        # The balance dropped below what the batch needs since it was read
+        db.rollback()
+
+    raise HTTPException(409, "Wallet balance changed during the bet, please retry")
+
+
+def try_settle_rounds(
+    db: Session,
+    player_id,
+    tenant_id,
+    game_id,
+    amount: Decimal,
+    outcomes: list,
+    reference_prefix: str
+):
+    """
+    One settlement attempt over the pre-drawn `outcomes`, one per round.
+    Returns None, with nothing committed, when the wallet no longer covers
+    the batch by the time it is written.
+    """
+    rounds = len(outcomes)
+
+    #  Session, tenant game, overrides and CASH wallet
+    ctx = load_settlement_context(db, player_id, tenant_id, game_id)
+    if not ctx:
+        raise_settlement_context_error(db, player_id, tenant_id, game_id, reference_prefix)
+
+    min_bet, max_bet = resolve_bet_limits(ctx)
+
+    if min_bet is not None and amount < min_bet:
+        raise HTTPException(400, f"Minimum bet is {min_bet}")
+
+    if max_bet is not None and amount > max_bet:
+        raise HTTPException(400, f"Maximum bet is {max_bet}")
+
+    #  Responsible gaming limits and current usage (one keyed read). The
+    #  limits row is locked so concurrent bets of a limited player are
+    #  checked one after the other.
+    limits, daily_total, monthly_total = (
+        load_limits_with_usage(db, player_id, lock=True) or (None, 0, 0)
+    )
+
+    balance_before = ctx.balance
+    balance = balance_before
+    wagered = Decimal("0.00")
+    settled = []
+    stop = None
+
+    for result in outcomes:
+        breach = wager_limit_breach(
+            limits, daily_total + wagered, monthly_total + wagered, amount
+        )
+        if breach:
+            stop = (403, LIMIT_BREACH_DETAIL.get((reference_prefix, breach), breach))
+            break
+
+        if balance < amount:
+            stop = (400, "Insufficient balance")
+            break
+
+        #  Outcome
+        win = result["win"]
+        win_amount = result["win_amount"] if win else Decimal("0.00")
+
+        round_balance_before = balance
+        balance = balance - amount + win_amount
+        wagered += amount
+
+        settled.append({
+            **result,
+            "round_id": uuid.uuid4(),
+            "bet_id": uuid.uuid4(),
+            "win": win,
+            "win_amount": win_amount,
+            "bet_amount": amount,
+            "balance_before": round_balance_before,
+            "balance_after": balance
+        })
+
+    if not settled:
+        raise HTTPException(stop[0], stop[1])
+
+    new_balance = write_rounds(
+        db,
+        player_id=player_id,
+        tenant_id=tenant_id,
+        game_id=game_id,
+        session_id=ctx.session_id,
+        wallet_id=ctx.wallet_id,
+        currency_id=ctx.currency_id,
+        rounds=settled,
+        reference_prefix=reference_prefix
+    )
+
+    if new_balance is None:
+        return None
+
+    # Deposits may have landed since the read; report the balances as written
+    shift = new_balance - balance
+    if shift:
+        for r in settled:
+            r["balance_before"] += shift
+            r["balance_after"] += shift
+        balance_before += shift
+        balance = new_balance
+
+    # bonus wagering progress
+    if ctx.has_active_bonus:
+        update_wagering_progress(db, player_id, wagered)
+
+    db.commit()
+
+    return {
+        "session_id": ctx.session_id,
+        "rounds": settled,
+        "rounds_requested": rounds,
+        "rounds_played": len(settled),
+        "stop_reason": stop[1] if stop else None,
+        "total_bet": wagered,
+        "total_win": sum((r["win_amount"] for r in settled), Decimal("0.00")),
+        "balance_before": balance_before,
+        "balance_after": balance
+    }
+
+
+def settle_round(
+    db: Session,
+    player_id,
+    tenant_id,
+    game_id,
+    amount: Decimal,
+    resolve_outcome,
+    reference_prefix: str
+):
+    """
+    Validates, settles and commits one round of an instant game.
+    """
+    batch = settle_rounds(
+        db,
+        player_id=player_id,
+        tenant_id=tenant_id,
+        game_id=game_id,
+        amount=amount,
+        rounds=1,
+        resolve_outcome=resolve_outcome,
+        reference_prefix=reference_prefix
+    )
+
+    return {
+        **batch["rounds"][0],
+        "session_id": batch["session_id"]
+    }
+
+
+def write_rounds(
+    db: Session,
+    player_id,
+    tenant_id,
+    game_id,
+    session_id,
+    wallet_id,
+    currency_id,
+    rounds: list,
+    reference_prefix: str
+):
+    """
+    Writes the rounds, bets, BET/WIN transactions, wager ledger totals and
+    new wallet balance as a single statement of data-modifying CTEs.
+    Round numbers come from game_sessions.rounds_played, advanced by the
+    same statement, so concurrent requests never reuse a number.
+
+    The wallet UPDATE only matches while the balance covers every bet of the
+    batch, and the transactions take their balances from what it returns.
+    Returns the new balance, or None when the guard failed; the caller must
+    then roll back, as the other CTEs have still run.
+    """
+    now_aware = datetime.now(timezone.utc)
+    bet_type_id = get_transaction_type_id(db, "BET")
+    win_type_id = get_transaction_type_id(db, "WIN")
+
+    claimed_rounds = (
+        update(GameSession)
+        .where(GameSession.session_id == session_id)
+        .values(rounds_played=GameSession.rounds_played + len(rounds))
+        .returning(GameSession.rounds_played)
+        .cte("claimed_rounds")
+    )
+
+    # Counter value before this batch
+    rounds_played = (
+        select(claimed_rounds.c.rounds_played - len(rounds))
+        .scalar_subquery()
+    )
+
+    # Guarded wallet UPDATE: the balance must cover each bet at the point of
+    # the batch where it is placed
+    start_balance = rounds[0]["balance_before"]
+    net_change = rounds[-1]["balance_after"] - start_balance
+    required_balance = max(
+        start_balance - r["balance_before"] + r["bet_amount"] for r in rounds
+    )
+
+    moved = build_balance_update(wallet_id, net_change, required_balance).cte("moved")
+
+    round_rows = []
+    bet_rows = []
+    txn_rows = []
+
+    for i, r in enumerate(rounds, start=1):
+        balance_after_bet = r["balance_before"] - r["bet_amount"]
+
+        round_rows.append({
+            "round_id": r["round_id"],
+            "session_id": session_id,
+            "round_number": rounds_played + i,
+            "outcome": r["outcome"],
+            "started_at": now_aware,
+            "ended_at": now_aware
+        })
+
+        bet_rows.append({
+            "bet_id": r["bet_id"],
+            "round_id": r["round_id"],
+            "wallet_id": wallet_id,
+            "tenant_id": tenant_id,
+            "player_id": player_id,
+            "game_id": game_id,
+            "session_id": session_id,
+            "bet_currency_id": currency_id,
+            "bet_amount": r["bet_amount"],
+            "win_amount": r["win_amount"],
+            "bet_status": "settled",
+            "placed_at": now_aware,
+            "settled_at": now_aware
+        })
+
+        # Transaction balances as offsets from the balance before the batch
+        txn_rows.append((
+            uuid.uuid4(),
+            bet_type_id,
+            -r["bet_amount"],
+            r["balance_before"] - start_balance,
+            balance_after_bet - start_balance,
+            f"{reference_prefix}_BET",
+            r["bet_id"]
+        ))
+
+        if r["win_amount"] > 0:
+            txn_rows.append((
+                uuid.uuid4(),
+                win_type_id,
+                r["win_amount"],
+                balance_after_bet - start_balance,
+                r["balance_after"] - start_balance,
+                f"{reference_prefix}_WIN",
+                r["bet_id"]
+            ))
+
+    total_wagered = sum((r["bet_amount"] for r in rounds), Decimal("0.00"))
+
+    txn_values = values(
+        column("transaction_id", WalletTransaction.transaction_id.type),
+        column("transaction_type_id", Integer),
+        column("amount", WalletTransaction.amount.type),
+        column("before_offset", WalletTransaction.balance_before.type),
+        column("after_offset", WalletTransaction.balance_after.type),
+        column("reference_type", WalletTransaction.reference_type.type),
+        column("reference_id", WalletTransaction.reference_id.type),
+        name="txn_values"
+    ).data(txn_rows)
+
+    # Balance before the batch, as actually found by the guarded UPDATE
+    batch_start = moved.c.balance - net_change
+
+    new_rounds = insert(GameRound).values(round_rows).cte("new_rounds")
+    new_bets = insert(Bet).values(bet_rows).cte("new_bets")
+    new_txns = insert(WalletTransaction).from_select(
+        [
+            "transaction_id",
+            "wallet_id",
+            "transaction_type_id",
+            "amount",
+            "balance_before",
+            "balance_after",
+            "reference_type",
+            "reference_id"
+        ],
+        select(
+            txn_values.c.transaction_id,
+            moved.c.wallet_id,
+            txn_values.c.transaction_type_id,
+            txn_values.c.amount,
+            batch_start + txn_values.c.before_offset,
+            batch_start + txn_values.c.after_offset,
+            txn_values.c.reference_type,
+            txn_values.c.reference_id
+        )
+        .select_from(moved.join(txn_values, true()))
+    ).cte("new_txns")
+    wager_totals = build_wager_upsert(player_id, total_wagered, now_aware).cte("wager_totals")
+
+    return db.execute(
+        select(moved.c.balance)
+        .add_cte(claimed_rounds, new_rounds, new_bets, new_txns, wager_totals)
+    ).scalar_one_or_none()
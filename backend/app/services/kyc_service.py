@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from app.models.kyc_document import KYCDocument
 from app.models.player import Player
+from app.services.game_eligibility_service import invalidate_player_eligibility
 
 
 def upload_kyc_document(
@@ -85,6 +86,7 @@ def upload_kyc_document(
     player.kyc_verified_at = None
 
     db.commit()
+    invalidate_player_eligibility(player.player_id)
 
     return {
         "message": "KYC document uploaded successfully",
@@ -1,38 +1,31 @@
 from sqlalchemy.orm import Session
 
-from app.models.country import Country
-from app.models.currency import Currency
-from app.models.game_category import GameCategory
-from app.models.role import Role
+from app.core.reference_data import get_reference_data
 
 
 def get_countries(db: Session):
-    return (
-        db.query(Country)
-        .order_by(Country.country_name)
-        .all()
+    return sorted(
+        get_reference_data(db).countries.values(),
+        key=lambda c: c.country_name
     )
 
 
 def get_currencies(db: Session):
-    return (
-        db.query(Currency)
-        .order_by(Currency.currency_code)
-        .all()
+    return sorted(
+        get_reference_data(db).currencies.values(),
+        key=lambda c: c.currency_code
     )
 
 
 def get_game_categories(db: Session):
-    return (
-        db.query(GameCategory)
-        .order_by(GameCategory.category_name)
-        .all()
+    return sorted(
+        get_reference_data(db).game_categories.values(),
+        key=lambda g: g.category_name
     )
 
 
 def get_roles(db: Session):
-    return (
-        db.query(Role)
-        .order_by(Role.role_id)
-        .all()
+    return sorted(
+        get_reference_data(db).roles.values(),
+        key=lambda r: r.role_id
     )
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, literal
 from app.models.notification import Notification
 
 def send_notification(db: Session, user_id: str, title: str, message: str, notif_type: str):
@@ -9,4 +10,25 @@ def send_notification(db: Session, user_id: str, title: str, message: str, notif
         type=notif_type
     )
     db.add(new_notif)
-    # Note: No db.commit() here, we let the parent service handle the transaction
\ No newline at end of file
+    # Note: No db.commit() here, we let the parent service handle the transaction
+
+def send_bulk_notification(db: Session, user_ids, title: str, message: str, notif_type: str) -> int:
+    """
+    Sends the same notification to every user selected by `user_ids`
+    (a select() of user ids) with a single INSERT ... SELECT.
+    Like send_notification(), the caller commits.
+    """
+    user_ids = user_ids.subquery()
+    result = db.execute(
+        insert(Notification).from_select(
+            ["notification_id", "user_id", "title", "message", "type"],
+            user_ids.select().with_only_columns(
+                func.gen_random_uuid(),
+                *user_ids.c,
+                literal(title, Notification.title.type),
+                literal(message, Notification.message.type),
+                literal(notif_type, Notification.type.type)
+            )
+        )
+    )
+    return result.rowcount
\ No newline at end of file
@@ -0,0 +1,206 @@
+import gzip
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+
+# Monthly partitions of the time-series tables.
+#
+# migrations/006_partition_time_series.sql turns each table into a RANGE
+# partitioned table with one partition per UTC month named <table>_pYYYYMM.
+# ensure_future_partitions() keeps the next few months created ahead of
+# time; archive_cold_partitions() dumps months older than the archive
+# policy to gzipped CSV files and drops them from the database.
+#
+# Every worker process runs the scheduler, so maintenance is serialized
+# across processes with a Postgres advisory lock (partition_maintenance_lock).
+
+PARTITIONED_TABLES = {
+    "bets": "placed_at",
+    "game_rounds": "started_at",
+    "wallet_transactions": "created_at",
+}
+
+PARTITION_NAME = re.compile(r"^(?P<parent>[a-z_]+)_p(?P<year>\d{4})(?P<month>\d{2})$")
+
+# pg_try_advisory_lock key shared by every process running maintenance
+PARTITION_MAINTENANCE_LOCK_KEY = 7_260_213_006
+
+
+def month_start(day: date):
+    return day.replace(day=1)
+
+
+def add_months(day: date, months: int):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_month(partition_name: str):
+    match = PARTITION_NAME.match(partition_name)
+    if not match:
+        return None
+    return date(int(match["year"]), int(match["month"]), 1)
+
+
+@contextmanager
+def partition_maintenance_lock(engine: Engine):
+    """
+    Yields True when this process holds the maintenance advisory lock and
+    False when another process already does. The lock lives on its own
+    autocommit connection so the work session can commit freely, and is
+    released when the block exits (or the connection dies).
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"),
+            {"key": PARTITION_MAINTENANCE_LOCK_KEY}
+        ).scalar()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": PARTITION_MAINTENANCE_LOCK_KEY}
+                )
+
+
+def list_partitions(db: Session, parent: str):
+    """
+    Monthly partitions of `parent` as (name, month) pairs, oldest first.
+    The default partition is not included.
+    """
+    rows = db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": parent}
+    ).scalars().all()
+
+    partitions = [
+        (name, partition_month(name))
+        for name in rows
+        if partition_month(name) is not None
+    ]
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def ensure_future_partitions(db: Session, months_ahead: int):
+    """
+    Creates the current month and the next `months_ahead` months for every
+    partitioned table. Existing partitions are left alone.
+    Returns the names of the partitions created.
+    """
+    this_month = month_start(datetime.now(timezone.utc).date())
+    created = []
+
+    for parent in PARTITIONED_TABLES:
+        for offset in range(months_ahead + 1):
+            name = db.execute(
+                text("SELECT create_monthly_partition(:parent, :month)"),
+                {"parent": parent, "month": add_months(this_month, offset)}
+            ).scalar()
+            if name:
+                created.append(name)
+
+    db.commit()
+    return created
+
+
+def archive_partition(db: Session, parent: str, partition_name: str, archive_dir: str):
+    """
+    Writes one partition to <archive_dir>/<partition>.csv.gz, then detaches
+    and drops it. The file is fsynced and renamed into place before the
+    partition is dropped, so a failed dump leaves the data in the database.
+    The dump goes to a temp name unique to this process, so a concurrent
+    run can never write into or rename a half-written file.
+    """
+    if partition_month(partition_name) is None:
+        raise ValueError(f"Not a monthly partition: {partition_name}")
+    if not os.path.isabs(archive_dir):
+        raise ValueError(f"Archive directory must be absolute: {archive_dir}")
+
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"{partition_name}.csv.gz")
+    partial = f"{path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.partial"
+
+    cursor = db.connection().connection.cursor()
+    try:
+        with open(partial, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as archive:
+            cursor.copy_expert(
+                f'COPY "{partition_name}" TO STDOUT WITH (FORMAT csv, HEADER)',
+                archive
+            )
+            archive.flush()
+            raw.flush()
+            os.fsync(raw.fileno())
+    except Exception:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    finally:
+        cursor.close()
+
+    os.replace(partial, path)
+
+    db.execute(text(f'ALTER TABLE "{parent}" DETACH PARTITION "{partition_name}"'))
+    db.execute(text(f'DROP TABLE "{partition_name}"'))
+    db.commit()
+
+    return {
+        "partition": partition_name,
+        "file": path,
+        "bytes": os.path.getsize(path)
+    }
+
+
+def archive_cold_partitions(db: Session, archive_after_months: int, archive_dir: str):
+    """
+    Archives the monthly partitions older than `archive_after_months`
+    months before the current month. 0 disables archiving.
+    """
+    if archive_after_months <= 0:
+        return []
+
+    this_month = month_start(datetime.now(timezone.utc).date())
+    cutoff = add_months(this_month, -archive_after_months)
+
+    archived = []
+    for parent in PARTITIONED_TABLES:
+        for name, month in list_partitions(db, parent):
+            if month >= cutoff:
+                break
+            archived.append(archive_partition(db, parent, name, archive_dir))
+
+    return archived
+
+
+def get_partition_summary(db: Session):
+    """
+    Partition months and default-partition row counts per table.
+    Rows in a default partition mean a month was missing when they were written.
+    """
+    summary = {}
+    for parent in PARTITIONED_TABLES:
+        months = [month for _, month in list_partitions(db, parent)]
+        default_rows = db.execute(
+            text(f'SELECT count(*) FROM "{parent}_default"')
+        ).scalar()
+
+        summary[parent] = {
+            "oldest_month": months[0] if months else None,
+            "newest_month": months[-1] if months else None,
+            "partitions": len(months),
+            "default_rows": default_rows
+        }
+
+    return summary
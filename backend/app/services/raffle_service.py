@@ -1,5 +1,9 @@
+import uuid
+import hashlib
+import secrets
+from dataclasses import dataclass
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, exists,or_ 
+from sqlalchemy import func, desc, or_, and_, select
 from fastapi import HTTPException
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -8,18 +12,42 @@ from decimal import Decimal
 from app.models.raffle_jackpot import RaffleJackpot
 from app.models.raffle_entry import RaffleEntry
 from app.models.wallet import Wallet
-from app.models.wallet_type import WalletType
-from app.models.wallet_transaction import WalletTransaction
-from app.models.transaction_type import TransactionType
+from app.core.reference_data import get_transaction_type_id, get_wallet_type_id
+from app.services.wallet_ledger_service import (
+    LedgerEntry,
+    credit_wallet,
+    debit_wallet,
+    wallet_lookup
+)
 from app.models.user import User
 from app.models.tenant_country_currency import TenantCountryCurrency
 from app.models.currency import Currency
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pagination import encode_cursor, decode_cursor, DEFAULT_PAGE_SIZE
 
 # Schemas
 from app.schemas.raffle_jackpot import JackpotCreate, JackpotResponse
 
 # Notifications
-from app.services.notification_service import send_notification
+from app.services.notification_service import send_notification, send_bulk_notification
+
+
+# Player jackpot listings, cached per (tenant, currency) without the
+# per-player is_joined flag. Joins, draws, creations and cancellations
+# call invalidate_jackpot_listing() after they commit.
+
+_jackpot_listings = TTLCache(ttl_seconds=settings.JACKPOT_LISTING_TTL_SECONDS, max_entries=1000)
+
+
+@dataclass(frozen=True)
+class JackpotListing:
+    active: list[dict]
+    completed: list[dict]
+
+
+def invalidate_jackpot_listing(tenant_id, currency_id):
+    _jackpot_listings.invalidate((str(tenant_id), currency_id))
 
 def create_new_jackpot(db: Session, tenant_id: str, data: JackpotCreate):
     new_jackpot = RaffleJackpot(
@@ -38,48 +66,108 @@ def create_new_jackpot(db: Session, tenant_id: str, data: JackpotCreate):
     db.add(new_jackpot)
     db.commit()
     db.refresh(new_jackpot)
+    invalidate_jackpot_listing(tenant_id, new_jackpot.currency_id)
     return new_jackpot
 
-def get_available_jackpots_for_player(db: Session, tenant_id: str, player_id: str, player_currency_id: int):
-    """
-    Returns both Active and Completed jackpots for the player's currency.
-    Includes winner details for completed jackpots.
-    """
+def load_jackpot_listing(db: Session, tenant_id, currency_id) -> JackpotListing:
     # Joined with User to get Winner details for the "Past Winners" tab
-    rows = db.query(RaffleJackpot, Currency.symbol, User).join(
+    rows = db.query(
+        RaffleJackpot,
+        Currency.symbol,
+        User.first_name,
+        User.last_name,
+        User.email
+    ).join(
         Currency, RaffleJackpot.currency_id == Currency.currency_id
     ).outerjoin(
         User, RaffleJackpot.winner_id == User.user_id
     ).filter(
         RaffleJackpot.tenant_id == tenant_id,
-        RaffleJackpot.currency_id == player_currency_id,
+        RaffleJackpot.currency_id == currency_id,
         RaffleJackpot.status.in_(['active', 'completed']) # Allow both statuses
-    ).order_by(desc(RaffleJackpot.created_at)).all()
-
-    results = []
-    for j, sym, winner_user in rows:
-        # Check if the current player joined this jackpot
-        already_joined = db.query(exists().where(
-            (RaffleEntry.jackpot_id == j.jackpot_id) & (RaffleEntry.player_id == player_id)
-        )).scalar()
-        
-        # Get total participant count
-        count = db.query(func.count(RaffleEntry.entry_id)).filter(RaffleEntry.jackpot_id == j.jackpot_id).scalar()
-        
-        # Validate data against schema
-        jackpot_data = JackpotResponse.model_validate(j)
-        jackpot_data.is_joined = already_joined
-        jackpot_data.participants_count = count
-        jackpot_data.currency_symbol = sym 
-        
-        #  If jackpot is completed, add winner details for UI
-        if winner_user:
-            jackpot_data.winner_name = f"{winner_user.first_name} {winner_user.last_name}"
-            jackpot_data.winner_email = winner_user.email
-
-        results.append(jackpot_data)
+    ).order_by(desc(RaffleJackpot.created_at), desc(RaffleJackpot.jackpot_id)).all()
+
+    listing = JackpotListing(active=[], completed=[])
+    for j, sym, first_name, last_name, email in rows:
+        item = {
+            "jackpot_id": j.jackpot_id,
+            "name": j.name,
+            "description": j.description,
+            "jackpot_type": j.jackpot_type,
+            "seed_amount": j.seed_amount,
+            "current_amount": j.current_amount,
+            "entry_fee": j.entry_fee,
+            "status": j.status,
+            "currency_id": j.currency_id,
+            "currency_symbol": sym,
+            "draw_at": j.draw_at,
+            "target_amount": j.target_amount,
+            "winner_id": j.winner_id,
+            # If jackpot is completed, add winner details for UI
+            "winner_name": f"{first_name} {last_name}" if j.winner_id else None,
+            "winner_email": email,
+            "participants_count": j.participants_count,
+            "won_amount": j.won_amount,
+            "drawn_at": j.drawn_at,
+            "draw_seed": j.draw_seed,
+            "winning_entry_number": j.winning_entry_number,
+            "created_at": j.created_at
+        }
+        if j.status == 'active':
+            listing.active.append(item)
+        else:
+            listing.completed.append(item)
+
+    return listing
+
+
+def get_available_jackpots_for_player(
+    db: Session,
+    tenant_id: str,
+    player_id: str,
+    player_currency_id: int,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE
+):
+    """
+    Returns the Active jackpots followed by one page of Completed jackpots
+    (newest first) for the player's currency, with winner details.
+    Pages after the first (cursor set) only hold completed jackpots.
+    """
+    listing = _jackpot_listings.get_or_load(
+        (str(tenant_id), player_currency_id),
+        lambda: load_jackpot_listing(db, tenant_id, player_currency_id)
+    )
 
-    return results
+    completed = listing.completed
+    if cursor:
+        created_at, jackpot_id = decode_cursor(cursor)
+        completed = [
+            j for j in completed
+            if (j["created_at"], j["jackpot_id"]) < (created_at, jackpot_id)
+        ]
+
+    page = completed[:limit]
+    next_cursor = None
+    if len(completed) > limit:
+        next_cursor = encode_cursor(page[-1]["created_at"], page[-1]["jackpot_id"])
+
+    if not cursor:
+        page = listing.active + page
+
+    # One keyed lookup for the jackpots on this page the player has joined
+    joined = set()
+    if page:
+        joined = {
+            jackpot_id
+            for (jackpot_id,) in db.query(RaffleEntry.jackpot_id).filter(
+                RaffleEntry.player_id == player_id,
+                RaffleEntry.jackpot_id.in_([j["jackpot_id"] for j in page])
+            )
+        }
+
+    items = [{**j, "is_joined": j["jackpot_id"] in joined} for j in page]
+    return {"items": items, "next_cursor": next_cursor}
 
 def join_jackpot_logic(db: Session, player_id: str, tenant_id: str, jackpot_id: str):
     jackpot = db.query(RaffleJackpot).filter(
@@ -101,48 +189,61 @@ def join_jackpot_logic(db: Session, player_id: str, tenant_id: str, jackpot_id:
     if existing:
         raise HTTPException(400, "You have already joined this jackpot")
 
-    wallet = db.query(Wallet).join(WalletType).filter(
+    cash_wallet = (
         Wallet.player_id == player_id,
         Wallet.currency_id == jackpot.currency_id,
-        Wallet.is_active == True,
-        WalletType.wallet_type_code == 'CASH' 
-    ).with_for_update().first()
+        Wallet.wallet_type_id == get_wallet_type_id(db, "CASH")
+    )
+    entry_fee = Decimal(str(jackpot.entry_fee))
+    entry_id = uuid.uuid4()
 
-    if not wallet:
-        raise HTTPException(400, "Cash wallet not configured for this currency")
+    # Guarded debit + ledger row in one statement
+    move = debit_wallet(
+        db,
+        wallet_lookup(*cash_wallet),
+        entry_fee,
+        LedgerEntry(
+            transaction_type_id=get_transaction_type_id(db, "JACKPOT_ENTRY"),
+            reference_type="raffle_entries",
+            reference_id=entry_id
+        )
+    )
 
-    if wallet.balance < jackpot.entry_fee:
+    if not move:
+        wallet = db.query(Wallet.balance).filter(Wallet.is_active == True, *cash_wallet).first()
+        if not wallet:
+            raise HTTPException(400, "Cash wallet not configured for this currency")
         raise HTTPException(400, f"Insufficient balance. Required: {jackpot.entry_fee}, Available: {wallet.balance}")
 
     try:
+        # Entries are numbered 1..participants_count under the jackpot row lock
+        jackpot.participants_count += 1
         entry = RaffleEntry(
+            entry_id=entry_id,
             jackpot_id=jackpot_id,
             player_id=player_id,
-            wallet_id=wallet.wallet_id,
-            amount_paid=jackpot.entry_fee
+            wallet_id=move.wallet_id,
+            amount_paid=jackpot.entry_fee,
+            entry_number=jackpot.participants_count
         )
         db.add(entry)
-        balance_before = wallet.balance
-        wallet.balance -= Decimal(str(jackpot.entry_fee))
-        jackpot.current_amount += Decimal(str(jackpot.entry_fee))
-
-        txn_type = db.query(TransactionType).filter_by(transaction_code="JACKPOT_ENTRY").first()
-        db.add(WalletTransaction(
-            wallet_id=wallet.wallet_id,
-            transaction_type_id=txn_type.transaction_type_id,
-            amount=-jackpot.entry_fee,
-            balance_before=balance_before,
-            balance_after=wallet.balance,
-            reference_type="raffle_entries",
-            reference_id=entry.entry_id
-        ))
+        jackpot.current_amount += entry_fee
 
         db.commit()
-        return {"message": "Successfully joined", "jackpot_id": jackpot.jackpot_id, "new_balance": float(wallet.balance)}
+        invalidate_jackpot_listing(tenant_id, jackpot.currency_id)
+        return {"message": "Successfully joined", "jackpot_id": jackpot.jackpot_id, "new_balance": float(move.balance_after)}
     except Exception as e:
         db.rollback()
         raise HTTPException(500, "Internal error processing entry")
 
+def pick_winning_entry_number(draw_seed: str, jackpot_id, participants: int) -> int:
+    """
+    Winning entry number in 1..participants. Deterministic for a given seed,
+    so a recorded draw can be re-checked.
+    """
+    digest = hashlib.sha256(f"{draw_seed}:{jackpot_id}".encode()).digest()
+    return int.from_bytes(digest, "big") % participants + 1
+
 def perform_draw_logic(db: Session, tenant_id: str, jackpot_id: str):
     row = db.query(RaffleJackpot, Currency.symbol).join(
         Currency, RaffleJackpot.currency_id == Currency.currency_id
@@ -165,39 +266,47 @@ def perform_draw_logic(db: Session, tenant_id: str, jackpot_id: str):
     if jackpot.jackpot_type == "THRESHOLD" and jackpot.current_amount < jackpot.target_amount:
         raise HTTPException(400, "Cannot draw yet: Target amount not reached")
 
-    # Pick Winner
-    winner_entry = db.query(RaffleEntry).filter_by(jackpot_id=jackpot_id).order_by(func.random()).first()
-    
-    if not winner_entry:
+    if not jackpot.participants_count:
         jackpot.status = 'cancelled'
         db.commit()
+        invalidate_jackpot_listing(tenant_id, jackpot.currency_id)
         # This message will trigger the "No Players Joined" Modal in frontend
         raise HTTPException(400, "No players joined. Jackpot cancelled.")
 
-    # Process Winner Wallet
-    winner_wallet = db.query(Wallet).filter_by(wallet_id=winner_entry.wallet_id).with_for_update().first()
+    # Pick Winner: one keyed lookup of a numbered entry
+    draw_seed = secrets.token_hex(32)
+    winning_number = pick_winning_entry_number(draw_seed, jackpot.jackpot_id, jackpot.participants_count)
+    winner_entry = db.query(RaffleEntry).filter_by(
+        jackpot_id=jackpot.jackpot_id,
+        entry_number=winning_number
+    ).first()
+
+    if not winner_entry:
+        db.rollback()
+        raise HTTPException(500, "Raffle entries are out of sync with the participant count")
+
+    # Pay the winner (credit + ledger row in one statement)
     winner_user = db.query(User).filter_by(user_id=winner_entry.player_id).first()
     winner_full_name = f"{winner_user.first_name} {winner_user.last_name}"
     
     total_prize = jackpot.current_amount
-    balance_before = winner_wallet.balance
-    winner_wallet.balance += total_prize
+    credit_wallet(
+        db,
+        winner_entry.wallet_id,
+        total_prize,
+        LedgerEntry(
+            transaction_type_id=get_transaction_type_id(db, "JACKPOT_WIN"),
+            reference_type="raffle_jackpots",
+            reference_id=jackpot.jackpot_id
+        )
+    )
 
     jackpot.status = 'completed'
     jackpot.winner_id = winner_entry.player_id
     jackpot.won_amount = total_prize
     jackpot.drawn_at = now
-
-    txn_type = db.query(TransactionType).filter_by(transaction_code="JACKPOT_WIN").first()
-    db.add(WalletTransaction(
-        wallet_id=winner_wallet.wallet_id,
-        transaction_type_id=txn_type.transaction_type_id,
-        amount=total_prize,
-        balance_before=balance_before,
-        balance_after=winner_wallet.balance,
-        reference_type="raffle_jackpots",
-        reference_id=jackpot.jackpot_id
-    ))
+    jackpot.draw_seed = draw_seed
+    jackpot.winning_entry_number = winning_number
 
     # 1. Notify Winner (New Type: JACKPOT)
     send_notification(
@@ -208,31 +317,50 @@ def perform_draw_logic(db: Session, tenant_id: str, jackpot_id: str):
         notif_type="JACKPOT"
     )
 
-    # 2. Notify All Non-Winners (Consolation message)
-    other_participants = db.query(RaffleEntry.player_id).filter(
-        RaffleEntry.jackpot_id == jackpot_id,
-        RaffleEntry.player_id != winner_entry.player_id
-    ).all()
-
-    for (p_id,) in other_participants:
-        send_notification(
-            db,
-            user_id=p_id,
-            title="Jackpot Concluded",
-            message=f"The '{jackpot.name}' draw is complete. The winner is {winner_full_name}. Better luck next time!",
-            notif_type="JACKPOT"
-        )
+    # 2. Notify All Non-Winners (Consolation message), one INSERT ... SELECT
+    send_bulk_notification(
+        db,
+        select(RaffleEntry.player_id).where(
+            RaffleEntry.jackpot_id == jackpot.jackpot_id,
+            RaffleEntry.player_id != winner_entry.player_id
+        ),
+        title="Jackpot Concluded",
+        message=f"The '{jackpot.name}' draw is complete. The winner is {winner_full_name}. Better luck next time!",
+        notif_type="JACKPOT"
+    )
 
     db.commit()
+    invalidate_jackpot_listing(tenant_id, jackpot.currency_id)
     return {
         "jackpot_id": jackpot.jackpot_id, 
         "winner_id": jackpot.winner_id, 
         "winner_name": winner_full_name, 
         "winner_email": winner_user.email, 
         "amount_won": float(total_prize),
-        "currency_symbol": sym 
+        "currency_symbol": sym,
+        "draw_seed": draw_seed,
+        "winning_entry_number": winning_number
     }
 
+def get_due_jackpots(db: Session):
+    """
+    Active TIME_BASED jackpots past draw_at and THRESHOLD jackpots that
+    reached target_amount, as (tenant_id, jackpot_id) pairs.
+    """
+    return db.query(RaffleJackpot.tenant_id, RaffleJackpot.jackpot_id).filter(
+        RaffleJackpot.status == 'active',
+        or_(
+            and_(
+                RaffleJackpot.jackpot_type == 'TIME_BASED',
+                RaffleJackpot.draw_at <= func.now()
+            ),
+            and_(
+                RaffleJackpot.jackpot_type == 'THRESHOLD',
+                RaffleJackpot.current_amount >= RaffleJackpot.target_amount
+            )
+        )
+    ).order_by(RaffleJackpot.draw_at).all()
+
 def cancel_jackpot_logic(db: Session, tenant_id: str, jackpot_id: str):
     jackpot = db.query(RaffleJackpot).filter(
         RaffleJackpot.jackpot_id == jackpot_id, 
@@ -243,27 +371,26 @@ def cancel_jackpot_logic(db: Session, tenant_id: str, jackpot_id: str):
         raise HTTPException(400, "Jackpot not found or already closed")
 
     entries = db.query(RaffleEntry).filter_by(jackpot_id=jackpot_id).all()
-    txn_type = db.query(TransactionType).filter_by(transaction_code="JACKPOT_REFUND").first()
+    refund_type_id = get_transaction_type_id(db, "JACKPOT_REFUND")
 
     for entry in entries:
-        w = db.query(Wallet).filter_by(wallet_id=entry.wallet_id).with_for_update().first()
-        if w:
-            before = w.balance
-            w.balance += entry.amount_paid
-            db.add(WalletTransaction(
-                wallet_id=w.wallet_id, 
-                transaction_type_id=txn_type.transaction_type_id,
-                amount=entry.amount_paid, 
-                balance_before=before, 
-                balance_after=w.balance,
-                reference_type="raffle_jackpots", 
-                reference_id=jackpot_id
-            ))
+        refund = credit_wallet(
+            db,
+            entry.wallet_id,
+            entry.amount_paid,
+            LedgerEntry(
+                transaction_type_id=refund_type_id,
+                reference_type="raffle_jackpots",
+                reference_id=jackpot.jackpot_id
+            )
+        )
+        if refund:
             # Notify using JACKPOT type
             send_notification(db, entry.player_id, "Jackpot Cancelled", f"The jackpot '{jackpot.name}' was cancelled. Your entry fee has been refunded.", "JACKPOT")
 
     jackpot.status = 'cancelled'
     db.commit()
+    invalidate_jackpot_listing(tenant_id, jackpot.currency_id)
     return {"message": f"Jackpot cancelled. {len(entries)} players refunded."}
 
 def get_admin_tenant_currencies(db: Session, tenant_id: str):
@@ -273,19 +400,9 @@ def get_admin_tenant_currencies(db: Session, tenant_id: str):
              .all()
 
 def get_admin_jackpots_list(db: Session, tenant_id: str):
-    participant_count_sub = (
-        db.query(
-            RaffleEntry.jackpot_id,
-            func.count(RaffleEntry.entry_id).label("p_count")
-        )
-        .group_by(RaffleEntry.jackpot_id)
-        .subquery()
-    )
-
     rows = (
-        db.query(RaffleJackpot, User, participant_count_sub.c.p_count, Currency.symbol)
+        db.query(RaffleJackpot, User, Currency.symbol)
         .outerjoin(User, RaffleJackpot.winner_id == User.user_id)
-        .outerjoin(participant_count_sub, RaffleJackpot.jackpot_id == participant_count_sub.c.jackpot_id)
         .join(Currency, RaffleJackpot.currency_id == Currency.currency_id)
         .filter(RaffleJackpot.tenant_id == tenant_id)
         .order_by(desc(RaffleJackpot.created_at))
@@ -293,9 +410,9 @@ def get_admin_jackpots_list(db: Session, tenant_id: str):
     )
 
     results = []
-    for jack, winner_user, count, sym in rows:
+    for jack, winner_user, sym in rows:
+        # participants_count comes from the maintained column
         data = JackpotResponse.model_validate(jack)
-        data.participants_count = count or 0
         data.currency_symbol = sym 
         if winner_user:
             data.winner_name = f"{winner_user.first_name} {winner_user.last_name}"
@@ -4,28 +4,18 @@ from fastapi import HTTPException
 from app.models import (
     User,
     Player,
-    Wallet,
-    WalletType,
-    Tenant,
-    Role,
-    Currency
+    Wallet
 )
-from app.models.tenant_country import TenantCountry
 from app.core.security import hash_password
+from app.core.tenant_registry import find_tenant_by_domain
+from app.core.reference_data import get_reference_data, get_role_id, get_currency
 
 
 def register_player(db: Session, data):
     # 1️Validate tenant by domain
-    tenant = (
-        db.query(Tenant)
-        .filter(
-            Tenant.domain == data.tenant_domain,
-            Tenant.status == "active"
-        )
-        .first()
-    )
+    tenant = find_tenant_by_domain(db, data.tenant_domain)
 
-    if not tenant:
+    if not tenant or tenant.status != "active":
         raise HTTPException(status_code=400, detail="Invalid tenant domain")
 
     # 2️ Check duplicate email inside tenant
@@ -42,28 +32,10 @@ def register_player(db: Session, data):
         raise HTTPException(status_code=400, detail="Email already exists for this tenant")
 
     # 3️ Resolve PLAYER role
-    role = (
-        db.query(Role)
-        .filter(Role.role_name == "PLAYER")
-        .first()
-    )
-
-    if not role:
-        raise HTTPException(
-            status_code=500,
-            detail="PLAYER role not configured"
-        )
+    role_id = get_role_id(db, "PLAYER")
 
     # 4️ Resolve tenant + country mapping
-    tenant_country = (
-        db.query(TenantCountry)
-        .filter(
-            TenantCountry.tenant_id == tenant.tenant_id,
-            TenantCountry.country_code == data.country_code,
-            TenantCountry.is_active.is_(True)
-        )
-        .first()
-    )
+    tenant_country = tenant.active_country(data.country_code)
 
     if not tenant_country:
         raise HTTPException(
@@ -72,11 +44,7 @@ def register_player(db: Session, data):
         )
 
     # 5️ Resolve currency for selected country
-    currency = (
-        db.query(Currency)
-        .filter(Currency.currency_code == tenant_country.currency_code)
-        .first()
-    )
+    currency = get_currency(db, tenant_country.currency_code)
 
     if not currency:
         raise HTTPException(
@@ -87,7 +55,7 @@ def register_player(db: Session, data):
     # 6️ Create User
     user = User(
         tenant_id=tenant.tenant_id,
-        role_id=role.role_id,
+        role_id=role_id,
         first_name=data.first_name,
         last_name=data.last_name,
         email=data.email,
@@ -103,7 +71,7 @@ def register_player(db: Session, data):
     db.add(player)
 
     # 8️ Create wallets for all wallet types with resolved currency
-    wallet_types = db.query(WalletType).all()
+    wallet_types = list(get_reference_data(db).wallet_types.values())
 
     if not wallet_types:
         raise HTTPException(
@@ -1,12 +1,24 @@
 from datetime import date, datetime, timezone
+from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, cast, Date, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException
 
 from app.models.responsible_limit import ResponsibleLimit
+from app.models.player_wager_total import PlayerWagerTotal
 from app.models.bet import Bet
-from app.models.game_round import GameRound
-from app.models.game_session import GameSession
+from app.services.game_eligibility_service import invalidate_player_eligibility
+
+
+# Wager ledger periods (UTC)
+DAY = "DAY"
+MONTH = "MONTH"
+
+
+def wager_periods(at: datetime):
+    day = at.astimezone(timezone.utc).date()
+    return day, day.replace(day=1)
 
 
 def get_limits(db: Session, player_id):
@@ -50,6 +62,7 @@ def set_limits(db: Session, player_id, data):
         setattr(limits, field, value)
 
     db.commit()
+    invalidate_player_eligibility(player_id)
     db.refresh(limits)
     return limits
 
@@ -84,51 +97,21 @@ def self_exclude(db: Session, player_id, until_date: date):
     limits.self_exclusion_until = until_date
 
     db.commit()
+    invalidate_player_eligibility(player_id)
     db.refresh(limits)
     return limits
 
 
 def get_limits_usage(db: Session, player_id):
-    limits = (
-        db.query(ResponsibleLimit)
-        .filter(ResponsibleLimit.player_id == player_id)
-        .first()
-    )
+    row = load_limits_with_usage(db, player_id)
 
-    if not limits:
+    if not row:
         raise HTTPException(
             status_code=404,
             detail="Responsible gaming limits not set"
         )
 
-   
-    now_utc = datetime.now(timezone.utc)
-    today = now_utc.date()
-
-    
-    daily_used = (
-        db.query(func.coalesce(func.sum(Bet.bet_amount), 0))
-        .join(GameRound)
-        .join(GameSession)
-        .filter(
-            GameSession.player_id == player_id,
-            func.date(Bet.placed_at) == today
-        )
-        .scalar()
-    )
-
-    # Monthly usage
-    monthly_used = (
-        db.query(func.coalesce(func.sum(Bet.bet_amount), 0))
-        .join(GameRound)
-        .join(GameSession)
-        .filter(
-            GameSession.player_id == player_id,
-            func.date_part("month", Bet.placed_at) == now_utc.month,
-            func.date_part("year", Bet.placed_at) == now_utc.year
-        )
-        .scalar()
-    )
+    limits, daily_used, monthly_used = row
 
     return {
         "daily_bet_limit": limits.daily_bet_limit,
@@ -148,4 +131,228 @@ def get_limits_usage(db: Session, player_id):
         ),
 
         "self_exclusion_until": limits.self_exclusion_until
-    }
\ No newline at end of file
+    }
+
+
+
+# Bet-time enforcement
+
+def wager_total_subquery(player_id, period_type: str, period_start: date):
+    return func.coalesce(
+        select(PlayerWagerTotal.total_wagered)
+        .where(
+            PlayerWagerTotal.player_id == player_id,
+            PlayerWagerTotal.period_type == period_type,
+            PlayerWagerTotal.period_start == period_start
+        )
+        .scalar_subquery(),
+        0
+    )
+
+
+def load_limits_with_usage(db: Session, player_id, lock: bool = False):
+    """
+    Returns (limits, daily_used, monthly_used) in one keyed read,
+    or None when the player has no limits row.
+    With lock=True the limits row stays locked until the transaction ends.
+    """
+    today, month_start = wager_periods(datetime.now(timezone.utc))
+
+    query = (
+        db.query(
+            ResponsibleLimit,
+            wager_total_subquery(player_id, DAY, today),
+            wager_total_subquery(player_id, MONTH, month_start)
+        )
+        .filter(ResponsibleLimit.player_id == player_id)
+    )
+
+    if lock:
+        query = query.with_for_update(of=ResponsibleLimit)
+
+    return query.first()
+
+
+def wager_limit_breach(limits, daily_total, monthly_total, bet_amount: Decimal):
+    """
+    Returns the reason a bet would break the player's limits, or None.
+    """
+    if not limits:
+        return None
+
+    today = datetime.now(timezone.utc).date()
+
+    if limits.self_exclusion_until and limits.self_exclusion_until >= today:
+        return "Player is self-excluded"
+
+    if limits.daily_bet_limit and daily_total + bet_amount > limits.daily_bet_limit:
+        return "Daily betting limit exceeded"
+
+    if limits.monthly_bet_limit and monthly_total + bet_amount > limits.monthly_bet_limit:
+        return "Monthly betting limit exceeded"
+
+    return None
+
+
+def enforce_responsible_gaming(db: Session, player_id, bet_amount: Decimal):
+    row = load_limits_with_usage(db, player_id)
+
+    if not row:
+        return
+
+    breach = wager_limit_breach(*row, bet_amount)
+    if breach:
+        raise HTTPException(status_code=403, detail=breach)
+
+
+def build_wager_upsert(player_id, amount: Decimal, placed_at: datetime):
+    """
+    INSERT ... ON CONFLICT adding a bet to the player's day and month totals.
+    Run it in the same transaction as the bet insert.
+    """
+    day, month_start = wager_periods(placed_at)
+
+    stmt = pg_insert(PlayerWagerTotal).values([
+        {
+            "player_id": player_id,
+            "period_type": DAY,
+            "period_start": day,
+            "total_wagered": amount
+        },
+        {
+            "player_id": player_id,
+            "period_type": MONTH,
+            "period_start": month_start,
+            "total_wagered": amount
+        },
+    ])
+
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            PlayerWagerTotal.player_id,
+            PlayerWagerTotal.period_type,
+            PlayerWagerTotal.period_start
+        ],
+        set_={
+            "total_wagered": PlayerWagerTotal.total_wagered + stmt.excluded.total_wagered,
+            "updated_at": func.now()
+        }
+    )
+
+
+
+# Ledger maintenance
+
+def raw_wager_totals_query(db: Session, period_type: str, since: date, player_id=None):
+    placed_at_utc = func.timezone("UTC", Bet.placed_at)
+
+    if period_type == DAY:
+        period_start = cast(placed_at_utc, Date)
+    else:
+        period_start = cast(func.date_trunc("month", placed_at_utc), Date)
+
+    query = (
+        db.query(
+            Bet.player_id.label("player_id"),
+            period_start.label("period_start"),
+            func.sum(Bet.bet_amount).label("total_wagered")
+        )
+        .filter(Bet.placed_at >= datetime.combine(since, datetime.min.time(), timezone.utc))
+    )
+
+    if player_id:
+        query = query.filter(Bet.player_id == player_id)
+
+    return query.group_by(Bet.player_id, period_start)
+
+
+def rebuild_wager_ledger(db: Session, since: date, player_id=None):
+    """
+    Recomputes the ledger from the bets table for every month touching `since`.
+    Settlement keeps upserting the ledger while this runs, so the table is
+    locked against writes until the rebuild commits: bets settled before the
+    lock are in the SUMs, later ones block and add their increment afterwards.
+    """
+    since = since.replace(day=1)
+
+    # Conflicts with the ROW EXCLUSIVE lock taken by build_wager_upsert(), not with readers
+    db.execute(text("LOCK TABLE player_wager_totals IN SHARE ROW EXCLUSIVE MODE"))
+
+    delete_query = db.query(PlayerWagerTotal).filter(
+        PlayerWagerTotal.period_start >= since
+    )
+    if player_id:
+        delete_query = delete_query.filter(PlayerWagerTotal.player_id == player_id)
+
+    deleted = delete_query.delete(synchronize_session=False)
+
+    inserted = 0
+    for period_type in (DAY, MONTH):
+        rows = raw_wager_totals_query(db, period_type, since, player_id).all()
+
+        if rows:
+            db.execute(
+                pg_insert(PlayerWagerTotal),
+                [
+                    {
+                        "player_id": r.player_id,
+                        "period_type": period_type,
+                        "period_start": r.period_start,
+                        "total_wagered": r.total_wagered
+                    }
+                    for r in rows
+                ]
+            )
+        inserted += len(rows)
+
+    db.commit()
+
+    return {
+        "since": since,
+        "rows_deleted": deleted,
+        "rows_inserted": inserted
+    }
+
+
+def check_wager_ledger(db: Session, since: date, player_id=None):
+    """
+    Compares ledger rows against SUM(bet_amount) on the bets table.
+    """
+    since = since.replace(day=1)
+
+    ledger_query = db.query(PlayerWagerTotal).filter(
+        PlayerWagerTotal.period_start >= since
+    )
+    if player_id:
+        ledger_query = ledger_query.filter(PlayerWagerTotal.player_id == player_id)
+
+    ledger = {
+        (r.player_id, r.period_type, r.period_start): r.total_wagered
+        for r in ledger_query.all()
+    }
+
+    raw = {}
+    for period_type in (DAY, MONTH):
+        for r in raw_wager_totals_query(db, period_type, since, player_id).all():
+            raw[(r.player_id, period_type, r.period_start)] = r.total_wagered
+
+    mismatches = []
+    for key in sorted(set(ledger) | set(raw), key=lambda k: (str(k[0]), k[1], k[2])):
+        ledger_total = ledger.get(key, Decimal("0"))
+        raw_total = raw.get(key, Decimal("0"))
+
+        if ledger_total != raw_total:
+            mismatches.append({
+                "player_id": key[0],
+                "period_type": key[1],
+                "period_start": key[2],
+                "ledger_total": float(ledger_total),
+                "bets_total": float(raw_total)
+            })
+
+    return {
+        "since": since,
+        "rows_checked": len(set(ledger) | set(raw)),
+        "consistent": not mismatches,
+        "mismatches": mismatches
+    }
@@ -0,0 +1,197 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.analytics_snapshot_job import AnalyticsSnapshotJob
+from app.models.tenant import Tenant
+from app.services.analytics_snapshot_service import generate_daily_snapshot
+
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def save_job_state(db: Session, tenant_id, snapshot_date: date, **values):
+    values["updated_at"] = datetime.now(timezone.utc)
+
+    db.execute(
+        pg_insert(AnalyticsSnapshotJob)
+        .values(tenant_id=tenant_id, snapshot_date=snapshot_date, **values)
+        .on_conflict_do_update(
+            index_elements=[
+                AnalyticsSnapshotJob.tenant_id,
+                AnalyticsSnapshotJob.snapshot_date
+            ],
+            set_=values
+        )
+    )
+    db.commit()
+
+
+def pending_snapshot_jobs(db: Session, today: date, catchup_days: int):
+    """
+    (tenant_id, snapshot_date) pairs for active tenants that have no 'done'
+    job within the last `catchup_days` closed days, oldest first.
+    """
+    days = [today - timedelta(days=n) for n in range(catchup_days, 0, -1)]
+
+    tenant_ids = [
+        tenant_id
+        for (tenant_id,) in db.query(Tenant.tenant_id)
+        .filter(Tenant.status == "active")
+        .all()
+    ]
+
+    done = set(
+        db.query(AnalyticsSnapshotJob.tenant_id, AnalyticsSnapshotJob.snapshot_date)
+        .filter(
+            AnalyticsSnapshotJob.snapshot_date.in_(days),
+            AnalyticsSnapshotJob.status == DONE
+        )
+        .all()
+    )
+
+    return [
+        (tenant_id, day)
+        for day in days
+        for tenant_id in tenant_ids
+        if (tenant_id, day) not in done
+    ]
+
+
+def queue_snapshot_jobs(db: Session, jobs):
+    """
+    Records the jobs of a run as pending; existing rows keep their state
+    until a worker picks them up.
+    """
+    if not jobs:
+        return
+
+    db.execute(
+        pg_insert(AnalyticsSnapshotJob)
+        .values([
+            {"tenant_id": tenant_id, "snapshot_date": day, "status": PENDING}
+            for tenant_id, day in jobs
+        ])
+        .on_conflict_do_nothing()
+    )
+    db.commit()
+
+
+def mark_job_running(db: Session, tenant_id, snapshot_date: date):
+    db.execute(
+        pg_insert(AnalyticsSnapshotJob)
+        .values(
+            tenant_id=tenant_id,
+            snapshot_date=snapshot_date,
+            status=RUNNING,
+            attempts=1,
+            started_at=func.now()
+        )
+        .on_conflict_do_update(
+            index_elements=[
+                AnalyticsSnapshotJob.tenant_id,
+                AnalyticsSnapshotJob.snapshot_date
+            ],
+            set_={
+                "status": RUNNING,
+                "attempts": AnalyticsSnapshotJob.attempts + 1,
+                "error": None,
+                "started_at": func.now(),
+                "finished_at": None,
+                "updated_at": func.now()
+            }
+        )
+    )
+    db.commit()
+
+
+def run_snapshot_job(db: Session, tenant_id, snapshot_date: date):
+    """
+    Generates one tenant/day snapshot and records the outcome on its job row.
+    Failures are stored rather than raised so one tenant cannot stop the run.
+    """
+    started = time.perf_counter()
+    mark_job_running(db, tenant_id, snapshot_date)
+
+    try:
+        result = generate_daily_snapshot(
+            db=db,
+            tenant_id=tenant_id,
+            snapshot_date=snapshot_date
+        )
+    except Exception as e:
+        db.rollback()
+        save_job_state(
+            db, tenant_id, snapshot_date,
+            status=FAILED,
+            error=str(e),
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            finished_at=datetime.now(timezone.utc)
+        )
+        return {"status": FAILED, "error": str(e)}
+
+    save_job_state(
+        db, tenant_id, snapshot_date,
+        status=DONE,
+        games_processed=result["games_processed"],
+        bets_processed=result["bets_processed"],
+        duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        finished_at=datetime.now(timezone.utc)
+    )
+
+    return {"status": DONE, **result}
+
+
+def get_snapshot_job_summary(db: Session, since: date, tenant_id=None):
+    """
+    Job counts by status and the unfinished jobs since `since`,
+    optionally scoped to one tenant.
+    """
+    query = db.query(AnalyticsSnapshotJob).filter(
+        AnalyticsSnapshotJob.snapshot_date >= since
+    )
+    if tenant_id is not None:
+        query = query.filter(AnalyticsSnapshotJob.tenant_id == tenant_id)
+
+    counts = dict(
+        query.with_entities(AnalyticsSnapshotJob.status, func.count())
+        .group_by(AnalyticsSnapshotJob.status)
+        .all()
+    )
+
+    unfinished = (
+        query.filter(AnalyticsSnapshotJob.status != DONE)
+        .order_by(AnalyticsSnapshotJob.snapshot_date, AnalyticsSnapshotJob.tenant_id)
+        .limit(100)
+        .all()
+    )
+
+    last_done = (
+        query.filter(AnalyticsSnapshotJob.status == DONE)
+        .with_entities(func.max(AnalyticsSnapshotJob.snapshot_date))
+        .scalar()
+    )
+
+    return {
+        "since": since,
+        "counts": {status: counts.get(status, 0) for status in (PENDING, RUNNING, DONE, FAILED)},
+        "last_completed_date": last_done,
+        "unfinished": [
+            {
+                "tenant_id": job.tenant_id,
+                "snapshot_date": job.snapshot_date,
+                "status": job.status,
+                "attempts": job.attempts,
+                "error": job.error,
+                "started_at": job.started_at,
+                "finished_at": job.finished_at
+            }
+            for job in unfinished
+        ]
+    }
@@ -5,6 +5,7 @@ from app.models.game import Game
 from app.models.country import Country
 from app.models.game_country import GameCountry
 from app.core.audit import log_audit
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
 
 def list_game_countries(db: Session, game_id):
     game = db.query(Game).filter(Game.game_id == game_id).first()
@@ -76,6 +77,7 @@ def update_game_country(
         db.add(gc)
 
     db.commit()
+    invalidate_tenant_eligibility()
     db.refresh(gc)
     # 🔐 AUDIT
     log_audit(
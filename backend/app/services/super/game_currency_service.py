@@ -5,6 +5,7 @@ from app.models.game import Game
 from app.models.currency import Currency
 from app.models.game_currency import GameCurrency
 from app.core.audit import log_audit
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
 
 def list_game_currencies(db: Session, game_id):
     game = db.query(Game).filter(Game.game_id == game_id).first()
@@ -84,6 +85,7 @@ def update_game_currency(
         db.add(gc)
 
     db.commit()
+    invalidate_tenant_eligibility()
     db.refresh(gc)
     log_audit(
         db=db,
@@ -4,11 +4,12 @@ from uuid import UUID, uuid4
 from sqlalchemy import func
 from app.models.user import User
 from app.models.tenant import Tenant
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, invalidate_user_state
 from app.models.tenant_game import TenantGame
 from app.models.tenant_provider import TenantProvider
 from app.models.tenant_country import TenantCountry
 from app.core.audit import log_audit
+from app.core.tenant_registry import invalidate_tenant_registry
 TENANT_ADMIN_ROLE_ID = 2
 # Tenant-level statuses
 TENANT_ALLOWED_STATUSES = {"active", "inactive", "suspended"}
@@ -141,8 +142,12 @@ def update_tenant_status(
         )
 
     db.commit()
+    invalidate_tenant_registry()
     db.refresh(tenant)
 
+    if status in {"inactive", "suspended"}:
+        invalidate_user_state()
+
     # 🔐 AUDIT LOG
     if actor_user:
         log_audit(
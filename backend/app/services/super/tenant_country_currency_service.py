@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.tenant_country_currency import TenantCountryCurrency
 from app.models.currency import Currency
 from app.core.audit import log_audit
+from app.core.tenant_registry import invalidate_tenant_registry
 
 def get_currencies(db: Session, tenant_id, country_code):
     rows = (
@@ -64,6 +65,7 @@ def add_currency(db: Session, tenant_id, country_code, currency_id, is_default,a
 
     db.add(row)
     db.commit()
+    invalidate_tenant_registry()
 
         # 🔐 AUDIT
     log_audit(
@@ -117,6 +119,7 @@ def update_currency(db: Session, tenant_id, country_code, currency_id, is_defaul
         row.is_active = is_active
 
     db.commit()
+    invalidate_tenant_registry()
 
         # 🔐 AUDIT
     log_audit(
@@ -3,6 +3,7 @@ from app.models.tenant_country import TenantCountry
 from app.models.country import Country
 from fastapi import HTTPException
 from app.core.audit import log_audit
+from app.core.tenant_registry import invalidate_tenant_registry
 def get_tenant_countries(db: Session, tenant_id):
     rows = (
         db.query(
@@ -35,6 +36,7 @@ def add_country_to_tenant(db: Session, tenant_id, country_code, currency_code,ac
     )
     db.add(row)
     db.commit()
+    invalidate_tenant_registry()
     
 
     # 🔥 JOIN to get country_name
@@ -94,6 +96,7 @@ def update_tenant_country(db: Session, tenant_id, country_code, is_active,actor_
     }
     row.is_active = is_active
     db.commit()
+    invalidate_tenant_registry()
 
     result = (
         db.query(
@@ -155,6 +158,7 @@ def soft_delete_tenant_country(db: Session, tenant_id, country_code,actor_user):
     }
     row.is_active = False
     db.commit()
+    invalidate_tenant_registry()
     # 🔐 AUDIT
     log_audit(
         db=db,
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.core.audit import log_audit
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
+from app.services.game_catalog_service import invalidate_game_catalog
 from app.models.tenant_provider import TenantProvider
 from app.models.game_provider import GameProvider
 
@@ -60,6 +62,8 @@ def add_tenant_provider(db: Session, tenant_id, data,actor_user):
 
     db.add(tp)
     db.commit()
+    invalidate_tenant_eligibility(tenant_id)
+    invalidate_game_catalog(tenant_id)
     db.refresh(tp)
 
         # 🔐 AUDIT
@@ -114,6 +118,8 @@ def update_tenant_provider(db: Session, tenant_id, provider_id, data,actor_user)
         setattr(tp, field, value)
 
     db.commit()
+    invalidate_tenant_eligibility(tenant_id)
+    invalidate_game_catalog(tenant_id)
     db.refresh(tp)
 
     provider = db.query(GameProvider).filter(
@@ -2,6 +2,8 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.models.game_provider import GameProvider
 from app.core.audit import log_audit
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
+from app.services.game_catalog_service import invalidate_game_catalog
 
 def list_game_providers(db: Session):
     return db.query(GameProvider).order_by(GameProvider.created_at.desc()).all()
@@ -48,6 +50,8 @@ def update_game_provider(db: Session, provider_id: int, data, actor_user):
         setattr(provider, field, value)
 
     db.commit()
+    invalidate_tenant_eligibility()
+    invalidate_game_catalog()
     db.refresh(provider)
 
     log_audit(
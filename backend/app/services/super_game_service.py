@@ -3,6 +3,8 @@ from fastapi import HTTPException
 
 from datetime import datetime, timezone
 from app.core.audit import log_audit
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
+from app.services.game_catalog_service import invalidate_game_catalog
 from app.models.game import Game
 from app.models.game_provider import GameProvider
 from app.models.game_category import GameCategory
@@ -64,6 +66,8 @@ def create_game(db: Session, data, actor_user):
 
     db.add(game)
     db.commit()
+    invalidate_tenant_eligibility()
+    invalidate_game_catalog()
     db.refresh(game)
     
     # AUDIT LOG
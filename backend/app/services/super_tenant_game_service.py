@@ -6,6 +6,8 @@ from app.models.game import Game
 from app.models.tenant import Tenant
 from app.models.game_provider import GameProvider 
 from app.core.audit import log_audit
+from app.services.game_eligibility_service import invalidate_tenant_eligibility
+from app.services.game_catalog_service import invalidate_game_catalog
 
 def list_tenant_games(db: Session, tenant_id):
     
@@ -88,6 +90,8 @@ def add_game_to_tenant(db: Session, tenant_id, data, actor_user):
 
     db.add(tenant_game)
     db.commit()
+    invalidate_tenant_eligibility(tenant_id)
+    invalidate_game_catalog(tenant_id)
     db.refresh(tenant_game)
 
     #  AUDIT
@@ -156,6 +160,8 @@ def update_tenant_game(db: Session, tenant_id, game_id, data, actor_user):
         setattr(tg, field, value)
 
     db.commit()
+    invalidate_tenant_eligibility(tenant_id)
+    invalidate_game_catalog(tenant_id)
     db.refresh(tg)
 
    
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from uuid import uuid4
 from app.core.audit import log_audit
+from app.core.tenant_registry import invalidate_tenant_registry
 from app.models.tenant import Tenant
 
 
@@ -40,6 +41,7 @@ def create_tenant(
 
     db.add(tenant)
     db.commit()
+    invalidate_tenant_registry()
     db.refresh(tenant)
     # AUDIT
     log_audit(
@@ -108,5 +110,6 @@ def update_tenant(
     )
 
     db.commit()
+    invalidate_tenant_registry()
     db.refresh(tenant)
     return tenant
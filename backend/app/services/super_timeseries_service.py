@@ -1,8 +1,7 @@
 from datetime import date, timedelta, datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from app.models.analytics_snapshot import AnalyticsSnapshot
+from app.services.analytics_rollup_service import get_combined_timeseries
 
 
 def resolve_date_range(range_days, start_date, end_date):
@@ -26,20 +25,4 @@ def get_platform_timeseries(
 ):
     start, end = resolve_date_range(range_days, start_date, end_date)
 
-    rows = (
-        db.query(
-            AnalyticsSnapshot.snapshot_date.label("date"),
-            func.sum(AnalyticsSnapshot.total_bets).label("total_bets"),
-            func.sum(AnalyticsSnapshot.total_wins).label("total_wins"),
-            func.sum(AnalyticsSnapshot.ggr).label("ggr"),
-            func.sum(AnalyticsSnapshot.active_players).label("active_players"),
-        )
-        .filter(
-            AnalyticsSnapshot.snapshot_date.between(start, end)
-        )
-        .group_by(AnalyticsSnapshot.snapshot_date)
-        .order_by(AnalyticsSnapshot.snapshot_date)
-        .all()
-    )
-
-    return rows
\ No newline at end of file
+    return get_combined_timeseries(db, start, end)
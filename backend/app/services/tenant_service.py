@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.models.tenant import Tenant
+from app.core.tenant_registry import find_tenant_by_domain, find_tenant_by_id
 
 
 def get_all_tenants(db: Session):
@@ -9,14 +10,14 @@ def get_all_tenants(db: Session):
 
 
 def get_tenant_by_id(db: Session, tenant_id):
-    tenant = db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
+    tenant = find_tenant_by_id(db, tenant_id)
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
     return tenant
 
 
 def get_tenant_by_domain(db: Session, domain: str):
-    tenant = db.query(Tenant).filter(Tenant.domain == domain).first()
+    tenant = find_tenant_by_domain(db, domain)
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
     return tenant
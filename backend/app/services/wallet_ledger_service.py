@@ -0,0 +1,159 @@
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, literal, select, update
+
+from app.models.wallet import Wallet
+from app.models.wallet_transaction import WalletTransaction
+
+
+# Wallet balance changes as single guarded statements.
+#
+# A debit is
+#   UPDATE wallets SET balance = balance - :amount
+#   WHERE wallet_id = :id AND balance >= :amount RETURNING balance
+# with the matching wallet_transactions row inserted from that RETURNING in
+# the same statement. There is no SELECT ... FOR UPDATE beforehand: the row
+# lock is taken by the UPDATE and held only until the caller commits, and a
+# debit that would overdraw the wallet simply matches no row.
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    """
+    The wallet_transactions row written with a balance change.
+    amount is the signed amount stored on the row; by default the balance change.
+    """
+    transaction_type_id: int
+    reference_type: str
+    reference_id: uuid.UUID | None = None
+    amount: Decimal | None = None
+
+
+@dataclass(frozen=True)
+class WalletMove:
+    wallet_id: uuid.UUID
+    currency_id: int
+    balance_before: Decimal
+    balance_after: Decimal
+    transaction_id: uuid.UUID | None
+
+
+def wallet_lookup(*criteria):
+    """
+    Scalar subquery selecting one active wallet, so a debit or credit can
+    find the wallet and change it in the same statement.
+    """
+    return (
+        select(Wallet.wallet_id)
+        .where(Wallet.is_active.is_(True), *criteria)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def build_balance_update(wallet, delta: Decimal, required_balance: Decimal | None = None):
+    """
+    UPDATE adding `delta` to a wallet, RETURNING its new balance.
+    With required_balance the row only matches while balance >= required_balance.
+    `wallet` is a wallet_id or a wallet_lookup() subquery (active wallets only).
+    """
+    conditions = [Wallet.wallet_id == wallet]
+    if required_balance is not None:
+        conditions.append(Wallet.balance >= required_balance)
+
+    return (
+        update(Wallet)
+        .where(*conditions)
+        .values(balance=Wallet.balance + delta, updated_at=func.now())
+        .returning(Wallet.wallet_id, Wallet.currency_id, Wallet.balance)
+    )
+
+
+def move_wallet_balance(
+    db: Session,
+    wallet,
+    delta: Decimal,
+    entry: LedgerEntry | None = None,
+    required_balance: Decimal | None = None
+) -> WalletMove | None:
+    """
+    Applies `delta` to the wallet and writes `entry` in one statement.
+    Returns None when no wallet matched or the balance guard failed;
+    nothing is written in that case.
+    """
+    moved = build_balance_update(wallet, delta, required_balance)
+
+    if entry is None:
+        row = db.execute(moved).first()
+        transaction_id = None
+    else:
+        moved = moved.cte("moved")
+        transaction_id = uuid.uuid4()
+
+        ledger_row = insert(WalletTransaction).from_select(
+            [
+                "transaction_id",
+                "wallet_id",
+                "transaction_type_id",
+                "amount",
+                "balance_before",
+                "balance_after",
+                "reference_type",
+                "reference_id"
+            ],
+            select(
+                literal(transaction_id, WalletTransaction.transaction_id.type),
+                moved.c.wallet_id,
+                literal(entry.transaction_type_id),
+                literal(
+                    entry.amount if entry.amount is not None else delta,
+                    WalletTransaction.amount.type
+                ),
+                moved.c.balance - delta,
+                moved.c.balance,
+                literal(entry.reference_type, WalletTransaction.reference_type.type),
+                literal(entry.reference_id, WalletTransaction.reference_id.type)
+            )
+        ).cte("ledger_row")
+
+        row = db.execute(
+            select(moved.c.wallet_id, moved.c.currency_id, moved.c.balance)
+            .add_cte(ledger_row)
+        ).first()
+
+    if not row:
+        return None
+
+    return WalletMove(
+        wallet_id=row.wallet_id,
+        currency_id=row.currency_id,
+        balance_before=row.balance - delta,
+        balance_after=row.balance,
+        transaction_id=transaction_id
+    )
+
+
+def credit_wallet(db: Session, wallet, amount: Decimal, entry: LedgerEntry | None = None):
+    return move_wallet_balance(db, wallet, amount, entry)
+
+
+def debit_wallet(
+    db: Session,
+    wallet,
+    amount: Decimal,
+    entry: LedgerEntry | None = None,
+    allow_overdraft: bool = False
+):
+    """
+    Debits `amount` unless the balance is lower (returns None then).
+    """
+    return move_wallet_balance(
+        db,
+        wallet,
+        -amount,
+        entry,
+        required_balance=None if allow_overdraft else amount
+    )
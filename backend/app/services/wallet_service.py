@@ -1,95 +1,111 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from decimal import Decimal
-from sqlalchemy import desc, func
 from app.models.wallet import Wallet
 from app.models.wallet_transaction import WalletTransaction
 from app.models.transaction_type import TransactionType
+from app.core.reference_data import get_transaction_type_id, get_wallet_type_id
+from app.services.wallet_ledger_service import LedgerEntry, credit_wallet, wallet_lookup
+from app.core.pagination import keyset_page, DEFAULT_PAGE_SIZE
 
 from datetime import datetime, timedelta, date, timezone
 
 def deposit_to_wallet(db: Session, player_id: str, amount: float):
     deposit_amount = Decimal(str(amount))
 
-    wallet = (
-        db.query(Wallet)
-        .join(Wallet.wallet_type)
-        .filter(
+    move = credit_wallet(
+        db,
+        wallet_lookup(
             Wallet.player_id == player_id,
-            Wallet.is_active.is_(True),
-            Wallet.wallet_type.has(wallet_type_code="CASH")
+            Wallet.wallet_type_id == get_wallet_type_id(db, "CASH")
+        ),
+        deposit_amount,
+        LedgerEntry(
+            transaction_type_id=get_transaction_type_id(db, "DEPOSIT"),
+            reference_type="DEPOSIT"
         )
-        .with_for_update()
-        .first()
     )
 
-    if not wallet:
+    if not move:
         raise HTTPException(status_code=404, detail="CASH wallet not found")
 
-    txn_type = (
-        db.query(TransactionType)
-        .filter(TransactionType.transaction_code == "DEPOSIT")
-        .first()
-    )
-
-    if not txn_type:
-        raise HTTPException(status_code=500, detail="Transaction type missing")
-
-    balance_before: Decimal = wallet.balance
-    balance_after: Decimal = balance_before + deposit_amount
-
-    transaction = WalletTransaction(
-        wallet_id=wallet.wallet_id,
-        transaction_type_id=txn_type.transaction_type_id,
-        amount=deposit_amount,
-        balance_before=balance_before,
-        balance_after=balance_after,
-        reference_type="DEPOSIT",
-        reference_id=None
-        
-    )
-
-    wallet.balance = balance_after
-    db.add(transaction)
     db.commit()
-    db.refresh(wallet)
 
     return {
-        "wallet_id": str(wallet.wallet_id),
-        "balance_before": float(balance_before),
-        "balance_after": float(balance_after)
+        "wallet_id": str(move.wallet_id),
+        "balance_before": float(move.balance_before),
+        "balance_after": float(move.balance_after)
     }
 
 
-def get_player_transactions(db: Session, player_id: str, specific_date: date = None, days: int = None, txn_type: str = None, limit: int = 100):
-    query = db.query(WalletTransaction, TransactionType.transaction_code)\
+def utc_day_start(day: date):
+    return datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+
+
+def get_player_transactions(
+    db: Session,
+    player_id: str,
+    specific_date: date = None,
+    days: int = None,
+    txn_type: str = None,
+    start_date: date = None,
+    end_date: date = None,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE
+):
+    """
+    One page of the player's transactions, newest first.
+    Date filters are UTC timestamp ranges so the (wallet_id, created_at)
+    index can be used.
+    """
+    query = db.query(
+                WalletTransaction.transaction_id,
+                WalletTransaction.amount,
+                WalletTransaction.balance_before,
+                WalletTransaction.balance_after,
+                WalletTransaction.created_at,
+                TransactionType.transaction_code
+              )\
               .join(Wallet, Wallet.wallet_id == WalletTransaction.wallet_id)\
               .join(TransactionType, TransactionType.transaction_type_id == WalletTransaction.transaction_type_id)\
               .filter(Wallet.player_id == player_id)
 
     if specific_date:
-        
-        query = query.filter(func.date(WalletTransaction.created_at) == specific_date)
+        start_date = end_date = specific_date
     
     elif days:
     
         now_aware = datetime.now(timezone.utc)
-        start_date = now_aware - timedelta(days=days)
-        query = query.filter(WalletTransaction.created_at >= start_date)
+        query = query.filter(WalletTransaction.created_at >= now_aware - timedelta(days=days))
+
+    if start_date:
+        query = query.filter(WalletTransaction.created_at >= utc_day_start(start_date))
+
+    if end_date:
+        query = query.filter(WalletTransaction.created_at < utc_day_start(end_date + timedelta(days=1)))
 
     if txn_type:
         query = query.filter(TransactionType.transaction_code == txn_type.upper())
 
-    rows = query.order_by(desc(WalletTransaction.created_at)).limit(limit).all()
-
-    return [
-        {
-            "transaction_id": str(wt.transaction_id),
-            "type": code,
-            "amount": float(wt.amount),
-            "balance_before": float(wt.balance_before),
-            "balance_after": float(wt.balance_after),
-            "created_at": wt.created_at
-        }
-        for wt, code in rows
-    ]
\ No newline at end of file
+    rows, next_cursor = keyset_page(
+        query,
+        WalletTransaction.created_at,
+        WalletTransaction.transaction_id,
+        cursor,
+        limit
+    )
+
+    return {
+        "items": [
+            {
+                "transaction_id": str(r.transaction_id),
+                "type": r.transaction_code,
+                "amount": float(r.amount),
+                "balance_before": float(r.balance_before),
+                "balance_after": float(r.balance_after),
+                "created_at": r.created_at
+            }
+            for r in rows
+        ],
+        "next_cursor": next_cursor
+    }
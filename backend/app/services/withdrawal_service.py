@@ -1,3 +1,4 @@
+import uuid
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from decimal import Decimal
@@ -5,11 +6,10 @@ from decimal import Decimal
 from datetime import datetime, timezone 
 
 from app.models.wallet import Wallet
-from app.models.wallet_transaction import WalletTransaction
-from app.models.transaction_type import TransactionType
 from app.models.withdrawal import Withdrawal
-from app.models.wallet_type import WalletType
 from app.models.player import Player
+from app.core.reference_data import get_transaction_type_id, get_wallet_type_id
+from app.services.wallet_ledger_service import LedgerEntry, debit_wallet, wallet_lookup
 
 
 def withdraw_from_wallet(
@@ -37,40 +37,36 @@ def withdraw_from_wallet(
             detail=f"Withdrawal blocked due to KYC status: {player.kyc_status}"
         )
 
-    #  Fetch active CASH wallet (locked)
-    wallet = (
-        db.query(Wallet)
-        .join(WalletType)
-        .filter(
-            Wallet.player_id == player_id,
-            Wallet.tenant_id == tenant_id,
-            Wallet.is_active.is_(True),
-            WalletType.wallet_type_code == "CASH"
+    cash_wallet = (
+        Wallet.player_id == player_id,
+        Wallet.tenant_id == tenant_id,
+        Wallet.wallet_type_id == get_wallet_type_id(db, "CASH")
+    )
+    withdrawal_id = uuid.uuid4()
+
+    #  Debit the active CASH wallet and write the ledger row (guarded: balance >= amount)
+    move = debit_wallet(
+        db,
+        wallet_lookup(*cash_wallet),
+        withdraw_amount,
+        LedgerEntry(
+            transaction_type_id=get_transaction_type_id(db, "WITHDRAWAL"),
+            reference_type="WITHDRAWAL",
+            reference_id=withdrawal_id,
+            amount=withdraw_amount
         )
-        .with_for_update()
-        .first()
     )
 
-    if not wallet:
-        raise HTTPException(status_code=404, detail="CASH wallet not found")
-
-    #  Balance check
-    if wallet.balance < withdraw_amount:
+    if not move:
+        wallet_exists = (
+            db.query(Wallet.wallet_id)
+            .filter(Wallet.is_active.is_(True), *cash_wallet)
+            .first()
+        )
+        if not wallet_exists:
+            raise HTTPException(status_code=404, detail="CASH wallet not found")
         raise HTTPException(status_code=400, detail="Insufficient balance")
 
-    #  Fetch WITHDRAWAL transaction type
-    txn_type = (
-        db.query(TransactionType)
-        .filter(TransactionType.transaction_code == "WITHDRAWAL")
-        .first()
-    )
-
-    if not txn_type:
-        raise HTTPException(status_code=500, detail="Transaction type missing")
-
-    balance_before = wallet.balance
-    balance_after = balance_before - withdraw_amount
-
     #  Determine withdrawal status via KYC
     withdrawal_status = (
         "requested"
@@ -80,42 +76,24 @@ def withdraw_from_wallet(
 
     #  Create withdrawal record
     withdrawal = Withdrawal(
+        withdrawal_id=withdrawal_id,
         player_id=player_id,
         tenant_id=tenant_id,
-        wallet_id=wallet.wallet_id,
+        wallet_id=move.wallet_id,
         amount=withdraw_amount,
-        currency_id=wallet.currency_id,
+        currency_id=move.currency_id,
         status=withdrawal_status
         # requested_at is handled by DB server_default=func.now()
     )
 
     db.add(withdrawal)
-    db.flush()  # get withdrawal_id
-
-    #  Wallet transaction ledger
-    transaction = WalletTransaction(
-        wallet_id=wallet.wallet_id,
-        transaction_type_id=txn_type.transaction_type_id,
-        amount=withdraw_amount,
-        balance_before=balance_before,
-        balance_after=balance_after,
-        reference_type="WITHDRAWAL",
-        reference_id=withdrawal.withdrawal_id
-        # created_at is handled by DB server_default=func.now()
-    )
-
-    # 8️s Apply wallet update
-    wallet.balance = balance_after
-
-    db.add(transaction)
     db.commit()
-    db.refresh(wallet)
 
     return {
         "withdrawal_id": str(withdrawal.withdrawal_id),
-        "wallet_id": str(wallet.wallet_id),
-        "balance_before": float(balance_before),
-        "balance_after": float(balance_after),
+        "wallet_id": str(move.wallet_id),
+        "balance_before": float(move.balance_before),
+        "balance_after": float(move.balance_after),
         "status": withdrawal.status,
         "kyc_status": player.kyc_status
     }
\ No newline at end of file
@@ -0,0 +1,155 @@
+import argparse
+import asyncio
+import re
+import sys
+import time
+from decimal import Decimal
+
+from anyio import to_thread
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_async_db, get_db
+from app.services.games.dice_service import place_dice_bet
+
+
+# Bet hot path throughput, threadpool vs AsyncSession.run_sync.
+#
+# Both variants call the same place_dice_bet service for an existing player
+# with an active dice session and a funded CASH wallet:
+#   threadpool - sync route on the sync engine, the service runs in
+#                Starlette's threadpool
+#   run-sync   - async route on the asyncpg engine, the service runs via
+#                AsyncSession.run_sync on the event loop
+# The service itself is the same sync code in both, so this measures the
+# dispatch model, not async database I/O. Requests are sent straight into
+# the ASGI app, at the same concurrency, threadpool size and connection
+# pool size for both.
+#
+# Every request places and settles a real 1.00 bet, so it refuses to run
+# unless DB_NAME names a test/bench/dev database. From backend/:
+#
+#   python -m benchmarks.bet_paths --player-id ... --tenant-id ... --game-id ...
+
+# DB_NAME must contain one of these as a word, e.g. casino_bench
+NON_PRODUCTION_DATABASE = re.compile(r"(^|[_-])(test|bench|benchmark|dev|local)([_-]|$)")
+
+
+def build_benchmark_app(player_id, tenant_id, game_id, amount: Decimal) -> FastAPI:
+    app = FastAPI()
+    bet = {
+        "player_id": player_id,
+        "tenant_id": tenant_id,
+        "game_id": game_id,
+        "bet_choice": "EVEN",
+        "amount": amount
+    }
+
+    @app.post("/threadpool")
+    def threadpool_bet(db: Session = Depends(get_db)):
+        place_dice_bet(db, **bet)
+        return {"ok": True}
+
+    @app.post("/run-sync")
+    async def run_sync_bet(db: AsyncSession = Depends(get_async_db)):
+        await db.run_sync(place_dice_bet, **bet)
+        return {"ok": True}
+
+    return app
+
+
+async def post(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-length", b"0")],
+        "client": ("benchmark", 0),
+        "server": ("benchmark", 80)
+    }
+    status = 500
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app: FastAPI, path: str, concurrency: int, seconds: float):
+    """
+    Runs `concurrency` request loops for `seconds`.
+    Returns (requests per second, error responses).
+    """
+    deadline = time.perf_counter() + seconds
+    counts = {"ok": 0, "errors": 0}
+
+    async def loop():
+        while time.perf_counter() < deadline:
+            if await post(app, path) < 400:
+                counts["ok"] += 1
+            else:
+                counts["errors"] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return round(counts["ok"] / elapsed, 1), counts["errors"]
+
+
+async def benchmark_bet_paths(player_id, tenant_id, game_id, concurrency: int, seconds: float):
+    # Same number of workers for both: threads for the sync route,
+    # concurrent requests for the async one
+    to_thread.current_default_thread_limiter().total_tokens = concurrency
+
+    app = build_benchmark_app(player_id, tenant_id, game_id, Decimal("1.00"))
+    results = {}
+    for path in ("/threadpool", "/run-sync"):
+        # Warm both connection pools before timing
+        await measure(app, path, concurrency, 1)
+        results[path.strip("/")] = await measure(app, path, concurrency, seconds)
+    return results
+
+
+if __name__ == "__main__":
+    if not NON_PRODUCTION_DATABASE.search(settings.DB_NAME):
+        print(
+            f"Refusing to run against database '{settings.DB_NAME}' on {settings.DB_HOST}: "
+            "this places real bets. Point DB_NAME at a test/bench/dev database."
+        )
+        sys.exit(2)
+
+    parser = argparse.ArgumentParser(description="Bet path throughput: threadpool vs run_sync")
+    parser.add_argument("--player-id", required=True)
+    parser.add_argument("--tenant-id", required=True)
+    parser.add_argument("--game-id", required=True)
+    parser.add_argument("--concurrency", type=int, default=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark_bet_paths(
+        args.player_id, args.tenant_id, args.game_id, args.concurrency, args.seconds
+    ))
+
+    print(f"database={settings.DB_NAME}@{settings.DB_HOST}")
+    print(f"concurrency={args.concurrency}, pool={settings.DB_POOL_SIZE}+{settings.DB_MAX_OVERFLOW}")
+    for name, (rps, errors) in results.items():
+        print(f"{name}: {rps} req/s ({errors} errors)")
+
+    baseline = results["threadpool"][0]
+    if baseline:
+        print(f"run-sync / threadpool: {round(results['run-sync'][0] / baseline, 2)}x")
@@ -0,0 +1,29 @@
+-- Per-player running wager totals used by responsible gaming checks.
+-- Maintained by the game settlement path; rebuild with
+-- POST /super/responsible-gaming/ledger/rebuild.
+
+CREATE TABLE IF NOT EXISTS player_wager_totals (
+    player_id      UUID          NOT NULL REFERENCES players(player_id),
+    period_type    VARCHAR(5)    NOT NULL,
+    period_start   DATE          NOT NULL,
+    total_wagered  NUMERIC(18,2) NOT NULL DEFAULT 0,
+    updated_at     TIMESTAMPTZ   DEFAULT now(),
+    PRIMARY KEY (player_id, period_type, period_start),
+    CHECK (period_type IN ('DAY', 'MONTH'))
+);
+
+-- Backfill from existing bets (UTC periods)
+INSERT INTO player_wager_totals (player_id, period_type, period_start, total_wagered)
+SELECT gs.player_id, 'DAY', (b.placed_at AT TIME ZONE 'UTC')::date, SUM(b.bet_amount)
+FROM bets b
+JOIN game_rounds gr ON gr.round_id = b.round_id
+JOIN game_sessions gs ON gs.session_id = gr.session_id
+GROUP BY 1, 3
+UNION ALL
+SELECT gs.player_id, 'MONTH', date_trunc('month', b.placed_at AT TIME ZONE 'UTC')::date, SUM(b.bet_amount)
+FROM bets b
+JOIN game_rounds gr ON gr.round_id = b.round_id
+JOIN game_sessions gs ON gs.session_id = gr.session_id
+GROUP BY 1, 3
+ON CONFLICT (player_id, period_type, period_start)
+DO UPDATE SET total_wagered = EXCLUDED.total_wagered, updated_at = now();
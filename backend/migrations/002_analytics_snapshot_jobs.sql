@@ -0,0 +1,22 @@
+-- Per-tenant, per-day status of the daily analytics snapshot job.
+-- Written by the scheduler; days without a 'done' row are caught up
+-- on the next run (see SNAPSHOT_CATCHUP_DAYS).
+
+CREATE TABLE IF NOT EXISTS analytics_snapshot_jobs (
+    tenant_id        UUID          NOT NULL REFERENCES tenants(tenant_id),
+    snapshot_date    DATE          NOT NULL,
+    status           VARCHAR(10)   NOT NULL DEFAULT 'pending',
+    attempts         INTEGER       NOT NULL DEFAULT 0,
+    games_processed  INTEGER,
+    bets_processed   INTEGER,
+    duration_ms      NUMERIC(12,2),
+    error            TEXT,
+    started_at       TIMESTAMPTZ,
+    finished_at      TIMESTAMPTZ,
+    updated_at       TIMESTAMPTZ   DEFAULT now(),
+    PRIMARY KEY (tenant_id, snapshot_date),
+    CHECK (status IN ('pending', 'running', 'done', 'failed'))
+);
+
+CREATE INDEX IF NOT EXISTS ix_analytics_snapshot_jobs_date_status
+    ON analytics_snapshot_jobs (snapshot_date, status);
@@ -0,0 +1,25 @@
+-- Hourly analytics rollup, maintained incrementally from bets by the
+-- scheduler (job "hourly_rollup"). Timeseries endpoints combine closed days
+-- from analytics_snapshots with these buckets for the current day.
+
+CREATE TABLE IF NOT EXISTS analytics_hourly (
+    tenant_id       UUID          NOT NULL REFERENCES tenants(tenant_id),
+    game_id         UUID          NOT NULL REFERENCES games(game_id),
+    bucket_start    TIMESTAMPTZ   NOT NULL,
+    bet_count       INTEGER       NOT NULL DEFAULT 0,
+    total_bets      NUMERIC(18,2) NOT NULL DEFAULT 0,
+    total_wins      NUMERIC(18,2) NOT NULL DEFAULT 0,
+    active_players  INTEGER       NOT NULL DEFAULT 0,
+    updated_at      TIMESTAMPTZ   DEFAULT now(),
+    PRIMARY KEY (tenant_id, game_id, bucket_start)
+);
+
+-- Platform-wide timeseries scan by time
+CREATE INDEX IF NOT EXISTS ix_analytics_hourly_bucket_start
+    ON analytics_hourly (bucket_start);
+
+CREATE TABLE IF NOT EXISTS analytics_watermarks (
+    job_name    VARCHAR(50)  PRIMARY KEY,
+    watermark   TIMESTAMPTZ  NOT NULL,
+    updated_at  TIMESTAMPTZ  DEFAULT now()
+);
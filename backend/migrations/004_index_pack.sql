@@ -0,0 +1,79 @@
+-- Secondary indexes for the hot game, wallet, history, notification and
+-- analytics lookups. Mirrors the Index() entries in app/models.
+--
+-- CONCURRENTLY cannot run inside a transaction block; run this file with
+-- autocommit (e.g. psql -f), not wrapped in BEGIN/COMMIT.
+--
+-- tests/test_index_plans.py EXPLAINs every hot query against a seeded
+-- schema with all migrations applied (006 and 008 recreate some of these).
+
+-- Bets: snapshot / hourly rollup range scans, round lookup, per-wallet today totals
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bets_placed_at
+    ON bets (placed_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bets_round_id
+    ON bets (round_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bets_wallet_id_placed_at
+    ON bets (wallet_id, placed_at);
+
+-- Rounds by session (history, round numbering)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_game_rounds_session_id_round_number
+    ON game_rounds (session_id, round_number);
+
+-- Sessions: active session lookup, history cursor, per-tenant snapshot window
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_game_sessions_player_game_status
+    ON game_sessions (player_id, game_id, status);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_game_sessions_player_started_at
+    ON game_sessions (player_id, started_at, session_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_game_sessions_tenant_started_at
+    ON game_sessions (tenant_id, started_at);
+
+-- Wallet transaction history cursor (created_at, transaction_id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_wallet_transactions_wallet_created_at
+    ON wallet_transactions (wallet_id, created_at, transaction_id);
+
+-- Wallet lookup by player / tenant / type (CASH, BONUS)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_wallets_player_tenant_type
+    ON wallets (player_id, tenant_id, wallet_type_id);
+
+-- Latest notifications per user
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_user_created_at
+    ON notifications (user_id, created_at);
+
+-- Users per tenant by role / registration time
+-- (users(tenant_id, email) is already covered by uq_tenant_email)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_tenant_created_at
+    ON users (tenant_id, created_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_tenant_role
+    ON users (tenant_id, role_id);
+
+-- Withdrawals: player history, tenant queues and stale requests
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_withdrawals_player_requested_at
+    ON withdrawals (player_id, requested_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_withdrawals_tenant_status_requested_at
+    ON withdrawals (tenant_id, status, requested_at);
+
+-- Active / claimable bonus lookup per player
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bonus_usage_player_status
+    ON bonus_usage (player_id, status);
+
+-- Raffle entries per player
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_raffle_entries_player_created_at
+    ON raffle_entries (player_id, created_at);
+
+-- Pending KYC document per user
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kyc_documents_user_status
+    ON kyc_documents (user_id, verification_status);
+
+-- Audit log per tenant, newest first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_tenant_created_at
+    ON audit_logs (tenant_id, created_at);
+
+-- Tenant timeseries over snapshot_date
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_snapshots_tenant_date
+    ON analytics_snapshots (tenant_id, snapshot_date);
@@ -0,0 +1,33 @@
+-- Denormalized fact columns on bets so per-tenant, per-player and per-game
+-- aggregates read bets alone instead of joining game_rounds and
+-- game_sessions. New bets get these from the settlement path.
+
+ALTER TABLE bets ADD COLUMN IF NOT EXISTS tenant_id  UUID REFERENCES tenants(tenant_id);
+ALTER TABLE bets ADD COLUMN IF NOT EXISTS player_id  UUID REFERENCES players(player_id);
+ALTER TABLE bets ADD COLUMN IF NOT EXISTS game_id    UUID REFERENCES games(game_id);
+ALTER TABLE bets ADD COLUMN IF NOT EXISTS session_id UUID REFERENCES game_sessions(session_id);
+
+-- Backfill existing bets from their round's session
+UPDATE bets b
+SET tenant_id  = gs.tenant_id,
+    player_id  = gs.player_id,
+    game_id    = gs.game_id,
+    session_id = gs.session_id
+FROM game_rounds gr
+JOIN game_sessions gs ON gs.session_id = gr.session_id
+WHERE gr.round_id = b.round_id
+  AND b.session_id IS NULL;
+
+ALTER TABLE bets ALTER COLUMN tenant_id  SET NOT NULL;
+ALTER TABLE bets ALTER COLUMN player_id  SET NOT NULL;
+ALTER TABLE bets ALTER COLUMN game_id    SET NOT NULL;
+ALTER TABLE bets ALTER COLUMN session_id SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS ix_bets_tenant_game_placed_at
+    ON bets (tenant_id, game_id, placed_at);
+
+CREATE INDEX IF NOT EXISTS ix_bets_player_placed_at
+    ON bets (player_id, placed_at);
+
+CREATE INDEX IF NOT EXISTS ix_bets_session_id
+    ON bets (session_id);
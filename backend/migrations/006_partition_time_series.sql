@@ -0,0 +1,151 @@
+-- Monthly RANGE partitioning of bets (placed_at), game_rounds (started_at)
+-- and wallet_transactions (created_at).
+--
+-- Each table is rebuilt as a partitioned table with one partition per UTC
+-- month, named <table>_pYYYYMM, from the oldest existing row up to three
+-- months ahead, plus a <table>_default catch-all. Future months are created
+-- by the partition_maintenance scheduler job (app/services/partition_service.py)
+-- so the default partitions should stay empty.
+--
+-- Postgres requires the partition key in every primary key / unique index,
+-- so the primary keys become (id, timestamp). bets.round_id can no longer
+-- reference game_rounds (round_id alone is not unique on the parent); the
+-- settlement path writes both rows in the same statement.
+--
+-- The tables are copied under an ACCESS EXCLUSIVE lock: run in a maintenance
+-- window, after a backup, in a single transaction.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION create_monthly_partition(parent TEXT, month_start DATE)
+RETURNS TEXT AS $$
+DECLARE
+    partition_name TEXT := parent || '_p' || to_char(month_start, 'YYYYMM');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        parent,
+        month_start::timestamp AT TIME ZONE 'UTC',
+        (month_start + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC'
+    );
+
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent TEXT, first_month DATE, last_month DATE)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', first_month)::date;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        PERFORM create_monthly_partition(parent, month_start);
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- ---------------------------------------------------------------------------
+-- bets (first: it holds the foreign key to the old game_rounds)
+
+UPDATE bets SET placed_at = COALESCE(settled_at, now()) WHERE placed_at IS NULL;
+
+ALTER TABLE bets RENAME TO bets_unpartitioned;
+
+CREATE TABLE bets (LIKE bets_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (placed_at);
+
+ALTER TABLE bets ALTER COLUMN placed_at SET NOT NULL;
+
+SELECT create_monthly_partitions(
+    'bets',
+    COALESCE((SELECT min(placed_at AT TIME ZONE 'UTC')::date FROM bets_unpartitioned), CURRENT_DATE),
+    (CURRENT_DATE + INTERVAL '3 months')::date
+);
+CREATE TABLE bets_default PARTITION OF bets DEFAULT;
+
+INSERT INTO bets SELECT * FROM bets_unpartitioned;
+DROP TABLE bets_unpartitioned;
+
+ALTER TABLE bets ADD PRIMARY KEY (bet_id, placed_at);
+ALTER TABLE bets ADD FOREIGN KEY (wallet_id)       REFERENCES wallets(wallet_id);
+ALTER TABLE bets ADD FOREIGN KEY (tenant_id)       REFERENCES tenants(tenant_id);
+ALTER TABLE bets ADD FOREIGN KEY (player_id)       REFERENCES players(player_id);
+ALTER TABLE bets ADD FOREIGN KEY (game_id)         REFERENCES games(game_id);
+ALTER TABLE bets ADD FOREIGN KEY (session_id)      REFERENCES game_sessions(session_id);
+ALTER TABLE bets ADD FOREIGN KEY (bet_currency_id) REFERENCES currencies(currency_id);
+
+CREATE INDEX ix_bets_round_id              ON bets (round_id);
+CREATE INDEX ix_bets_wallet_id_placed_at   ON bets (wallet_id, placed_at);
+CREATE INDEX ix_bets_placed_at             ON bets (placed_at);
+CREATE INDEX ix_bets_tenant_game_placed_at ON bets (tenant_id, game_id, placed_at);
+CREATE INDEX ix_bets_player_placed_at      ON bets (player_id, placed_at);
+CREATE INDEX ix_bets_session_id            ON bets (session_id);
+
+
+-- ---------------------------------------------------------------------------
+-- game_rounds
+
+UPDATE game_rounds SET started_at = COALESCE(ended_at, now()) WHERE started_at IS NULL;
+
+ALTER TABLE game_rounds RENAME TO game_rounds_unpartitioned;
+
+CREATE TABLE game_rounds (LIKE game_rounds_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (started_at);
+
+ALTER TABLE game_rounds ALTER COLUMN started_at SET NOT NULL;
+
+SELECT create_monthly_partitions(
+    'game_rounds',
+    COALESCE((SELECT min(started_at AT TIME ZONE 'UTC')::date FROM game_rounds_unpartitioned), CURRENT_DATE),
+    (CURRENT_DATE + INTERVAL '3 months')::date
+);
+CREATE TABLE game_rounds_default PARTITION OF game_rounds DEFAULT;
+
+INSERT INTO game_rounds SELECT * FROM game_rounds_unpartitioned;
+DROP TABLE game_rounds_unpartitioned;
+
+ALTER TABLE game_rounds ADD PRIMARY KEY (round_id, started_at);
+ALTER TABLE game_rounds ADD FOREIGN KEY (session_id) REFERENCES game_sessions(session_id);
+
+CREATE INDEX ix_game_rounds_session_id_round_number ON game_rounds (session_id, round_number);
+
+
+-- ---------------------------------------------------------------------------
+-- wallet_transactions
+
+UPDATE wallet_transactions SET created_at = now() WHERE created_at IS NULL;
+
+ALTER TABLE wallet_transactions RENAME TO wallet_transactions_unpartitioned;
+
+CREATE TABLE wallet_transactions (LIKE wallet_transactions_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (created_at);
+
+ALTER TABLE wallet_transactions ALTER COLUMN created_at SET NOT NULL;
+
+SELECT create_monthly_partitions(
+    'wallet_transactions',
+    COALESCE((SELECT min(created_at AT TIME ZONE 'UTC')::date FROM wallet_transactions_unpartitioned), CURRENT_DATE),
+    (CURRENT_DATE + INTERVAL '3 months')::date
+);
+CREATE TABLE wallet_transactions_default PARTITION OF wallet_transactions DEFAULT;
+
+INSERT INTO wallet_transactions SELECT * FROM wallet_transactions_unpartitioned;
+DROP TABLE wallet_transactions_unpartitioned;
+
+ALTER TABLE wallet_transactions ADD PRIMARY KEY (transaction_id, created_at);
+ALTER TABLE wallet_transactions ADD FOREIGN KEY (wallet_id) REFERENCES wallets(wallet_id);
+ALTER TABLE wallet_transactions ADD FOREIGN KEY (transaction_type_id)
+    REFERENCES transaction_types(transaction_type_id);
+
+CREATE INDEX ix_wallet_transactions_wallet_created_at
+    ON wallet_transactions (wallet_id, created_at, transaction_id);
+
+COMMIT;
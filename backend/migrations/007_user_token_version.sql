@@ -0,0 +1,5 @@
+-- Token version for stateless JWT auth. Access tokens carry it as "ver";
+-- incrementing it (e.g. on password change) revokes every token issued
+-- before the change.
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,107 @@
+-- Per-session round counter.
+--
+-- game_sessions.rounds_played holds the last round number handed out.
+-- Settlement advances it with UPDATE ... RETURNING in the same statement
+-- that inserts the rounds, instead of counting game_rounds for the session
+-- on every bet (which was linear in the session length and let concurrent
+-- requests pick the same number).
+--
+-- game_rounds is partitioned by started_at, and Postgres only allows
+-- unique indexes on a partitioned table when they include the partition
+-- key. (session_id, round_number) is therefore enforced by a UNIQUE index
+-- on every monthly partition; create_monthly_partition() now adds it to
+-- new game_rounds partitions.
+--
+-- Existing rounds are renumbered 1..n per session in play order so that
+-- numbers duplicated by the old race do not block the unique indexes.
+-- Run in a maintenance window, in a single transaction.
+
+BEGIN;
+
+ALTER TABLE game_sessions ADD COLUMN IF NOT EXISTS rounds_played INTEGER NOT NULL DEFAULT 0;
+
+
+-- ---------------------------------------------------------------------------
+-- Renumber and backfill
+
+UPDATE game_rounds gr
+SET round_number = numbered.rn
+FROM (
+    SELECT
+        round_id,
+        started_at,
+        row_number() OVER (
+            PARTITION BY session_id
+            ORDER BY started_at, round_number, round_id
+        ) AS rn
+    FROM game_rounds
+) numbered
+WHERE gr.round_id = numbered.round_id
+  AND gr.started_at = numbered.started_at
+  AND gr.round_number <> numbered.rn;
+
+UPDATE game_sessions gs
+SET rounds_played = counts.rounds
+FROM (
+    SELECT session_id, count(*) AS rounds
+    FROM game_rounds
+    GROUP BY session_id
+) counts
+WHERE gs.session_id = counts.session_id;
+
+
+-- ---------------------------------------------------------------------------
+-- Unique (session_id, round_number) per partition
+
+CREATE OR REPLACE FUNCTION create_monthly_partition(parent TEXT, month_start DATE)
+RETURNS TEXT AS $$
+DECLARE
+    partition_name TEXT := parent || '_p' || to_char(month_start, 'YYYYMM');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        parent,
+        month_start::timestamp AT TIME ZONE 'UTC',
+        (month_start + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC'
+    );
+
+    IF parent = 'game_rounds' THEN
+        EXECUTE format(
+            'CREATE UNIQUE INDEX %I ON %I (session_id, round_number)',
+            partition_name || '_session_round_key',
+            partition_name
+        );
+    END IF;
+
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- The per-partition unique indexes replace the plain parent index
+DROP INDEX IF EXISTS ix_game_rounds_session_id_round_number;
+
+DO $$
+DECLARE
+    partition_name TEXT;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'game_rounds'::regclass
+    LOOP
+        EXECUTE format(
+            'CREATE UNIQUE INDEX IF NOT EXISTS %I ON %I (session_id, round_number)',
+            partition_name || '_session_round_key',
+            partition_name
+        );
+    END LOOP;
+END;
+$$;
+
+COMMIT;
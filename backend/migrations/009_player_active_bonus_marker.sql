@@ -0,0 +1,23 @@
+-- Per-player "has active bonus" marker.
+--
+-- players.has_active_bonus is true while the player has a bonus_usage row
+-- in status 'active'. Settlement reads it with the rest of the bet context
+-- and skips bonus wagering for everyone else. bonus_service keeps it in
+-- step when a bonus is activated, becomes claimable, expires or is cancelled.
+--
+-- Overdue bonuses are expired by the bonus_expiry scheduler job in one
+-- set-based pass; the partial index keeps that scan to active rows.
+
+ALTER TABLE players ADD COLUMN IF NOT EXISTS has_active_bonus BOOLEAN NOT NULL DEFAULT false;
+
+UPDATE players p
+SET has_active_bonus = true
+WHERE EXISTS (
+    SELECT 1 FROM bonus_usage bu
+    WHERE bu.player_id = p.player_id
+      AND bu.status = 'active'
+);
+
+CREATE INDEX IF NOT EXISTS ix_bonus_usage_active_expired_at
+    ON bonus_usage (expired_at)
+    WHERE status = 'active';
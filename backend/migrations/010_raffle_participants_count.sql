@@ -0,0 +1,21 @@
+-- Maintained participant counter on raffle_jackpots.
+--
+-- join_jackpot_logic increments participants_count in the same transaction
+-- that inserts the raffle_entries row (the jackpot row is locked FOR UPDATE),
+-- so jackpot listings read the count from the jackpot itself instead of
+-- running COUNT(*) over raffle_entries per jackpot.
+
+ALTER TABLE raffle_jackpots ADD COLUMN IF NOT EXISTS participants_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE raffle_jackpots j
+SET participants_count = e.entries
+FROM (
+    SELECT jackpot_id, COUNT(*) AS entries
+    FROM raffle_entries
+    GROUP BY jackpot_id
+) e
+WHERE e.jackpot_id = j.jackpot_id;
+
+-- Player listing: a tenant's active/completed jackpots in one currency, newest first
+CREATE INDEX IF NOT EXISTS ix_raffle_jackpots_tenant_currency_status_created
+    ON raffle_jackpots (tenant_id, currency_id, status, created_at DESC);
@@ -0,0 +1,39 @@
+-- Numbered raffle entries and auditable draws.
+--
+-- raffle_entries.entry_number runs 1..participants_count per jackpot and is
+-- assigned by join_jackpot_logic under the jackpot row lock. A draw picks
+-- the winning number from a random seed and fetches that one entry through
+-- uq_jackpot_entry_number instead of ORDER BY random() over all entries.
+-- The seed and winning number are stored on the jackpot so the draw can be
+-- recomputed: sha256('<draw_seed>:<jackpot_id>') mod participants_count + 1.
+
+ALTER TABLE raffle_entries ADD COLUMN IF NOT EXISTS entry_number INTEGER;
+
+UPDATE raffle_entries e
+SET entry_number = n.entry_number
+FROM (
+    SELECT entry_id,
+           row_number() OVER (PARTITION BY jackpot_id ORDER BY created_at, entry_id) AS entry_number
+    FROM raffle_entries
+) n
+WHERE n.entry_id = e.entry_id;
+
+ALTER TABLE raffle_entries ALTER COLUMN entry_number SET NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jackpot_entry_number
+    ON raffle_entries (jackpot_id, entry_number);
+
+-- Keep the maintained counter in step with the numbering
+UPDATE raffle_jackpots j
+SET participants_count = COALESCE(
+    (SELECT MAX(entry_number) FROM raffle_entries e WHERE e.jackpot_id = j.jackpot_id),
+    0
+);
+
+ALTER TABLE raffle_jackpots ADD COLUMN IF NOT EXISTS draw_seed VARCHAR(64);
+ALTER TABLE raffle_jackpots ADD COLUMN IF NOT EXISTS winning_entry_number INTEGER;
+
+-- raffle_auto_draw job: active jackpots that are due
+CREATE INDEX IF NOT EXISTS ix_raffle_jackpots_active_draw_at
+    ON raffle_jackpots (draw_at)
+    WHERE status = 'active';
@@ -0,0 +1,271 @@
+import json
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+
+# Every hot lookup must be answered by an index after all migrations have
+# run. 004 created the index pack; 006 rebuilt bets, game_rounds and
+# wallet_transactions as partitioned tables and recreated their indexes by
+# hand, and 008 swapped the game_rounds index for per-partition unique ones.
+#
+# Plans are taken with enable_seqscan off so a small seeded table still
+# shows whether a usable index exists, and a scan only counts when the
+# index actually carries a condition (not a full index walk plus filter).
+
+INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+SEEDED_TABLES = (
+    "bets", "game_rounds", "wallet_transactions", "game_sessions",
+    "notifications", "withdrawals", "users", "wallets"
+)
+
+HOT_QUERIES = {
+    # Wallet history cursor
+    "wallet_transactions_history": (
+        "SELECT * FROM wallet_transactions WHERE wallet_id = :wallet_id "
+        "ORDER BY created_at DESC, transaction_id DESC LIMIT 50"
+    ),
+    # Hourly rollup / snapshot window
+    "bets_placed_at_window": (
+        "SELECT tenant_id, game_id, sum(bet_amount) FROM bets "
+        "WHERE placed_at >= now() - interval '2 hours' AND placed_at < now() "
+        "GROUP BY tenant_id, game_id"
+    ),
+    "bets_by_round": "SELECT * FROM bets WHERE round_id = :round_id",
+    "bets_wallet_today": (
+        "SELECT sum(bet_amount) FROM bets "
+        "WHERE wallet_id = :wallet_id AND placed_at >= date_trunc('day', now())"
+    ),
+    "bets_tenant_game_window": (
+        "SELECT sum(bet_amount) FROM bets WHERE tenant_id = :tenant_id "
+        "AND game_id = :game_id AND placed_at >= now() - interval '1 day'"
+    ),
+    "bets_player_window": (
+        "SELECT sum(bet_amount) FROM bets WHERE player_id = :player_id "
+        "AND placed_at >= now() - interval '1 day'"
+    ),
+    "bets_by_session": "SELECT * FROM bets WHERE session_id = :session_id",
+    # Round history / round numbering
+    "game_rounds_by_session": (
+        "SELECT * FROM game_rounds WHERE session_id = :session_id ORDER BY round_number"
+    ),
+    # Active session, session history, tenant window
+    "game_sessions_active": (
+        "SELECT * FROM game_sessions WHERE player_id = :player_id "
+        "AND game_id = :game_id AND status = 'active'"
+    ),
+    "game_sessions_history": (
+        "SELECT * FROM game_sessions WHERE player_id = :player_id "
+        "ORDER BY started_at DESC, session_id DESC LIMIT 50"
+    ),
+    "game_sessions_tenant_window": (
+        "SELECT count(*) FROM game_sessions WHERE tenant_id = :tenant_id "
+        "AND started_at >= now() - interval '1 day'"
+    ),
+    "wallets_by_type": (
+        "SELECT * FROM wallets WHERE player_id = :player_id "
+        "AND tenant_id = :tenant_id AND wallet_type_id = 1"
+    ),
+    "notifications_latest": (
+        "SELECT * FROM notifications WHERE user_id = :player_id "
+        "ORDER BY created_at DESC LIMIT 20"
+    ),
+    "users_tenant_role": "SELECT * FROM users WHERE tenant_id = :tenant_id AND role_id = 1",
+    "users_tenant_recent": (
+        "SELECT * FROM users WHERE tenant_id = :tenant_id ORDER BY created_at DESC LIMIT 50"
+    ),
+    "withdrawals_player_history": (
+        "SELECT * FROM withdrawals WHERE player_id = :player_id "
+        "ORDER BY requested_at DESC LIMIT 50"
+    ),
+    "withdrawals_tenant_queue": (
+        "SELECT * FROM withdrawals WHERE tenant_id = :tenant_id "
+        "AND status = 'requested' ORDER BY requested_at"
+    ),
+    "bonus_usage_active": (
+        "SELECT * FROM bonus_usage WHERE player_id = :player_id AND status = 'active'"
+    ),
+    "bonus_usage_overdue": (
+        "SELECT * FROM bonus_usage WHERE status = 'active' AND expired_at < now()"
+    ),
+    "raffle_entries_player": (
+        "SELECT * FROM raffle_entries WHERE player_id = :player_id "
+        "ORDER BY created_at DESC LIMIT 50"
+    ),
+    "raffle_entry_by_number": (
+        "SELECT * FROM raffle_entries WHERE jackpot_id = :jackpot_id AND entry_number = 1"
+    ),
+    "raffle_jackpots_listing": (
+        "SELECT * FROM raffle_jackpots WHERE tenant_id = :tenant_id AND currency_id = 1 "
+        "AND status IN ('active', 'completed') ORDER BY created_at DESC"
+    ),
+    "kyc_pending_document": (
+        "SELECT * FROM kyc_documents WHERE user_id = :player_id "
+        "AND verification_status = 'pending'"
+    ),
+    "audit_logs_tenant": (
+        "SELECT * FROM audit_logs WHERE tenant_id = :tenant_id "
+        "ORDER BY created_at DESC LIMIT 50"
+    ),
+    "analytics_snapshots_tenant_range": (
+        "SELECT * FROM analytics_snapshots WHERE tenant_id = :tenant_id "
+        "AND snapshot_date BETWEEN current_date - 30 AND current_date"
+    ),
+    "analytics_hourly_window": (
+        "SELECT * FROM analytics_hourly WHERE bucket_start >= now() - interval '48 hours'"
+    ),
+    "player_wager_totals_usage": (
+        "SELECT total_wagered FROM player_wager_totals WHERE player_id = :player_id "
+        "AND period_type = 'DAY' AND period_start = current_date"
+    ),
+}
+
+
+def plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+@pytest.fixture(scope="module")
+def seeded(engine, session_factory):
+    """
+    One player world plus a few thousand rows in the high-volume tables.
+    """
+    ids = {
+        "tenant_id": uuid.uuid4(),
+        "player_id": uuid.uuid4(),
+        "game_id": uuid.uuid4(),
+        "session_id": uuid.uuid4(),
+        "wallet_id": uuid.uuid4(),
+        "round_id": uuid.uuid4(),
+        "jackpot_id": uuid.uuid4()
+    }
+    suffix = ids["tenant_id"].hex[:8]
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO tenants (tenant_id, tenant_name, domain) VALUES (:tenant_id, :name, :domain)"),
+            {**ids, "name": f"Plan tenant {suffix}", "domain": f"plans-{suffix}.test"}
+        )
+        conn.execute(
+            text(
+                "INSERT INTO users (user_id, role_id, tenant_id, email, password_hash, created_at) "
+                "SELECT CASE WHEN n = 1 THEN CAST(:player_id AS uuid) ELSE gen_random_uuid() END, "
+                "1, :tenant_id, 'user' || n || '@' || :suffix, 'x', now() - n * interval '1 minute' "
+                "FROM generate_series(1, 2000) n"
+            ),
+            {**ids, "suffix": suffix}
+        )
+        conn.execute(text("INSERT INTO players (player_id) VALUES (:player_id)"), ids)
+        provider_id = conn.execute(
+            text("INSERT INTO game_providers (provider_name) VALUES (:name) RETURNING provider_id"),
+            {"name": f"Plan provider {suffix}"}
+        ).scalar_one()
+        category_id = conn.execute(
+            text("INSERT INTO game_categories (category_name) VALUES (:name) RETURNING category_id"),
+            {"name": f"Plan category {suffix}"}
+        ).scalar_one()
+        conn.execute(
+            text(
+                "INSERT INTO games (game_id, provider_id, category_id, game_name, game_code, min_bet, max_bet) "
+                "VALUES (:game_id, :provider, :category, 'Dice', :code, 1, 1000)"
+            ),
+            {**ids, "provider": provider_id, "category": category_id, "code": f"plan-dice-{suffix}"}
+        )
+        conn.execute(
+            text(
+                "INSERT INTO game_sessions (session_id, player_id, game_id, tenant_id, status, started_at) "
+                "SELECT CASE WHEN n = 1 THEN CAST(:session_id AS uuid) ELSE gen_random_uuid() END, "
+                ":player_id, :game_id, :tenant_id, CASE WHEN n = 1 THEN 'active' ELSE 'ended' END, "
+                "now() - n * interval '1 hour' "
+                "FROM generate_series(1, 1000) n"
+            ),
+            ids
+        )
+        conn.execute(
+            text(
+                "INSERT INTO wallets (wallet_id, player_id, tenant_id, currency_id, wallet_type_id, balance, is_active) "
+                "VALUES (:wallet_id, :player_id, :tenant_id, 1, 1, 1000, true)"
+            ),
+            ids
+        )
+        conn.execute(
+            text(
+                "INSERT INTO game_rounds (session_id, round_number, outcome, started_at) "
+                "SELECT :session_id, n, 'WIN', now() - n * interval '1 minute' "
+                "FROM generate_series(1, 5000) n"
+            ),
+            ids
+        )
+        conn.execute(
+            text(
+                "INSERT INTO bets (bet_id, round_id, wallet_id, tenant_id, player_id, game_id, session_id, "
+                "bet_currency_id, bet_amount, win_amount, bet_status, placed_at) "
+                "SELECT gen_random_uuid(), gen_random_uuid(), :wallet_id, :tenant_id, :player_id, :game_id, "
+                ":session_id, 1, 10, 0, 'settled', now() - n * interval '1 minute' "
+                "FROM generate_series(1, 5000) n"
+            ),
+            ids
+        )
+        conn.execute(
+            text(
+                "INSERT INTO wallet_transactions (transaction_id, wallet_id, transaction_type_id, amount, "
+                "balance_before, balance_after, reference_type, created_at) "
+                "SELECT gen_random_uuid(), :wallet_id, 3, -10, 1000, 990, 'DICE_BET', "
+                "now() - n * interval '1 minute' "
+                "FROM generate_series(1, 5000) n"
+            ),
+            ids
+        )
+        conn.execute(
+            text(
+                "INSERT INTO notifications (notification_id, user_id, title, message, type, created_at) "
+                "SELECT gen_random_uuid(), :player_id, 'Hi', 'Message', 'PROMO', now() - n * interval '1 minute' "
+                "FROM generate_series(1, 2000) n"
+            ),
+            ids
+        )
+        conn.execute(
+            text(
+                "INSERT INTO withdrawals (withdrawal_id, player_id, tenant_id, wallet_id, currency_id, amount, status, requested_at) "
+                "SELECT gen_random_uuid(), :player_id, :tenant_id, :wallet_id, 1, 10, "
+                "CASE WHEN n % 10 = 0 THEN 'requested' ELSE 'completed' END, now() - n * interval '1 hour' "
+                "FROM generate_series(1, 2000) n"
+            ),
+            ids
+        )
+
+        for table in SEEDED_TABLES:
+            conn.execute(text(f"ANALYZE {table}"))
+
+    return ids
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(engine, seeded, name):
+    with engine.begin() as conn:
+        conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+        # SET LOCAL is silently ignored outside a transaction block
+        seqscan = conn.execute(text("SELECT current_setting('enable_seqscan')")).scalar_one()
+        assert seqscan == "off", f"enable_seqscan is {seqscan}; the plan would not prove anything"
+
+        plan = conn.execute(
+            text(f"EXPLAIN (FORMAT JSON) {HOT_QUERIES[name]}"),
+            {k: v for k, v in seeded.items() if f":{k}" in HOT_QUERIES[name]}
+        ).scalar_one()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes = list(plan_nodes(plan[0]["Plan"]))
+    node_types = [n["Node Type"] for n in nodes]
+
+    assert "Seq Scan" not in node_types, f"{name}: {node_types}"
+    assert any(
+        n["Node Type"] in INDEX_SCANS and "Index Cond" in n
+        for n in nodes
+    ), f"{name}: no index condition in {node_types}"
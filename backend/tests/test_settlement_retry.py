@@ -0,0 +1,101 @@
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.services.games import settlement_service
+from app.services.games.settlement_service import settle_rounds
+from app.services.wallet_service import deposit_to_wallet
+
+
+# A settlement attempt that loses the guarded wallet UPDATE is retried from
+# a fresh read. The retry must settle the outcomes drawn for the request,
+# never roll new ones.
+
+
+def numbered_outcomes(calls: list):
+    def resolve_outcome(amount: Decimal):
+        calls.append(amount)
+        return {
+            "outcome": f"ROLL_{len(calls)}",
+            "win": False,
+            "win_amount": Decimal("0.00")
+        }
+
+    return resolve_outcome
+
+
+def test_retry_reuses_the_drawn_outcomes(engine, session_factory, player_world, monkeypatch):
+    real_write_rounds = settlement_service.write_rounds
+    attempts = []
+
+    def lose_first_race(*args, **kwargs):
+        attempts.append(kwargs["rounds"])
+        if len(attempts) == 1:
+            return None
+        return real_write_rounds(*args, **kwargs)
+
+    monkeypatch.setattr(settlement_service, "write_rounds", lose_first_race)
+
+    db = session_factory()
+    try:
+        deposit_to_wallet(db, player_world.player_id, 100.0)
+
+        calls = []
+        batch = settle_rounds(
+            db,
+            player_id=player_world.player_id,
+            tenant_id=player_world.tenant_id,
+            game_id=player_world.game_id,
+            amount=Decimal("5.00"),
+            rounds=3,
+            resolve_outcome=numbered_outcomes(calls),
+            reference_prefix="DICE"
+        )
+    finally:
+        db.close()
+
+    assert len(attempts) == 2
+    assert len(calls) == 3
+    assert [r["outcome"] for r in batch["rounds"]] == ["ROLL_1", "ROLL_2", "ROLL_3"]
+
+    with engine.connect() as conn:
+        stored = conn.execute(
+            text("SELECT outcome FROM game_rounds WHERE session_id = :s ORDER BY round_number"),
+            {"s": player_world.session_id}
+        ).scalars().all()
+
+    assert stored == ["ROLL_1", "ROLL_2", "ROLL_3"]
+
+
+@pytest.mark.parametrize("reference_prefix, detail", [
+    ("COIN_TOSS", "No active game session"),
+    ("DICE", "No active game session. Start session first."),
+    ("EVEN_ODD", "No active game session. Start session first.")
+])
+def test_no_session_keeps_each_game_error_text(engine, session_factory, player_world, reference_prefix, detail):
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE game_sessions SET status = 'ended' WHERE session_id = :s"),
+            {"s": player_world.session_id}
+        )
+
+    db = session_factory()
+    try:
+        with pytest.raises(HTTPException) as exc:
+            settle_rounds(
+                db,
+                player_id=player_world.player_id,
+                tenant_id=player_world.tenant_id,
+                game_id=player_world.game_id,
+                amount=Decimal("5.00"),
+                rounds=1,
+                resolve_outcome=numbered_outcomes([]),
+                reference_prefix=reference_prefix
+            )
+    finally:
+        db.close()
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == detail
@@ -0,0 +1,147 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.services.games.settlement_service import settle_rounds
+from app.services.wallet_service import deposit_to_wallet
+from app.services.withdrawal_service import withdraw_from_wallet
+
+
+# Many threads debit, settle and deposit against one CASH wallet at once.
+# Wallet balance changes are guarded single-statement UPDATEs with no
+# SELECT ... FOR UPDATE (wallet_ledger_service), and settlement retries when
+# the balance moves under a batch. Whatever interleaving happens, the wallet
+# must never go negative and must equal what its ledger rows say.
+
+WORKERS = 24
+OPERATIONS = 400
+OPENING_DEPOSIT = Decimal("500.00")
+
+# Expected refusals: insufficient balance, balance kept moving. The player
+# has no limits, so a 403/404 means the seeded world is broken and the
+# contended paths never ran.
+ACCEPTED_REFUSALS = {400, 409}
+
+
+def coin_flip(seed: int):
+    rng = random.Random(seed)
+
+    def resolve_outcome(amount: Decimal):
+        win = rng.random() < 0.45
+        return {
+            "outcome": "WIN" if win else "LOSE",
+            "win": win,
+            "win_amount": amount * 2 if win else Decimal("0.00")
+        }
+
+    return resolve_outcome
+
+
+def run_operation(session_factory, world, i: int):
+    db = session_factory()
+    try:
+        kind = i % 4
+        if kind == 0:
+            deposit_to_wallet(db, world.player_id, float(random.Random(i).randint(1, 40)))
+        elif kind == 1:
+            withdraw_from_wallet(db, world.player_id, world.tenant_id, float(random.Random(i).randint(5, 80)))
+        else:
+            settle_rounds(
+                db,
+                player_id=world.player_id,
+                tenant_id=world.tenant_id,
+                game_id=world.game_id,
+                amount=Decimal(random.Random(i).randint(1, 30)),
+                rounds=1 if kind == 2 else 5,
+                resolve_outcome=coin_flip(i),
+                reference_prefix="DICE"
+            )
+        return kind, "ok"
+    except HTTPException as e:
+        db.rollback()
+        assert e.status_code in ACCEPTED_REFUSALS, f"operation {i}: {e.status_code} {e.detail}"
+        return kind, e.status_code
+    finally:
+        db.close()
+
+
+def test_concurrent_wallet_moves_match_ledger(engine, session_factory, player_world):
+    db = session_factory()
+    try:
+        deposit_to_wallet(db, player_world.player_id, float(OPENING_DEPOSIT))
+    finally:
+        db.close()
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(
+            lambda i: run_operation(session_factory, player_world, i),
+            range(OPERATIONS)
+        ))
+
+    with engine.connect() as conn:
+        balance = conn.execute(
+            text("SELECT balance FROM wallets WHERE wallet_id = :w"),
+            {"w": player_world.wallet_id}
+        ).scalar_one()
+
+        ledger = conn.execute(
+            text(
+                "SELECT "
+                "  COALESCE(SUM(balance_after - balance_before), 0) AS moved, "
+                "  COALESCE(SUM(CASE WHEN reference_type = 'WITHDRAWAL' THEN -amount ELSE amount END), 0) AS signed, "
+                "  COALESCE(MIN(balance_after), 0) AS lowest, "
+                "  COUNT(*) FILTER (WHERE reference_type = 'WITHDRAWAL') AS withdrawals "
+                "FROM wallet_transactions WHERE wallet_id = :w"
+            ),
+            {"w": player_world.wallet_id}
+        ).one()
+
+        bets = conn.execute(
+            text("SELECT COUNT(*), COALESCE(SUM(bet_amount), 0) FROM bets WHERE wallet_id = :w"),
+            {"w": player_world.wallet_id}
+        ).one()
+
+        rounds = conn.execute(
+            text(
+                "SELECT COUNT(*), COUNT(DISTINCT round_number), COALESCE(MAX(round_number), 0) "
+                "FROM game_rounds WHERE session_id = :s"
+            ),
+            {"s": player_world.session_id}
+        ).one()
+
+        rounds_played = conn.execute(
+            text("SELECT rounds_played FROM game_sessions WHERE session_id = :s"),
+            {"s": player_world.session_id}
+        ).scalar_one()
+
+        wagered = conn.execute(
+            text(
+                "SELECT COALESCE(SUM(total_wagered), 0) FROM player_wager_totals "
+                "WHERE player_id = :p AND period_type = 'DAY'"
+            ),
+            {"p": player_world.player_id}
+        ).scalar_one()
+
+    # The wallet never went negative, at any point the ledger recorded
+    assert balance >= 0
+    assert ledger.lowest >= 0
+
+    # The balance is exactly what the ledger rows add up to
+    assert balance == ledger.moved
+    assert balance == ledger.signed
+
+    # Every accepted operation left its rows, and nothing else did
+    succeeded_withdrawals = sum(1 for kind, status in results if kind == 1 and status == "ok")
+    assert ledger.withdrawals == succeeded_withdrawals
+
+    # Round numbers were handed out once each, and bets match the wager ledger
+    assert rounds[0] == bets[0] == rounds_played
+    assert rounds[1] == rounds[0] == rounds[2]
+    assert wagered == bets[1]
+
+    # The run actually exercised the contended paths
+    assert any(kind >= 2 and status == "ok" for kind, status in results)
+    assert any(kind == 1 and status == "ok" for kind, status in results)